@@ -0,0 +1,238 @@
+"""A local stand-in for the edge-tts speech service.
+
+FakeEdgeTTSServer speaks enough of the edge-tts websocket protocol for
+edge_tts.Communicate (and so EdgeTTSBackend) to synthesize against it, with
+configurable handshake cost, latency, jitter, bandwidth, throttling and
+dropped connections.
+Tests and benchmarks use it to measure throughput, retries and concurrency
+repeatably and without network access:
+
+    with FakeEdgeTTSServer(latency=0.2, bandwidth=64 * 1024) as server:
+        audio = asyncio.run(EdgeTTSBackend().synthesize("Hello"))
+        print(server.requests, server.peak_connections)
+
+While the server is running as a context manager, edge-tts connects to it
+instead of Microsoft's service.
+"""
+
+import asyncio
+import html
+import json
+import random
+import re
+from unittest.mock import patch
+
+from aiohttp import web
+
+from textwave import EventLoopThread
+
+PATH = "/consumer/speech/synthesize/readaloud/edge/v1"
+
+# A silent MPEG-2 Layer III frame: 24 kHz mono at 48 kbit/s, the format the
+# real service sends, 144 bytes long and 24 ms of audio
+MP3_FRAME = b"\xff\xf3\x64\xc4" + bytes(140)
+FRAMES_PER_MESSAGE = 8
+
+# Speech runs at about 15 characters a second, which at 48 kbit/s is about
+# 400 bytes of audio per character
+AUDIO_BYTES_PER_CHAR = 400
+
+SSML_TEXT_PATTERN = re.compile(r"<prosody[^>]*>(.*)</prosody>", re.DOTALL)
+REQUEST_ID_PATTERN = re.compile(r"X-RequestId:(\w+)")
+
+
+def text_message(request_id, path, body):
+    return (
+        f"X-RequestId:{request_id}\r\n"
+        "Content-Type:application/json; charset=utf-8\r\n"
+        f"Path:{path}\r\n\r\n{json.dumps(body)}"
+    )
+
+
+def audio_message(request_id, data=b""):
+    """A binary audio message: a 2-byte header length, the headers and the
+    MP3 data. The final message of a turn has no Content-Type and no data."""
+    content_type = "Content-Type:audio/mpeg\r\n" if data else ""
+    headers = f"X-RequestId:{request_id}\r\n{content_type}Path:audio\r\n".encode()
+    return len(headers).to_bytes(2, "big") + headers + data
+
+
+class FakeEdgeTTSServer:
+    """Simulated edge-tts service.
+
+    Opening a connection takes `handshake_latency` seconds, standing in for
+    the TLS handshake and authorization of the real service, and a
+    connection serves any number of requests in turn. Every request waits
+    `latency` seconds (give or take up to `jitter`) before its audio
+    starts, then streams `bytes_per_char` bytes of silent MP3 per character
+    of text at up to `bandwidth` bytes a second (None for as fast as
+    possible). A `throttle_rate` fraction of connections, and any
+    connection beyond `max_connections` at once, are turned away with HTTP
+    429; a `disconnect_rate` fraction of streams are cut off halfway through
+    their audio, and connections left idle for `idle_timeout` seconds (None
+    for never) are dropped. Random choices come from `seed`, so a run can be
+    repeated exactly.
+
+    Settings can be changed while the server runs. The counters record what
+    happened: `connects` (accepted connections), `requests` (synthesis
+    requests), `throttled`, `disconnects`, `peak_connections` and `texts`,
+    the text of each request.
+    """
+
+    def __init__(
+        self,
+        handshake_latency=0.0,
+        latency=0.0,
+        jitter=0.0,
+        bandwidth=None,
+        throttle_rate=0.0,
+        max_connections=None,
+        disconnect_rate=0.0,
+        idle_timeout=None,
+        bytes_per_char=AUDIO_BYTES_PER_CHAR,
+        seed=0,
+    ):
+        self.handshake_latency = handshake_latency
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.throttle_rate = throttle_rate
+        self.max_connections = max_connections
+        self.disconnect_rate = disconnect_rate
+        self.idle_timeout = idle_timeout
+        self.bytes_per_char = bytes_per_char
+        self.random = random.Random(seed)
+
+        self.connects = 0
+        self.requests = 0
+        self.throttled = 0
+        self.disconnects = 0
+        self.connections = 0
+        self.peak_connections = 0
+        self.texts = []
+
+        self.url = None
+        self.loop = None
+        self.runner = None
+        self.patcher = None
+
+    def audio_for(self, text):
+        frames = max(1, len(text) * self.bytes_per_char // len(MP3_FRAME))
+        return MP3_FRAME * frames
+
+    def chance(self, rate):
+        # Only draw when needed, so one setting doesn't shift another's draws
+        return rate > 0 and self.random.random() < rate
+
+    def delay(self):
+        if not self.jitter:
+            return self.latency
+        return max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+
+    async def handle(self, request):
+        if self.chance(self.throttle_rate) or (
+            self.max_connections is not None
+            and self.connections >= self.max_connections
+        ):
+            self.throttled += 1
+            return web.Response(status=429, text="Too many requests")
+
+        self.connects += 1
+        self.connections += 1
+        self.peak_connections = max(self.peak_connections, self.connections)
+        ws = web.WebSocketResponse()
+        try:
+            await asyncio.sleep(self.handshake_latency)
+            await ws.prepare(request)
+            while True:
+                try:
+                    message = await ws.receive(timeout=self.idle_timeout)
+                except asyncio.TimeoutError:
+                    # Drop the idle connection without a closing handshake
+                    request.transport.close()
+                    break
+                if message.type != web.WSMsgType.TEXT:
+                    break
+                if "Path:ssml" in message.data and not await self.speak(
+                    request, ws, message.data
+                ):
+                    break
+        except ConnectionResetError:
+            # The client went away (e.g. its conversion was cancelled)
+            pass
+        finally:
+            self.connections -= 1
+        return ws
+
+    async def speak(self, request, ws, message):
+        """Answer one ssml message; False if the connection was dropped."""
+        request_id = REQUEST_ID_PATTERN.search(message).group(1)
+        match = SSML_TEXT_PATTERN.search(message)
+        text = html.unescape(match.group(1)) if match else ""
+        self.requests += 1
+        self.texts.append(text)
+        disconnect = self.chance(self.disconnect_rate)
+
+        await asyncio.sleep(self.delay())
+        await ws.send_str(text_message(request_id, "turn.start", {}))
+        await ws.send_str(
+            text_message(
+                request_id,
+                "audio.metadata",
+                {
+                    "Metadata": [
+                        {
+                            "Type": "SentenceBoundary",
+                            "Data": {
+                                "Offset": 0,
+                                "Duration": len(text) * 10**6 // 15,
+                                "text": {"Text": text},
+                            },
+                        }
+                    ]
+                },
+            )
+        )
+
+        audio = self.audio_for(text)
+        size = len(MP3_FRAME) * FRAMES_PER_MESSAGE
+        for offset in range(0, len(audio), size):
+            if disconnect and offset >= len(audio) // 2:
+                # Drop the connection without a closing handshake
+                self.disconnects += 1
+                request.transport.close()
+                return False
+            data = audio[offset : offset + size]
+            await ws.send_bytes(audio_message(request_id, data))
+            if self.bandwidth:
+                await asyncio.sleep(len(data) / self.bandwidth)
+
+        await ws.send_bytes(audio_message(request_id))
+        await ws.send_str(text_message(request_id, "turn.end", {}))
+        return True
+
+    async def start(self, host="127.0.0.1", port=0):
+        """Start serving on the running event loop."""
+        app = web.Application()
+        app.router.add_get(PATH, self.handle)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, host, port).start()
+        host, port = self.runner.addresses[0][:2]
+        self.url = f"ws://{host}:{port}{PATH}?TrustedClientToken=fake"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    def __enter__(self):
+        """Serve from a thread of its own and point edge-tts at the server."""
+        self.loop = EventLoopThread(name="fake-edge-tts")
+        self.loop.run(self.start())
+        self.patcher = patch("edge_tts.communicate.WSS_URL", self.url)
+        self.patcher.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.patcher.stop()
+        self.loop.run(self.stop())
+        self.loop.stop()
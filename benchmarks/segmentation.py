@@ -0,0 +1,80 @@
+"""Benchmark text segmentation on large synthetic documents.
+
+Usage:
+    python benchmarks/segmentation.py [--sizes 1 2 4 8] [--max-chars 3000]
+
+Prints the throughput for each document size and the time to the first
+chunk. Segmentation is linear, so throughput should stay roughly flat as
+the documents grow.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from textwave.segmentation import CHUNK_MAX_CHARS, iter_text_chunks
+
+SENTENCES = [
+    "Dr. Watson arrived at 221B Baker St. shortly after nine.",
+    "The sample weighed 3.75 kg, i.e. rather more than expected.",
+    "J. R. R. Tolkien taught at Oxford for many years.",
+    "See Fig. 4 for the results of the second trial.",
+    "Was it worth it?",
+    '"Absolutely," she said.',
+    "Costs rose by approx. 12 percent across the U.S. in that decade.",
+]
+
+
+def synthetic_text(size, seed=0):
+    """About `size` characters of prose with abbreviations, decimals,
+    initials and paragraph breaks."""
+    rng = random.Random(seed)
+    parts = []
+    length = 0
+    while length < size:
+        paragraph = " ".join(rng.choices(SENTENCES, k=rng.randint(3, 12)))
+        parts.append(paragraph)
+        length += len(paragraph) + 2
+    # A few paragraphs without any punctuation, like text pulled from tables
+    parts.append("word " * 5000)
+    return "\n\n".join(parts)
+
+
+def measure(text, max_chars):
+    start = time.perf_counter()
+    chunks = iter_text_chunks(text, max_chars)
+    next(chunks)
+    first_chunk = time.perf_counter() - start
+    count = 1 + sum(1 for _ in chunks)
+    return time.perf_counter() - start, first_chunk, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=float,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="Document sizes in MB (default: 1 2 4 8)",
+    )
+    parser.add_argument("--max-chars", type=int, default=CHUNK_MAX_CHARS)
+    args = parser.parse_args()
+
+    print(f"{'size':>8} {'chunks':>8} {'total':>9} {'first':>9} {'MB/s':>7}")
+    for size in args.sizes:
+        text = synthetic_text(int(size * 1024 * 1024))
+        elapsed, first_chunk, count = measure(text, args.max_chars)
+        mb = len(text) / (1024 * 1024)
+        print(
+            f"{mb:>6.1f}MB {count:>8} {elapsed:>8.3f}s "
+            f"{first_chunk * 1000:>7.2f}ms {mb / elapsed:>7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
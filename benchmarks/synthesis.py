@@ -0,0 +1,138 @@
+"""Benchmark concurrent synthesis against a local fake edge-tts service.
+
+Usage:
+    python benchmarks/synthesis.py [--concurrency 1 2 4 8] [--chunks 32]
+        [--pool] [--adaptive] [--handshake-latency 0.15] [--latency 0.3] [--jitter 0.1]
+        [--bandwidth 1048576]
+        [--throttle-rate 0] [--max-connections N] [--disconnect-rate 0]
+
+Synthesizes the same chunks at each concurrency level with the real
+edge-tts client and prints chunks per second, retries, connections opened
+and the most the service saw at once. With --pool, chunks reuse connections
+from a ConnectionPool instead of opening one each; with --adaptive, an
+AdaptiveConcurrency controller tunes the sessions up to each level and logs
+its decisions to stderr. Runs are seeded, so results repeat.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.fake_edge_tts import FakeEdgeTTSServer
+from textwave import (
+    AdaptiveConcurrency,
+    ConnectionPool,
+    EdgeTTSBackend,
+    RetryPolicy,
+)
+from textwave.synthesis import synthesize_in_order
+
+
+async def synthesize(chunks, concurrency, retry_policy, pool, adaptive):
+    backend = EdgeTTSBackend(pool=pool)
+    limiter = AdaptiveConcurrency(maximum=concurrency) if adaptive else None
+    total_bytes = 0
+    try:
+        async for _, audio in synthesize_in_order(
+            chunks,
+            concurrency,
+            retry_policy=retry_policy,
+            limiter=limiter,
+            backend=backend,
+        ):
+            total_bytes += len(audio)
+    finally:
+        if pool is not None:
+            await pool.close()
+    return total_bytes
+
+
+def measure(args, concurrency):
+    chunks = [
+        f"Chunk {i}. " + "word " * (args.chunk_chars // 5) for i in range(args.chunks)
+    ]
+    # Keep retrying throttled sessions, briefly, so every run completes
+    retry_policy = RetryPolicy(
+        max_attempts=50, base_delay=0.05, max_delay=1.0, budget=50 * args.chunks
+    )
+    pool = ConnectionPool(size=concurrency) if args.pool else None
+    with FakeEdgeTTSServer(
+        handshake_latency=args.handshake_latency,
+        latency=args.latency,
+        jitter=args.jitter,
+        bandwidth=args.bandwidth,
+        throttle_rate=args.throttle_rate,
+        max_connections=args.max_connections,
+        disconnect_rate=args.disconnect_rate,
+    ) as server:
+        start = time.perf_counter()
+        total_bytes = asyncio.run(
+            synthesize(chunks, concurrency, retry_policy, pool, args.adaptive)
+        )
+        elapsed = time.perf_counter() - start
+    return elapsed, total_bytes, retry_policy.retries, server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="Concurrency levels to compare (default: 1 2 4 8)",
+    )
+    parser.add_argument("--chunks", type=int, default=32)
+    parser.add_argument("--chunk-chars", type=int, default=1000)
+    parser.add_argument(
+        "--pool", action="store_true", help="Reuse connections across chunks"
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Adapt the sessions to throttling and latency, up to each level",
+    )
+    parser.add_argument(
+        "--handshake-latency",
+        type=float,
+        default=0.15,
+        help="Seconds to open a connection",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.3, help="Seconds to first audio"
+    )
+    parser.add_argument("--jitter", type=float, default=0.1)
+    parser.add_argument(
+        "--bandwidth",
+        type=int,
+        default=1024 * 1024,
+        help="Audio bytes per second per connection (0 for unlimited)",
+    )
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--max-connections", type=int)
+    parser.add_argument("--disconnect-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    if args.adaptive:
+        logging.basicConfig(level=logging.INFO, format="  %(message)s")
+
+    print(
+        f"{'sessions':>8} {'total':>9} {'chunks/s':>9} {'MB/s':>7} "
+        f"{'retries':>8} {'429s':>6} {'drops':>6} {'conns':>6} {'peak':>5}"
+    )
+    for concurrency in args.concurrency:
+        elapsed, total_bytes, retries, server = measure(args, concurrency)
+        print(
+            f"{concurrency:>8} {elapsed:>8.2f}s {args.chunks / elapsed:>9.2f} "
+            f"{total_bytes / elapsed / (1024 * 1024):>7.2f} {retries:>8} "
+            f"{server.throttled:>6} {server.disconnects:>6} "
+            f"{server.connects:>6} {server.peak_connections:>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,33 @@
-import asyncio
+import importlib
+import importlib.util
 import json
-import re
+import multiprocessing
 import subprocess
 import sys
-import urllib.request
-import webbrowser
+import threading
+import time
 from pathlib import Path
 
+# Start of launch, for --measure-startup
+LAUNCH_STARTED = time.perf_counter()
+
 __version__ = "0.6.2"
 
+# Upper bound for the "Parallel conversions" setting of the job queue
+MAX_PARALLEL_JOBS = 8
+
+# The status log keeps only the most recent lines
+STATUS_LOG_MAX_LINES = 500
+
+# Speech engines offered in the window, as (label, engine name)
+SPEECH_ENGINES = [
+    ("Online neural voice (edge-tts)", "edge-tts"),
+    ("Offline voice (espeak-ng)", "espeak"),
+]
+
+# Update checks wait until the window has been up for a moment
+UPDATE_CHECK_DELAY_MS = 2000
+
 
 def get_resource_path(filename):
     """Get the path to a resource file, works in both dev and bundled app."""
@@ -34,9 +53,15 @@ def get_resource_path(filename):
 
 # Auto-install dependencies if missing
 try:
-    import edge_tts
-    from pypdf import PdfReader
-    from PyQt6.QtCore import QEvent, QSettings, Qt, QThread, pyqtSignal
+    from PyQt6.QtCore import (
+        QEvent,
+        QObject,
+        QSettings,
+        Qt,
+        QThread,
+        QTimer,
+        pyqtSignal,
+    )
     from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QPixmap
 
     try:
@@ -46,18 +71,42 @@ try:
     except ImportError:
         SVG_AVAILABLE = False
     from PyQt6.QtWidgets import (
+        QAbstractItemView,
         QApplication,
+        QComboBox,
         QFileDialog,
         QHBoxLayout,
+        QHeaderView,
         QLabel,
         QMainWindow,
         QMessageBox,
         QProgressBar,
         QPushButton,
+        QSpinBox,
+        QTableWidget,
+        QTableWidgetItem,
         QTextEdit,
         QVBoxLayout,
         QWidget,
     )
+
+    import textwave
+    from textwave.cancellation import CancellationToken, ConversionCancelled
+    from textwave.eventloop import shared_event_loop
+    from textwave.jobs import (
+        DEFAULT_MAX_RUNNING,
+        Job,
+        JobQueue,
+        count_pages,
+        expand_inputs,
+    )
+    from textwave.progress import ProgressThrottle
+
+    # The engine's dependencies are imported on first use, but make sure they
+    # are installed before the window opens
+    for module in ("edge_tts", "pypdf"):
+        if importlib.util.find_spec(module) is None:
+            raise ImportError(f"No module named '{module}'")
 except ImportError as e:
     missing = str(e).split("'")[1] if "'" in str(e) else "dependencies"
     print("Installing required dependencies...")
@@ -66,113 +115,78 @@ except ImportError as e:
     print("Dependencies installed. Please run the script again.\n")
     sys.exit(0)
 
-# Microsoft Azure Neural Voice (Free via edge-tts)
-VOICE = "en-US-AvaMultilingualNeural"
-
 
-def extract_and_clean_text(pdf_path):
-    reader = PdfReader(pdf_path)
-    total_pages = len(reader.pages)
-    full_text = ""
+def warm_up_engine():
+    """Import the conversion engine and its dependencies (edge-tts, pypdf,
+    aiohttp) ahead of the first conversion."""
+    importlib.import_module("textwave.pipeline")
 
-    page_number_pattern = re.compile(r"^\s*(page\s*)?\d+\s*$", re.IGNORECASE)
 
-    for idx, page in enumerate(reader.pages, 1):
-        text = page.extract_text()
-        if text:
-            lines = text.split("\n")
-            cleaned_lines = []
-            for line in lines:
-                if page_number_pattern.match(line):
-                    continue
-                cleaned_lines.append(line)
+class SettingsCache:
+    """Keep update check responses in the app's QSettings."""
 
-            page_text = " ".join(cleaned_lines)
-            full_text += page_text + " "
+    def get(self, key):
+        return QSettings("TextWave", "PDF2MP3").value(key, None)
 
-    return full_text, total_pages
+    def set(self, key, value):
+        QSettings("TextWave", "PDF2MP3").setValue(key, value)
 
 
-async def text_to_speech_async(text, output_file, progress_callback):
-    char_count = len(text)
-    estimated_mb = char_count / 2870
+class UpdateCheck(QObject):
+    """Check for edge-tts and app updates as one task on the shared event
+    loop, reporting each result through a signal."""
 
-    try:
-        communicate = edge_tts.Communicate(text, VOICE)
-        total_bytes = 0
-
-        with open(output_file, "wb") as f:
-            async for chunk in communicate.stream():
-                if chunk["type"] == "audio":
-                    f.write(chunk["data"])
-                    total_bytes += len(chunk["data"])
-                    mb = total_bytes / (1024 * 1024)
-                    percentage = min((mb / estimated_mb) * 100, 99.9)
-                    progress_callback(
-                        int(percentage), f"{mb:.2f} MB / ~{estimated_mb:.1f} MB"
-                    )
+    edge_tts_checked = pyqtSignal(
+        bool, str, str
+    )  # has_update, installed_version, latest_version
+    app_checked = pyqtSignal(
+        bool, str, str, str
+    )  # has_update, current_version, latest_version, download_url
 
-        final_mb = total_bytes / (1024 * 1024)
-        progress_callback(100, f"Complete! {final_mb:.2f} MB")
-    except Exception as e:
-        error_msg = str(e)
-        if "401" in error_msg or "Unauthorized" in error_msg or "403" in error_msg:
-            raise Exception(
-                "Edge TTS service connection failed.\n\n"
-                "Possible solutions:\n"
-                "1. Update edge-tts: Run 'pip3 install --upgrade edge-tts' in Terminal\n"
-                "2. Check your internet connection\n"
-                "3. Try again in a few minutes (temporary API issue)\n"
-                "4. Restart the app\n\n"
-                f"Technical details: {error_msg}"
-            )
-        else:
-            raise
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.future = None
 
+    def start(self):
+        self.future = shared_event_loop().submit(self.run())
 
-class VersionCheckThread(QThread):
-    finished = pyqtSignal(
-        bool, str, str
-    )  # has_update, installed_version, latest_version
+    def cancel(self):
+        if self.future:
+            self.future.cancel()
 
-    def run(self):
+    async def run(self):
+        checker = textwave.UpdateChecker(__version__, SettingsCache())
+        edge_tts, app = await checker.check()
         try:
-            # Get installed version
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "show", "edge-tts"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
+            self.edge_tts_checked.emit(*edge_tts)
+            self.app_checked.emit(*app)
+        except RuntimeError:
+            pass  # The window was closed while checking
 
-            if result.returncode != 0:
-                self.finished.emit(False, "", "")
-                return
 
-            installed_version = None
-            for line in result.stdout.split("\n"):
-                if line.startswith("Version:"):
-                    installed_version = line.split(":", 1)[1].strip()
-                    break
+class PageCount(QObject):
+    """Count the pages of queued PDFs on the shared event loop, so reading
+    large PDFs doesn't hold up the window, reporting each through a signal."""
 
-            if not installed_version:
-                self.finished.emit(False, "", "")
-                return
+    counted = pyqtSignal(object, int)  # job, pages
 
-            # Get latest version from PyPI
-            with urllib.request.urlopen(
-                "https://pypi.org/pypi/edge-tts/json", timeout=5
-            ) as response:
-                data = json.loads(response.read().decode())
-                latest_version = data["info"]["version"]
+    def __init__(self, jobs, parent=None):
+        super().__init__(parent)
+        self.jobs = jobs
+        self.future = None
 
-            # Compare versions
-            has_update = installed_version != latest_version
-            self.finished.emit(has_update, installed_version, latest_version)
+    def start(self):
+        self.future = shared_event_loop().submit(count_pages(self.jobs, self.report))
 
-        except Exception:
-            # Silently fail - don't interrupt the app for version check issues
-            self.finished.emit(False, "", "")
+    def cancel(self):
+        if self.future:
+            self.future.cancel()
+
+    def report(self, job, pages):
+        try:
+            self.counted.emit(job, pages)
+        except RuntimeError:
+            pass  # The window was closed while counting
 
 
 class UpdateThread(QThread):
@@ -201,49 +215,14 @@ class UpdateThread(QThread):
             self.finished.emit(False, f"Update error: {str(e)}")
 
 
-class AppUpdateCheckThread(QThread):
-    finished = pyqtSignal(
-        bool, str, str, str
-    )  # has_update, current_version, latest_version, download_url
-
-    def run(self):
-        try:
-            # Get current version
-            current_version = __version__
-
-            # Query GitHub API for latest release
-            with urllib.request.urlopen(
-                "https://api.github.com/repos/kc9wwh/TextWave/releases/latest",
-                timeout=5,
-            ) as response:
-                data = json.loads(response.read().decode())
-
-                latest_version = data["tag_name"].lstrip("v")
-
-                # Find .dmg or .app.zip asset
-                download_url = None
-                for asset in data.get("assets", []):
-                    name = asset["name"].lower()
-                    if name.endswith(".dmg") or name.endswith(".app.zip"):
-                        download_url = asset["browser_download_url"]
-                        break
-
-                # If no asset found, use release page URL
-                if not download_url:
-                    download_url = data["html_url"]
-
-                # Compare versions (simple string comparison)
-                has_update = (
-                    current_version != latest_version
-                    and latest_version > current_version
-                )
-                self.finished.emit(
-                    has_update, current_version, latest_version, download_url
-                )
-
-        except Exception:
-            # Silently fail - don't interrupt the app for update check issues
-            self.finished.emit(False, "", "", "")
+def can_resume(output_path, pdf_path, engine=None):
+    """Whether an interrupted conversion of pdf_path to output_path can be
+    resumed with the given speech engine."""
+    manifest = textwave.JobManifest.load(output_path)
+    if not manifest:
+        return False
+    backend = textwave.create_backend(engine)
+    return manifest.matches(pdf_path, backend.voice_id(), backend.params)
 
 
 class ConversionThread(QThread):
@@ -251,10 +230,24 @@ class ConversionThread(QThread):
     status = pyqtSignal(str)
     finished = pyqtSignal(bool, str)
 
-    def __init__(self, pdf_path, output_path):
+    def __init__(
+        self,
+        pdf_path,
+        output_path,
+        resume=False,
+        engine=None,
+        converter=None,
+        pool=None,
+    ):
         super().__init__()
         self.pdf_path = pdf_path
         self.output_path = output_path
+        self.resume = resume
+        self.engine = engine
+        # Shared with the window's other conversions (see shared_converter)
+        self.converter = converter
+        self.pool = pool
+        self.cancel_token = CancellationToken()
         self.caffeinate_process = None
 
     def run(self):
@@ -266,28 +259,60 @@ class ConversionThread(QThread):
                 stderr=subprocess.DEVNULL,
             )
 
-            # Extract text
-            self.status.emit("Extracting text from PDF...")
-            text, total_pages = extract_and_clean_text(self.pdf_path)
-            self.status.emit(
-                f"Extracted {len(text):,} characters from {total_pages} pages"
-            )
-
-            # Convert to speech
-            self.status.emit("Converting to speech...")
+            # Extract and convert to speech as a streaming pipeline
+            self.status.emit("Extracting text and converting to speech...")
 
-            def progress_callback(percent, msg):
-                self.progress.emit(percent, msg)
+            # Coalesce per-chunk progress into a few signals per second
+            progress_callback = ProgressThrottle(self.progress.emit)
 
-            asyncio.run(text_to_speech_async(text, self.output_path, progress_callback))
+            converter = self.converter or textwave.Converter(
+                workers=textwave.EXTRACTION_WORKERS,
+                cache=textwave.SynthesisCache(),
+            )
+            try:
+                # Run on the app-wide event loop shared with other conversions
+                shared_event_loop().run(
+                    converter.convert_async(
+                        self.pdf_path,
+                        self.output_path,
+                        progress_callback,
+                        self.status.emit,
+                        resume=self.resume,
+                        cancel_token=self.cancel_token,
+                        backend=self.create_backend(),
+                    )
+                )
+            finally:
+                progress_callback.flush()
 
             self.finished.emit(True, f"Successfully saved to:\n{self.output_path}")
+        except ConversionCancelled:
+            self.finished.emit(False, "Conversion cancelled")
         except Exception as e:
             self.finished.emit(False, f"Error: {str(e)}")
         finally:
             # Always stop caffeinate when conversion completes or fails
             self.stop_caffeinate()
 
+    def create_backend(self):
+        """The speech engine to convert with; edge-tts reuses the open
+        connections of the pool, if there is one."""
+        backend = textwave.create_backend(self.engine)
+        if self.pool is not None and isinstance(backend, textwave.EdgeTTSBackend):
+            backend.pool = self.pool
+        return backend
+
+    @property
+    def stopped(self):
+        """Qt's own QThread.finished signal (hidden by `finished` above),
+        emitted once run() has returned. The thread object must be kept
+        until then, or Qt aborts the process."""
+        return QThread.finished.__get__(self, ConversionThread)
+
+    def cancel(self):
+        """Stop the conversion; safe to call from the GUI thread."""
+        self.cancel_token.cancel()
+
     def stop_caffeinate(self):
         """Stop the caffeinate process to allow macOS to sleep again."""
         if self.caffeinate_process:
@@ -307,6 +332,10 @@ class PDF2MP3App(QMainWindow):
         super().__init__()
         self.settings = QSettings("TextWave", "PDF2MP3")
         self.pdf_path = None
+        self.output_path = None
+        # The single-file conversion; shadows QObject.thread(), which would
+        # otherwise trip up closeEvent before any conversion has started
+        self.thread = None
         self.update_banner = None
         self.update_dismissed = False
         self.installed_version = ""
@@ -503,6 +532,18 @@ class PDF2MP3App(QMainWindow):
         self.select_btn.setStyleSheet("QPushButton { padding: 10px; font-size: 14px; }")
         layout.addWidget(self.select_btn)
 
+        # Speech engine used for new conversions
+        engine_row = QHBoxLayout()
+        engine_row.addWidget(QLabel("Voice:"))
+        self.engine_combo = QComboBox()
+        for label, engine in SPEECH_ENGINES:
+            self.engine_combo.addItem(label, engine)
+        index = self.engine_combo.findData(self.settings.value("engine", "edge-tts"))
+        self.engine_combo.setCurrentIndex(max(index, 0))
+        self.engine_combo.currentIndexChanged.connect(self.set_engine)
+        engine_row.addWidget(self.engine_combo, 1)
+        layout.addLayout(engine_row)
+
         # Convert button
         self.convert_btn = QPushButton("Convert to MP3")
         self.convert_btn.clicked.connect(self.convert)
@@ -525,6 +566,20 @@ class PDF2MP3App(QMainWindow):
         """)
         layout.addWidget(self.convert_btn)
 
+        # Resume button (shown when an interrupted conversion can be resumed)
+        self.resume_btn = QPushButton("Resume Conversion")
+        self.resume_btn.clicked.connect(self.resume_conversion)
+        self.resume_btn.setStyleSheet("QPushButton { padding: 10px; font-size: 14px; }")
+        self.resume_btn.setVisible(False)
+        layout.addWidget(self.resume_btn)
+
+        # Cancel button (shown while a conversion is running)
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.clicked.connect(self.cancel_conversion)
+        self.cancel_btn.setStyleSheet("QPushButton { padding: 10px; font-size: 14px; }")
+        self.cancel_btn.setVisible(False)
+        layout.addWidget(self.cancel_btn)
+
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
@@ -534,22 +589,84 @@ class PDF2MP3App(QMainWindow):
         self.status_text = QTextEdit()
         self.status_text.setReadOnly(True)
         self.status_text.setMaximumHeight(100)
+        self.status_text.document().setMaximumBlockCount(STATUS_LOG_MAX_LINES)
         self.status_text.setVisible(False)
         layout.addWidget(self.status_text)
 
-        # Start version check in background
-        self.version_check_thread = VersionCheckThread()
-        self.version_check_thread.finished.connect(self.version_check_complete)
-        self.version_check_thread.start()
+        # Job queue (shown when several PDFs are queued at once)
+        self.job_queue = JobQueue(
+            int(self.settings.value("max_running_jobs", DEFAULT_MAX_RUNNING))
+        )
+        self.job_threads = {}
+        self.converter = None
+        self.connection_pool = None
+        self.page_counts = []
+        self.queue_widget = QWidget()
+        queue_layout = QVBoxLayout()
+        queue_layout.setContentsMargins(0, 0, 0, 0)
+        self.queue_widget.setLayout(queue_layout)
+
+        queue_header = QHBoxLayout()
+        queue_header.addWidget(QLabel("Parallel conversions:"))
+        self.max_running_spin = QSpinBox()
+        self.max_running_spin.setRange(1, MAX_PARALLEL_JOBS)
+        self.max_running_spin.setValue(self.job_queue.max_running)
+        self.max_running_spin.valueChanged.connect(self.set_max_running_jobs)
+        queue_header.addWidget(self.max_running_spin)
+        queue_header.addStretch()
+        self.cancel_jobs_btn = QPushButton("Cancel Selected")
+        self.cancel_jobs_btn.setToolTip(
+            "Stop the selected conversions and take queued ones off the queue"
+        )
+        self.cancel_jobs_btn.clicked.connect(self.cancel_selected_jobs)
+        queue_header.addWidget(self.cancel_jobs_btn)
+        self.clear_jobs_btn = QPushButton("Clear Finished")
+        self.clear_jobs_btn.clicked.connect(self.clear_finished_jobs)
+        queue_header.addWidget(self.clear_jobs_btn)
+        queue_layout.addLayout(queue_header)
+
+        self.queue_table = QTableWidget(0, 3)
+        self.queue_table.setHorizontalHeaderLabels(["PDF", "Pages", "Progress"])
+        self.queue_table.horizontalHeader().setSectionResizeMode(
+            0, QHeaderView.ResizeMode.Stretch
+        )
+        self.queue_table.verticalHeader().setVisible(False)
+        self.queue_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.queue_table.setSelectionBehavior(
+            QAbstractItemView.SelectionBehavior.SelectRows
+        )
+        queue_layout.addWidget(self.queue_table)
+        self.queue_widget.setVisible(False)
+        layout.addWidget(self.queue_widget)
+
+        # Pick up jobs left unfinished when the app last quit
+        self.restore_job_queue()
+
+        # Check for updates once the window is up and idle
+        self.update_check = None
+        self.update_check_timer = QTimer(self)
+        self.update_check_timer.setSingleShot(True)
+        self.update_check_timer.timeout.connect(self.start_update_checks)
+        self.update_check_timer.start(UPDATE_CHECK_DELAY_MS)
 
-        # Start app update check in background
-        self.app_update_check_thread = AppUpdateCheckThread()
-        self.app_update_check_thread.finished.connect(self.app_update_check_complete)
-        self.app_update_check_thread.start()
+        # Load the conversion engine in the background after the window shows
+        QTimer.singleShot(0, self.start_engine_warm_up)
 
         # Apply initial theme
         self.apply_theme()
 
+    def start_update_checks(self):
+        # Check edge-tts and app versions in the background
+        self.update_check = UpdateCheck(self)
+        self.update_check.edge_tts_checked.connect(self.version_check_complete)
+        self.update_check.app_checked.connect(self.app_update_check_complete)
+        self.update_check.start()
+
+    def start_engine_warm_up(self):
+        threading.Thread(
+            target=warm_up_engine, name="textwave-warm-up", daemon=True
+        ).start()
+
     def create_update_banner(self):
         """Create the update notification banner widget."""
         colors = self.get_theme_colors()
@@ -789,6 +906,8 @@ class PDF2MP3App(QMainWindow):
     def open_app_download(self):
         """Open the app download URL in the default browser."""
         if self.app_download_url:
+            import webbrowser
+
             webbrowser.open(self.app_download_url)
 
     def app_update_check_complete(
@@ -824,8 +943,9 @@ class PDF2MP3App(QMainWindow):
 
     def drop_event(self, event: QDropEvent):
         files = [u.toLocalFile() for u in event.mimeData().urls()]
-        if files and files[0].lower().endswith(".pdf"):
-            self.set_pdf(files[0])
+        # Dropped folders contribute every PDF inside them
+        paths, _ = expand_inputs(files)
+        self.open_pdfs([path for path in paths if path.lower().endswith(".pdf")])
 
     def select_pdf(self):
         # Get last input directory or default to Downloads
@@ -833,19 +953,229 @@ class PDF2MP3App(QMainWindow):
             "last_input_dir", str(Path.home() / "Downloads")
         )
 
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select PDF File", default_dir, "PDF Files (*.pdf)"
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self, "Select PDF Files", default_dir, "PDF Files (*.pdf)"
         )
-        if file_path:
+        if file_paths:
             # Save the directory for next time
-            self.settings.setValue("last_input_dir", str(Path(file_path).parent))
-            self.set_pdf(file_path)
+            self.settings.setValue("last_input_dir", str(Path(file_paths[0]).parent))
+            self.open_pdfs(file_paths)
+
+    def open_pdfs(self, paths):
+        """Select a single PDF, or queue several for batch conversion."""
+        if len(paths) == 1:
+            self.set_pdf(paths[0])
+        elif paths:
+            self.queue_pdfs(paths)
+
+    def queue_pdfs(self, paths):
+        """Ask for an output folder and add a job for each PDF."""
+        default_dir = self.settings.value("last_output_dir", None) or str(
+            Path(paths[0]).parent
+        )
+        output_dir = QFileDialog.getExistingDirectory(
+            self, "Save MP3 Files To", default_dir
+        )
+        if not output_dir:
+            return
+
+        self.settings.setValue("last_output_dir", output_dir)
+
+        # Don't let two unfinished jobs write to the same MP3
+        outputs = {
+            job.output_path
+            for job in self.job_queue.jobs
+            if job.state in (Job.QUEUED, Job.RUNNING)
+        }
+        jobs = []
+        for path in paths:
+            output_path = str(Path(output_dir) / (Path(path).stem + ".mp3"))
+            if output_path not in outputs:
+                outputs.add(output_path)
+                jobs.append(
+                    self.job_queue.add(path, output_path, self.selected_engine())
+                )
+
+        self.count_job_pages(jobs)
+        self.schedule_jobs()
+
+    def count_job_pages(self, jobs):
+        """Count the jobs' pages in the background; they are scheduled
+        once every queued job has been counted."""
+        if not jobs:
+            return
+        page_count = PageCount(jobs, self)
+        page_count.counted.connect(self.pages_counted)
+        self.page_counts.append(page_count)
+        page_count.start()
+
+    def pages_counted(self, job, pages):
+        job.pages = pages
+        if job in self.job_queue.jobs:
+            row = self.job_queue.jobs.index(job)
+            self.queue_table.setItem(row, 1, QTableWidgetItem(str(pages or "?")))
+        if not self.job_queue.uncounted():
+            self.schedule_jobs()
+
+    def schedule_jobs(self):
+        """Start queued jobs, shortest first, while conversion slots are free."""
+        for job in self.job_queue.next_jobs():
+            # Pick up from the checkpoint of an interrupted run of this job
+            resume = can_resume(job.output_path, job.pdf_path, job.engine)
+
+            converter = self.shared_converter()
+            thread = ConversionThread(
+                job.pdf_path,
+                job.output_path,
+                resume,
+                job.engine,
+                converter,
+                self.connection_pool,
+            )
+            thread.progress.connect(
+                lambda value, message, job=job: self.job_progress(job, value, message)
+            )
+            thread.finished.connect(
+                lambda success, message, job=job: self.job_finished(
+                    job, success, message
+                )
+            )
+            # run() goes on after `finished` (stopping caffeinate), so keep
+            # the thread until it has returned
+            thread.stopped.connect(lambda job=job: self.job_threads.pop(job, None))
+            self.job_threads[job] = thread
+            thread.start()
+
+        self.save_job_queue()
+        self.refresh_job_table()
+
+    def shared_converter(self):
+        """The Converter used by every conversion started from the window.
+
+        As in the CLI's batches, all conversions share one extraction process
+        pool, one limit on concurrent synthesis sessions and one audio cache,
+        so running more jobs in parallel doesn't multiply worker processes
+        and sessions. edge-tts conversions also share `connection_pool`, so
+        chunks reuse open connections instead of each opening a new one.
+        """
+        if self.converter is None:
+            import asyncio
+            import concurrent.futures
+
+            from textwave.synthesis import MAX_CONCURRENT_SESSIONS
+
+            self.converter = textwave.Converter(
+                workers=textwave.EXTRACTION_WORKERS,
+                cache=textwave.SynthesisCache(),
+                limiter=asyncio.Semaphore(MAX_CONCURRENT_SESSIONS),
+                executor=concurrent.futures.ProcessPoolExecutor(
+                    max_workers=textwave.EXTRACTION_WORKERS
+                ),
+            )
+            self.connection_pool = textwave.ConnectionPool(MAX_CONCURRENT_SESSIONS)
+        return self.converter
+
+    def job_progress(self, job, value, message):
+        job.progress = value
+        job.message = message
+        row = self.job_queue.jobs.index(job)
+        bar = self.queue_table.cellWidget(row, 2)
+        if bar:
+            bar.setValue(value)
+            bar.setToolTip(message)
+
+    def job_finished(self, job, success, message):
+        thread = self.job_threads.get(job)
+        if success:
+            job.state = Job.DONE
+        elif thread is not None and thread.cancel_token.cancelled:
+            job.state = Job.CANCELLED
+        else:
+            job.state = Job.FAILED
+        job.message = message
+        if success:
+            job.progress = 100
+
+        # A slot just freed up
+        self.schedule_jobs()
+
+    def refresh_job_table(self):
+        """Rebuild the queue table from the job queue."""
+        jobs = self.job_queue.jobs
+        self.queue_table.setRowCount(len(jobs))
+        for row, job in enumerate(jobs):
+            self.queue_table.setItem(row, 0, QTableWidgetItem(Path(job.pdf_path).name))
+            self.queue_table.setItem(row, 1, QTableWidgetItem(str(job.pages or "?")))
+
+            bar = QProgressBar()
+            bar.setValue(job.progress)
+            if job.state == Job.QUEUED:
+                bar.setFormat("Queued")
+            elif job.state == Job.DONE:
+                bar.setFormat("Done")
+            elif job.state == Job.FAILED:
+                bar.setFormat("Failed")
+            elif job.state == Job.CANCELLED:
+                bar.setFormat("Cancelled")
+            bar.setToolTip(job.message)
+            self.queue_table.setCellWidget(row, 2, bar)
+
+        self.queue_widget.setVisible(bool(jobs))
+
+    def selected_engine(self):
+        return self.engine_combo.currentData()
+
+    def set_engine(self, index):
+        self.settings.setValue("engine", self.selected_engine())
+
+    def set_max_running_jobs(self, value):
+        self.job_queue.max_running = value
+        self.settings.setValue("max_running_jobs", value)
+        self.schedule_jobs()
+
+    def cancel_selected_jobs(self):
+        """Stop the selected running jobs, which keep their checkpoints, and
+        take the selected queued jobs off the queue."""
+        rows = self.queue_table.selectionModel().selectedRows()
+        for job in [self.job_queue.jobs[index.row()] for index in rows]:
+            if job.state == Job.QUEUED:
+                job.state = Job.CANCELLED
+                job.message = "Removed from the queue"
+            elif job.state == Job.RUNNING and job in self.job_threads:
+                # Marked cancelled once the conversion has stopped
+                self.job_threads[job].cancel()
+
+        self.save_job_queue()
+        self.refresh_job_table()
+
+    def clear_finished_jobs(self):
+        self.job_queue.clear_finished()
+        self.refresh_job_table()
+
+    def save_job_queue(self):
+        """Persist the unfinished jobs so they survive a restart."""
+        self.settings.setValue("job_queue", json.dumps(self.job_queue.to_list()))
+
+    def restore_job_queue(self):
+        """Re-queue the jobs saved by a previous session and start them."""
+        try:
+            items = json.loads(self.settings.value("job_queue", "") or "[]")
+        except ValueError:
+            return
+
+        # Skip jobs whose PDF has since been moved or deleted
+        items = [item for item in items if Path(item["pdf_path"]).exists()]
+        if items:
+            self.job_queue = JobQueue.from_list(items, self.job_queue.max_running)
+            self.count_job_pages(self.job_queue.uncounted())
+            self.schedule_jobs()
 
     def set_pdf(self, path):
         self.pdf_path = path
         file_name = Path(path).name
         self.drop_label.setText(f"✅ Selected:\n{file_name}")
         self.convert_btn.setEnabled(True)
+        self.resume_btn.setVisible(False)
         self.status_text.clear()
         self.status_text.setVisible(False)
         self.progress_bar.setVisible(False)
@@ -874,21 +1204,65 @@ class PDF2MP3App(QMainWindow):
         # Save the output directory for next time
         self.settings.setValue("last_output_dir", str(Path(output_path).parent))
 
+        # Offer to continue an interrupted conversion of the same PDF
+        resume = False
+        if can_resume(output_path, self.pdf_path, self.selected_engine()):
+            reply = QMessageBox.question(
+                self,
+                "Resume Conversion?",
+                "An unfinished conversion of this PDF was found.\n\n"
+                "Resume where it left off?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            )
+            resume = reply == QMessageBox.StandardButton.Yes
+
+        self.start_conversion(output_path, resume)
+
+    def resume_conversion(self):
+        """Resume the last interrupted conversion."""
+        if self.pdf_path and self.output_path:
+            # With the engine the interrupted conversion was using
+            self.start_conversion(
+                self.output_path, resume=True, engine=self.thread.engine
+            )
+
+    def start_conversion(self, output_path, resume=False, engine=None):
+        self.output_path = output_path
+
         # Disable UI during conversion
         self.convert_btn.setEnabled(False)
         self.select_btn.setEnabled(False)
+        self.resume_btn.setVisible(False)
+        self.cancel_btn.setEnabled(True)
+        self.cancel_btn.setText("Cancel")
+        self.cancel_btn.setVisible(True)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         self.status_text.setVisible(True)
         self.status_text.clear()
 
         # Start conversion thread
-        self.thread = ConversionThread(self.pdf_path, output_path)
+        converter = self.shared_converter()
+        self.thread = ConversionThread(
+            self.pdf_path,
+            output_path,
+            resume,
+            engine or self.selected_engine(),
+            converter,
+            self.connection_pool,
+        )
         self.thread.progress.connect(self.update_progress)
         self.thread.status.connect(self.update_status)
         self.thread.finished.connect(self.conversion_finished)
         self.thread.start()
 
+    def cancel_conversion(self):
+        """Stop the running conversion, keeping its checkpoint for resuming."""
+        if hasattr(self, "thread") and self.thread:
+            self.cancel_btn.setEnabled(False)
+            self.cancel_btn.setText("Cancelling...")
+            self.thread.cancel()
+
     def update_progress(self, value, message):
         self.progress_bar.setValue(value)
         self.status_text.append(f"Progress: {message}")
@@ -900,9 +1274,18 @@ class PDF2MP3App(QMainWindow):
         self.status_text.append("\n" + message)
         self.convert_btn.setEnabled(True)
         self.select_btn.setEnabled(True)
+        self.cancel_btn.setVisible(False)
 
         if success:
             self.progress_bar.setValue(100)
+        else:
+            # Offer to pick up from the last completed chunk
+            self.resume_btn.setVisible(
+                bool(self.output_path)
+                and can_resume(
+                    self.output_path, self.pdf_path, self.thread.engine
+                )
+            )
 
         # Ensure caffeinate is stopped
         if hasattr(self, "thread") and self.thread:
@@ -918,34 +1301,48 @@ class PDF2MP3App(QMainWindow):
                     and self.thread.caffeinate_process
                 ):
                     self.thread.stop_caffeinate()
-                self.thread.requestInterruption()
-                self.thread.quit()
-                self.thread.wait(1000)
+                self.thread.cancel()
+                self.thread.wait(5000)
 
-            # Disconnect and stop version check thread
-            if hasattr(self, "version_check_thread") and self.version_check_thread:
+            # Keep unfinished jobs for next launch and stop their threads
+            if hasattr(self, "job_queue"):
+                self.save_job_queue()
+            for job_thread in getattr(self, "job_threads", {}).values():
+                try:
+                    job_thread.finished.disconnect()
+                except Exception:
+                    pass
+                job_thread.stop_caffeinate()
+                job_thread.cancel()
+                job_thread.wait(5000)
+
+            # Stop the extraction workers shared by the conversions and
+            # close their open connections on the loop they were opened on
+            if getattr(self, "converter", None):
+                self.converter.executor.shutdown(wait=False, cancel_futures=True)
+            if getattr(self, "connection_pool", None):
+                shared_event_loop().run(self.connection_pool.close())
+
+            # Stop counting the pages of queued PDFs
+            for page_count in getattr(self, "page_counts", []):
                 try:
-                    self.version_check_thread.finished.disconnect()
+                    page_count.counted.disconnect()
                 except Exception:
                     pass
-                if self.version_check_thread.isRunning():
-                    self.version_check_thread.requestInterruption()
-                    self.version_check_thread.quit()
-                    self.version_check_thread.wait(200)
-
-            # Disconnect and stop app update check thread
-            if (
-                hasattr(self, "app_update_check_thread")
-                and self.app_update_check_thread
-            ):
+                page_count.cancel()
+
+            # Skip update checks that haven't started yet
+            if hasattr(self, "update_check_timer"):
+                self.update_check_timer.stop()
+
+            # Stop a running update check
+            if getattr(self, "update_check", None):
                 try:
-                    self.app_update_check_thread.finished.disconnect()
+                    self.update_check.edge_tts_checked.disconnect()
+                    self.update_check.app_checked.disconnect()
                 except Exception:
                     pass
-                if self.app_update_check_thread.isRunning():
-                    self.app_update_check_thread.requestInterruption()
-                    self.app_update_check_thread.quit()
-                    self.app_update_check_thread.wait(200)
+                self.update_check.cancel()
 
             # Stop update thread if running
             if hasattr(self, "update_thread") and self.update_thread:
@@ -965,7 +1362,19 @@ class PDF2MP3App(QMainWindow):
 
 
 if __name__ == "__main__":
+    # Needed for the extraction process pool in the bundled app
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = PDF2MP3App()
     window.show()
+
+    if "--measure-startup" in sys.argv:
+        # Report launch-to-window time once the first frame is up, then quit
+        def report_startup():
+            elapsed = time.perf_counter() - LAUNCH_STARTED
+            print(f"Window shown {elapsed:.3f}s after launch")
+            app.quit()
+
+        QTimer.singleShot(0, report_startup)
+
     sys.exit(app.exec())
@@ -3,16 +3,23 @@ Setup script to create a standalone macOS .app bundle for TextWave
 
 Usage:
     python3 setup.py py2app
+
+`pip install .` installs the conversion engine and the `textwave` command
+without the GUI.
 """
 
 import os
+import re
 import sys
 
 from setuptools import setup
 
-# Import version from main file
-sys.path.insert(0, os.path.dirname(__file__))
-from pdf2mp3_gui import __version__
+# Read the version from the main file without importing it (and PyQt6)
+with open(os.path.join(os.path.dirname(__file__), "pdf2mp3_gui.py")) as f:
+    __version__ = re.search(r'^__version__ = "([^"]+)"', f.read(), re.M).group(1)
+
+# What the textwave package needs at run time; the GUI adds PyQt6
+INSTALL_REQUIRES = ["aiohttp>=3.8", "edge-tts>=7.2,<8", "pypdf>=3.0.0"]
 
 APP = ["pdf2mp3_gui.py"]
 
@@ -28,7 +35,7 @@ icon_file = "textwave.icns" if os.path.exists("textwave.icns") else None
 
 OPTIONS = {
     "argv_emulation": False,
-    "packages": ["edge_tts", "pypdf", "PyQt6", "PIL"],
+    "packages": ["textwave", "edge_tts", "pypdf", "PyQt6", "PIL"],
     "iconfile": icon_file,
     "plist": {
         "CFBundleName": "TextWave",
@@ -45,7 +52,12 @@ OPTIONS = {
 setup(
     app=APP,
     name="TextWave",
+    version=__version__,
     data_files=DATA_FILES,
     options={"py2app": OPTIONS},
-    setup_requires=["py2app"],
+    setup_requires=["py2app"] if "py2app" in sys.argv else [],
+    packages=["textwave"],
+    install_requires=INSTALL_REQUIRES,
+    extras_require={"gui": ["PyQt6>=6.0.0"]},
+    entry_points={"console_scripts": ["textwave=textwave.cli:main"]},
 )
@@ -1,9 +1,13 @@
 """Pytest configuration and fixtures for TextWave tests."""
 
+import asyncio
+import random
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+from PyQt6.QtCore import QSettings
 from PyQt6.QtWidgets import QApplication
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
@@ -19,6 +23,18 @@ def qapp():
     yield app
 
 
+@pytest.fixture(autouse=True)
+def isolated_settings(tmp_path):
+    """Keep app settings (like the saved job queue) out of the user's profile."""
+    settings_file = str(tmp_path / "settings.ini")
+
+    def make_settings(*args):
+        return QSettings(settings_file, QSettings.Format.IniFormat)
+
+    with patch("pdf2mp3_gui.QSettings", make_settings):
+        yield settings_file
+
+
 @pytest.fixture
 def sample_pdf(tmp_path):
     """Create a sample PDF for testing."""
@@ -64,3 +80,130 @@ def sample_pdf_with_page_numbers(tmp_path):
     c.save()
 
     return str(pdf_path)
+
+
+@pytest.fixture
+def multi_page_pdf(tmp_path):
+    """Create a longer PDF with numbered pages for extraction tests."""
+    pdf_path = tmp_path / "multi_page.pdf"
+
+    c = canvas.Canvas(str(pdf_path), pagesize=letter)
+
+    for i in range(1, 13):
+        c.drawString(100, 750, f"Chapter {i} heading")
+        c.drawString(100, 730, f"Body text for page {i} of the document.")
+        c.drawString(300, 50, str(i))
+        c.showPage()
+
+    c.save()
+
+    return str(pdf_path)
+
+
+class FakeCommunicate:
+    """Stand-in for edge_tts.Communicate that returns the text as audio."""
+
+    active = 0
+    max_active = 0
+
+    def __init__(self, text, voice, **params):
+        self.text = text
+
+    async def stream(self):
+        FakeCommunicate.active += 1
+        FakeCommunicate.max_active = max(
+            FakeCommunicate.max_active, FakeCommunicate.active
+        )
+        try:
+            await asyncio.sleep(random.uniform(0, 0.01))
+            data = self.text.encode()
+            yield {"type": "WordBoundary", "offset": 0}
+            yield {"type": "audio", "data": data[: len(data) // 2]}
+            yield {"type": "audio", "data": data[len(data) // 2 :]}
+        finally:
+            FakeCommunicate.active -= 1
+
+
+@pytest.fixture
+def fake_communicate():
+    FakeCommunicate.active = 0
+    FakeCommunicate.max_active = 0
+    from textwave.connections import ConnectionPool
+
+    # Pooled connections bypass Communicate, so fall back to it as when the
+    # installed edge-tts doesn't support pooling
+    with patch("edge_tts.Communicate", FakeCommunicate), patch.object(
+        ConnectionPool, "supported", False
+    ):
+        yield FakeCommunicate
+
+
+class UpdateServer:
+    """Local stand-in for the PyPI and GitHub release APIs."""
+
+    def __init__(self):
+        self.pypi = {"info": {"version": "99.0.0"}}
+        self.release = {
+            "tag_name": "v99.0.0",
+            "html_url": "https://github.com/test/release",
+            "assets": [],
+        }
+        self.status = 200
+        self.delay = 0
+        self.etag = None
+        self.requests = []
+        self.url = None
+
+    async def handle(self, request):
+        from aiohttp import web
+
+        self.requests.append((request.path, dict(request.headers)))
+        await asyncio.sleep(self.delay)
+        if self.etag and request.headers.get("If-None-Match") == self.etag:
+            return web.Response(status=304)
+        if self.status != 200:
+            return web.Response(status=self.status)
+        body = self.pypi if request.path == "/pypi" else self.release
+        headers = {"ETag": self.etag} if self.etag else None
+        return web.json_response(body, headers=headers)
+
+    def checker(self, app_version="1.0.0", **kwargs):
+        from textwave import UpdateChecker
+
+        return UpdateChecker(
+            app_version,
+            pypi_url=self.url + "/pypi",
+            release_url=self.url + "/release",
+            **kwargs,
+        )
+
+
+@pytest.fixture
+def update_server():
+    """Serve UpdateServer from its own event loop thread on a free port."""
+    from aiohttp import web
+
+    from textwave import EventLoopThread
+
+    server = UpdateServer()
+    loop = EventLoopThread(name="update-server")
+    app = web.Application()
+    app.router.add_get("/{name}", server.handle)
+    runner = web.AppRunner(app)
+    loop.run(runner.setup())
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    loop.run(site.start())
+    port = runner.addresses[0][1]
+    server.url = f"http://127.0.0.1:{port}"
+    yield server
+    loop.run(runner.cleanup())
+    loop.stop()
+
+
+@pytest.fixture
+def edge_tts_server():
+    """Serve a FakeEdgeTTSServer and point edge-tts at it."""
+    from benchmarks.fake_edge_tts import FakeEdgeTTSServer
+
+    with FakeEdgeTTSServer() as server:
+        yield server
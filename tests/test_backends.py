@@ -0,0 +1,161 @@
+"""Tests for the pluggable speech engines."""
+
+import asyncio
+import sys
+import textwrap
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from textwave import (
+    EdgeTTSBackend,
+    EspeakBackend,
+    SynthesisCache,
+    convert_pdf_async,
+    create_backend,
+    split_text_into_chunks,
+)
+from textwave.cli import build_parser
+
+
+def small_chunks(text):
+    return split_text_into_chunks(text, max_chars=50)
+
+
+def write_script(path, body):
+    path.write_text(f"#!{sys.executable}\n" + textwrap.dedent(body))
+    path.chmod(0o755)
+    return str(path)
+
+
+@pytest.fixture
+def fake_espeak(tmp_path):
+    """Stand-ins for espeak-ng (text to "WAV") and lame ("WAV" to "MP3")."""
+    espeak = write_script(
+        tmp_path / "espeak-ng",
+        """
+        import sys
+        text = sys.stdin.read()
+        if "CHATTY" in text:
+            sys.stderr.write("warning\\n" * 128 * 1024)
+        if "FAIL" in text:
+            sys.stderr.write("cannot speak that")
+            sys.exit(3)
+        sys.stdout.buffer.write(b"WAV[" + text.encode() + b"]")
+        """,
+    )
+    lame = write_script(
+        tmp_path / "lame",
+        """
+        import sys
+        sys.stdout.buffer.write(b"MP3<" + sys.stdin.buffer.read() + b">")
+        """,
+    )
+    return EspeakBackend(espeak=espeak, lame=lame)
+
+
+@pytest.mark.unit
+def test_espeak_backend_pipes_espeak_into_lame(fake_espeak):
+    """Test that the offline engine encodes espeak-ng's output with lame."""
+    audio = asyncio.run(fake_espeak.synthesize("Hello there."))
+
+    assert audio == b"MP3<WAV[Hello there.]>"
+
+
+@pytest.mark.unit
+def test_espeak_backend_reports_failures(fake_espeak, tmp_path):
+    """Test that a failing or missing program raises a clear error."""
+    with pytest.raises(RuntimeError, match="espeak-ng failed.*cannot speak that"):
+        asyncio.run(fake_espeak.synthesize("FAIL"))
+
+    missing = EspeakBackend(espeak=str(tmp_path / "missing" / "espeak-ng"))
+    with pytest.raises(RuntimeError, match="needs espeak-ng"):
+        asyncio.run(missing.synthesize("Hello"))
+
+
+@pytest.mark.unit
+def test_espeak_backend_drains_stderr(fake_espeak):
+    """Test that a process writing more to stderr than a pipe holds doesn't
+    hang the chunk, and only the end of its output is reported."""
+    audio = asyncio.run(asyncio.wait_for(fake_espeak.synthesize("CHATTY"), 10))
+    assert audio == b"MP3<WAV[CHATTY]>"
+
+    with pytest.raises(RuntimeError) as error:
+        asyncio.run(asyncio.wait_for(fake_espeak.synthesize("CHATTY FAIL"), 10))
+    assert str(error.value).endswith("warning\nwarning\ncannot speak that")
+    assert len(str(error.value)) < 5000
+
+
+@pytest.mark.unit
+def test_engines_have_separate_cache_entries(tmp_path):
+    """Test that the same text gets different cache keys per engine, and
+    edge-tts keeps the keys it used before engines were pluggable."""
+    cache = SynthesisCache(tmp_path)
+    edge = EdgeTTSBackend()
+    espeak = EspeakBackend()
+
+    assert edge.cache_key(cache, "Hi") == cache.key("Hi", edge.voice, **edge.params)
+    assert espeak.cache_key(cache, "Hi") != edge.cache_key(cache, "Hi")
+
+
+@pytest.mark.unit
+def test_create_backend():
+    """Test that engines are created by name, edge-tts by default."""
+    assert isinstance(create_backend(), EdgeTTSBackend)
+    assert create_backend("espeak", "en-gb").voice == "en-gb"
+    with pytest.raises(ValueError, match="Unknown speech engine"):
+        create_backend("nope")
+
+    args = build_parser().parse_args(["convert", "a.pdf", "--engine", "espeak"])
+    assert args.engine == "espeak"
+
+
+@pytest.mark.unit
+def test_conversion_with_offline_engine(multi_page_pdf, tmp_path, fake_espeak):
+    """Test that a whole document can be converted without edge-tts."""
+    output = tmp_path / "book.mp3"
+    communicate = MagicMock(side_effect=AssertionError("edge-tts used"))
+
+    with patch("edge_tts.Communicate", communicate), patch(
+        "textwave.pipeline.iter_text_chunks", small_chunks
+    ):
+        asyncio.run(
+            convert_pdf_async(
+                multi_page_pdf,
+                str(output),
+                lambda p, m: None,
+                backend=fake_espeak,
+                concurrency=3,
+            )
+        )
+
+    audio = output.read_bytes()
+    assert audio.startswith(b"MP3<WAV[Chapter 1 heading")
+    assert audio.index(b"Chapter 2 ") < audio.index(b"Chapter 12 ")
+
+
+@pytest.mark.gui
+def test_gui_engine_choice_is_used_for_jobs(qtbot, qapp, tmp_path, sample_pdf):
+    """Test that the chosen engine is remembered and passed to queued jobs."""
+    from pdf2mp3_gui import PDF2MP3App
+
+    with patch("pdf2mp3_gui.ConversionThread") as mock_thread_class:
+        window = PDF2MP3App()
+        qtbot.addWidget(window)
+        window.engine_combo.setCurrentIndex(window.engine_combo.findData("espeak"))
+
+        with patch(
+            "pdf2mp3_gui.QFileDialog.getExistingDirectory", return_value=str(tmp_path)
+        ):
+            window.queue_pdfs([sample_pdf])
+
+        qtbot.waitUntil(lambda: mock_thread_class.called)
+        assert mock_thread_class.call_args[0][3] == "espeak"
+        assert window.job_queue.jobs[0].engine == "espeak"
+
+        restored = PDF2MP3App()
+        qtbot.addWidget(restored)
+        assert restored.selected_engine() == "espeak"
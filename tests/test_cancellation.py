@@ -0,0 +1,174 @@
+"""Tests for cancelling running conversions."""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf2mp3_gui import ConversionThread, PDF2MP3App
+from textwave import (
+    CancellationToken,
+    ConversionCancelled,
+    JobManifest,
+    convert_pdf_async,
+    extract_and_clean_text,
+    split_text_into_chunks,
+)
+from textwave.manifest import manifest_path
+
+
+def small_chunks(text):
+    return split_text_into_chunks(text, max_chars=50)
+
+
+class SlowCommunicate:
+    """Stand-in for edge_tts.Communicate that takes `delay` seconds per chunk
+    and records how many streams were opened and closed."""
+
+    delay = 0.01
+    opened = 0
+    closed = 0
+
+    def __init__(self, text, voice, **params):
+        self.text = text
+
+    async def stream(self):
+        SlowCommunicate.opened += 1
+        try:
+            await asyncio.sleep(SlowCommunicate.delay)
+            yield {"type": "audio", "data": self.text.encode()}
+        finally:
+            SlowCommunicate.closed += 1
+
+
+@pytest.fixture
+def slow_communicate():
+    SlowCommunicate.delay = 0.01
+    SlowCommunicate.opened = 0
+    SlowCommunicate.closed = 0
+    with patch("edge_tts.Communicate", SlowCommunicate):
+        yield SlowCommunicate
+
+
+def run_conversion(pdf_path, output_path, progress_callback=None, **kwargs):
+    with patch("textwave.pipeline.iter_text_chunks", small_chunks):
+        asyncio.run(
+            convert_pdf_async(
+                pdf_path,
+                str(output_path),
+                progress_callback or (lambda p, m: None),
+                **kwargs,
+            )
+        )
+
+
+@pytest.mark.unit
+def test_cancel_keeps_checkpoint_for_resume(multi_page_pdf, tmp_path, slow_communicate):
+    """Test that a cancelled conversion stops, closes its streams and can be
+    resumed to the same output as an uninterrupted one."""
+    expected = tmp_path / "expected.mp3"
+    run_conversion(multi_page_pdf, expected)
+
+    output = tmp_path / "book.mp3"
+    token = CancellationToken()
+    written = []
+
+    def cancel_after_three_chunks(percent, message):
+        written.append(message)
+        if len(written) == 3:
+            token.cancel()
+
+    with pytest.raises(ConversionCancelled):
+        run_conversion(
+            multi_page_pdf, output, cancel_after_three_chunks, cancel_token=token
+        )
+
+    assert slow_communicate.opened == slow_communicate.closed
+    manifest = JobManifest.load(output)
+    assert manifest.completed_chunks >= 3
+    assert output.stat().st_size == manifest.bytes_written
+
+    run_conversion(multi_page_pdf, output, resume=True)
+    assert output.read_bytes() == expected.read_bytes()
+
+
+@pytest.mark.unit
+def test_cancel_from_another_thread_is_prompt(multi_page_pdf, tmp_path, slow_communicate):
+    """Test that cancelling stops in-flight synthesis instead of waiting for
+    it, and removes output that has no audio yet."""
+    slow_communicate.delay = 30
+    output = tmp_path / "book.mp3"
+    token = CancellationToken()
+    threading.Timer(0.2, token.cancel).start()
+
+    start = time.monotonic()
+    with pytest.raises(ConversionCancelled):
+        run_conversion(multi_page_pdf, output, cancel_token=token)
+
+    assert time.monotonic() - start < 5
+    assert slow_communicate.opened > 0
+    assert slow_communicate.opened == slow_communicate.closed
+    assert not output.exists()
+    assert not manifest_path(output).exists()
+
+
+@pytest.mark.unit
+def test_cancelled_token_stops_extraction(multi_page_pdf):
+    """Test that text extraction checks the token between pages."""
+    token = CancellationToken()
+    token.cancel()
+
+    with pytest.raises(ConversionCancelled):
+        extract_and_clean_text(multi_page_pdf, cancel_token=token)
+
+
+@pytest.mark.unit
+def test_cancel_after_block_does_not_cancel_task():
+    """Test that cancelling once the guarded block has exited leaves the
+    task alone."""
+    token = CancellationToken()
+
+    async def main():
+        with token.cancel_current_task():
+            await asyncio.sleep(0)
+        token.cancel()
+        await asyncio.sleep(0.01)
+        return "finished"
+
+    assert asyncio.run(main()) == "finished"
+
+
+@pytest.mark.integration
+def test_conversion_thread_reports_cancellation(qtbot, tmp_path):
+    """Test that a cancelled conversion thread finishes with a clear message."""
+    thread = ConversionThread(str(tmp_path / "test.pdf"), str(tmp_path / "out.mp3"))
+    results = []
+    thread.finished.connect(lambda success, message: results.append((success, message)))
+
+    with patch("subprocess.Popen", return_value=MagicMock()):
+        with patch("textwave.Converter"):
+            with patch("textwave.eventloop.EventLoopThread.run", side_effect=ConversionCancelled()):
+                with qtbot.waitSignal(thread.finished, timeout=3000):
+                    thread.start()
+                thread.wait(3000)
+
+    assert results == [(False, "Conversion cancelled")]
+
+
+@pytest.mark.gui
+def test_cancel_button_cancels_thread(qtbot, qapp):
+    """Test that the cancel button asks the conversion thread to stop."""
+    window = PDF2MP3App()
+    qtbot.addWidget(window)
+    window.thread = MagicMock()
+
+    window.cancel_conversion()
+
+    window.thread.cancel.assert_called_once()
+    assert not window.cancel_btn.isEnabled()
@@ -0,0 +1,247 @@
+"""Tests for the command-line batch converter."""
+
+import json
+import re
+import shutil
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from textwave import split_text_into_chunks
+from textwave.cli import main
+from textwave.jobs import expand_inputs
+
+
+def small_chunks(text):
+    return split_text_into_chunks(text, max_chars=50)
+
+
+def read_events(capsys):
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+@pytest.fixture
+def pdf_folder(tmp_path, sample_pdf, multi_page_pdf):
+    folder = tmp_path / "docs"
+    folder.mkdir()
+    shutil.copy(sample_pdf, folder / "a.pdf")
+    shutil.copy(multi_page_pdf, folder / "b.pdf")
+    (folder / "notes.txt").write_text("not a pdf")
+    return folder
+
+
+@pytest.mark.unit
+def test_expand_inputs_handles_files_globs_and_folders(pdf_folder):
+    """Test that inputs are expanded, deduplicated and kept in order."""
+    a = str(pdf_folder / "a.pdf")
+    b = str(pdf_folder / "b.pdf")
+
+    paths, unmatched = expand_inputs(
+        [b, str(pdf_folder / "*.pdf"), str(pdf_folder), "missing-*.pdf"]
+    )
+
+    assert paths == [b, a]
+    assert unmatched == ["missing-*.pdf"]
+
+
+@pytest.mark.unit
+def test_convert_many_files(pdf_folder, tmp_path, capsys, fake_communicate):
+    """Test converting a batch with shared session concurrency."""
+    out_dir = tmp_path / "out"
+
+    with patch("textwave.pipeline.iter_text_chunks", small_chunks):
+        exit_code = main(
+            [
+                "convert",
+                str(pdf_folder / "*.pdf"),
+                "-o",
+                str(out_dir),
+                "--jobs",
+                "2",
+                "--concurrency",
+                "3",
+                "--workers",
+                "1",
+                "--no-cache",
+            ]
+        )
+
+    events = read_events(capsys)
+    assert exit_code == 0
+    assert (out_dir / "a.mp3").exists()
+    assert b"Chapter 12" in (out_dir / "b.mp3").read_bytes()
+    assert fake_communicate.max_active <= 3
+    assert {e["file"] for e in events if e["event"] == "done"} == {
+        str(pdf_folder / "a.pdf"),
+        str(pdf_folder / "b.pdf"),
+    }
+    assert any(e["event"] == "progress" for e in events)
+    assert events[-1]["event"] == "summary"
+    assert events[-1]["succeeded"] == 2
+    assert events[-1]["failed"] == 0
+
+
+@pytest.mark.unit
+def test_documents_share_pooled_connections(
+    pdf_folder, tmp_path, capsys, edge_tts_server
+):
+    """Test that edge-tts connections are kept open and reused across the
+    chunks of every document, up to --concurrency connections."""
+    with patch("textwave.pipeline.iter_text_chunks", small_chunks):
+        exit_code = main(
+            [
+                "convert",
+                str(pdf_folder / "*.pdf"),
+                "-o",
+                str(tmp_path / "out"),
+                "--concurrency",
+                "3",
+                "--no-cache",
+            ]
+        )
+
+    assert exit_code == 0
+    assert read_events(capsys)[-1]["succeeded"] == 2
+    assert edge_tts_server.connects <= 3
+    assert edge_tts_server.requests > 3 * edge_tts_server.connects
+
+
+@pytest.mark.unit
+def test_cached_audio_is_counted_per_document(
+    pdf_folder, tmp_path, capsys, fake_communicate
+):
+    """Test that converting documents again reports, for each one, that all
+    of its own chunks came from the shared cache."""
+    args = [
+        "convert",
+        str(pdf_folder / "*.pdf"),
+        "-o",
+        str(tmp_path / "out"),
+        "--cache-dir",
+        str(tmp_path / "cache"),
+    ]
+    with patch("textwave.pipeline.iter_text_chunks", small_chunks):
+        assert main(args) == 0
+        read_events(capsys)
+        assert main(args) == 0
+
+    pattern = re.compile(r"Reused cached audio for (\d+) of (\d+) chunks")
+    reused = {
+        e["file"]: pattern.fullmatch(e["message"])
+        for e in read_events(capsys)
+        if e["event"] == "status" and e["message"].startswith("Reused")
+    }
+    assert set(reused) == {str(pdf_folder / "a.pdf"), str(pdf_folder / "b.pdf")}
+    for match in reused.values():
+        hits, chunks = map(int, match.groups())
+        assert hits == chunks > 0
+
+
+@pytest.mark.unit
+def test_adaptive_concurrency_stays_within_limit(
+    pdf_folder, tmp_path, capsys, fake_communicate
+):
+    """Test that --adaptive converts with sessions capped by --concurrency."""
+    with patch("textwave.pipeline.iter_text_chunks", small_chunks):
+        exit_code = main(
+            [
+                "convert",
+                str(pdf_folder / "*.pdf"),
+                "-o",
+                str(tmp_path / "out"),
+                "--concurrency",
+                "3",
+                "--adaptive",
+                "--no-cache",
+            ]
+        )
+
+    events = read_events(capsys)
+    assert exit_code == 0
+    assert fake_communicate.max_active <= 3
+    assert all(e["sessions"] <= 3 for e in events if e["event"] == "concurrency")
+    assert events[-1]["succeeded"] == 2
+
+
+@pytest.mark.unit
+def test_rate_limit_is_shared_through_database(
+    pdf_folder, tmp_path, capsys, fake_communicate
+):
+    """Test that rate limit options convert through the shared database."""
+    rate_db = tmp_path / "limits" / "rate.db"
+
+    exit_code = main(
+        [
+            "convert",
+            str(pdf_folder / "a.pdf"),
+            "-o",
+            str(tmp_path / "out"),
+            "--max-requests-per-second",
+            "50",
+            "--max-chars-per-second",
+            "100000",
+            "--rate-limit-db",
+            str(rate_db),
+            "--no-cache",
+        ]
+    )
+
+    assert exit_code == 0
+    assert read_events(capsys)[-1]["succeeded"] == 1
+    assert rate_db.exists()
+
+
+@pytest.mark.unit
+def test_progress_lines_are_throttled(pdf_folder, tmp_path, capsys, fake_communicate):
+    """Test that progress lines are coalesced but completion is always printed."""
+
+    def progress_events(rate):
+        with patch("textwave.pipeline.iter_text_chunks", small_chunks):
+            main(
+                [
+                    "convert",
+                    str(pdf_folder / "b.pdf"),
+                    "-o",
+                    str(tmp_path / rate),
+                    "--no-cache",
+                    "--progress-rate",
+                    rate,
+                ]
+            )
+        return [e for e in read_events(capsys) if e["event"] == "progress"]
+
+    every_chunk = progress_events("0")
+    throttled = progress_events("0.001")
+
+    assert len(throttled) < len(every_chunk)
+    assert throttled[-1]["percent"] == 100
+
+
+@pytest.mark.unit
+def test_failures_are_reported(pdf_folder, tmp_path, capsys, fake_communicate):
+    """Test that bad inputs produce error events and a failing exit code."""
+    broken = pdf_folder / "broken.pdf"
+    broken.write_text("not really a pdf")
+
+    exit_code = main(
+        [
+            "convert",
+            str(pdf_folder / "a.pdf"),
+            str(broken),
+            "nothing-here-*.pdf",
+            "-o",
+            str(tmp_path / "out"),
+            "--no-cache",
+        ]
+    )
+
+    events = read_events(capsys)
+    errors = {e["file"] for e in events if e["event"] == "error"}
+    assert exit_code == 1
+    assert errors == {str(broken), "nothing-here-*.pdf"}
+    assert events[-1]["succeeded"] == 1
+    assert events[-1]["failed"] == 2
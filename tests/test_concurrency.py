@@ -0,0 +1,163 @@
+"""Tests for adaptive synthesis concurrency."""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+import aiohttp
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from textwave import AdaptiveConcurrency, RetryPolicy
+from textwave.synthesis import synthesize_in_order
+
+
+def response_error(status):
+    return aiohttp.ClientResponseError(None, (), status=status)
+
+
+async def request(controller, latency=0.01, error=None):
+    async with controller:
+        await asyncio.sleep(latency)
+        if error:
+            raise error
+
+
+async def requests(controller, count, **kwargs):
+    await asyncio.gather(
+        *(request(controller, **kwargs) for _ in range(count)),
+        return_exceptions=True,
+    )
+
+
+def run(controller_args, scenario):
+    """Run scenario(controller) and return the controller and its changes."""
+    changes = []
+
+    async def main():
+        controller = AdaptiveConcurrency(
+            on_change=lambda limit, reason: changes.append(limit), **controller_args
+        )
+        await scenario(controller)
+        return controller
+
+    return asyncio.run(main()), changes
+
+
+@pytest.mark.unit
+def test_limit_grows_while_requests_succeed():
+    """Test that a saturated limit grows one session per round of successes,
+    up to the ceiling, and is never exceeded."""
+    controller, changes = run(
+        {"initial": 1, "maximum": 4},
+        lambda controller: requests(controller, 40),
+    )
+
+    assert changes == [2, 3, 4]
+    assert controller.peak == 4
+
+
+@pytest.mark.unit
+def test_unused_limit_does_not_grow():
+    """Test that the limit stays put while requests never reach it."""
+
+    async def one_at_a_time(controller):
+        for _ in range(10):
+            await request(controller)
+
+    controller, changes = run({"initial": 2}, one_at_a_time)
+
+    assert changes == []
+    assert controller.limit == 2
+
+
+@pytest.mark.unit
+def test_throttling_halves_the_limit_once_per_burst():
+    """Test that a burst of 429s cuts the limit once, later ones cut it
+    again, and the floor holds."""
+
+    async def throttled(controller):
+        for _ in range(4):
+            await requests(controller, controller.limit, error=response_error(429))
+
+    controller, changes = run({"initial": 8, "minimum": 2}, throttled)
+
+    assert changes == [4, 2]
+    assert controller.limit == 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "error, backs_off",
+    [
+        (asyncio.TimeoutError(), True),
+        (response_error(503), True),
+        (response_error(401), False),
+        (ValueError("bad text"), False),
+    ],
+)
+def test_only_overload_errors_back_off(error, backs_off):
+    """Test that timeouts and server errors back off but other failures don't."""
+    controller, _ = run({"initial": 4}, lambda c: requests(c, 1, error=error))
+
+    assert controller.limit == (2 if backs_off else 4)
+
+
+@pytest.mark.unit
+def test_rising_p95_latency_backs_off():
+    """Test that a window whose p95 latency is well above the best window
+    seen cuts the limit."""
+
+    async def slowing_down(controller):
+        for latency in [0.01] * 5 + [0.1] * 5:
+            await request(controller, latency)
+
+    controller, changes = run(
+        {"initial": 4, "window": 5, "tolerance": 2.0}, slowing_down
+    )
+
+    assert changes == [2]
+    assert controller.best_p95 < 0.05
+
+
+@pytest.mark.unit
+def test_decisions_are_logged(caplog):
+    """Test that every change of the limit is logged with its reason."""
+    caplog.set_level(logging.INFO, logger="textwave.concurrency")
+
+    run({"initial": 4}, lambda c: requests(c, 1, error=response_error(429)))
+
+    assert "Changing concurrent sessions from 4 to 2: throttled (HTTP 429)" in (
+        caplog.text
+    )
+
+
+@pytest.mark.unit
+def test_adapts_to_service_connection_limit(edge_tts_server):
+    """Test that synthesis against a service that throttles beyond two
+    connections backs off, retries and still produces every chunk."""
+    edge_tts_server.max_connections = 2
+    edge_tts_server.latency = 0.05
+    policy = RetryPolicy(base_delay=0.01, max_attempts=20, budget=200)
+    chunks = [f"Chunk number {i}." for i in range(16)]
+
+    async def synthesize(controller):
+        return [
+            audio
+            async for _, audio in synthesize_in_order(
+                chunks, 8, retry_policy=policy, limiter=controller
+            )
+        ]
+
+    async def main():
+        controller = AdaptiveConcurrency(initial=6, maximum=8)
+        return controller, await synthesize(controller)
+
+    controller, audio = asyncio.run(main())
+
+    assert audio == [edge_tts_server.audio_for(chunk) for chunk in chunks]
+    assert edge_tts_server.throttled > 0
+    assert policy.retries == edge_tts_server.throttled
+    assert controller.limit < 6
@@ -0,0 +1,137 @@
+"""Tests for reusing edge-tts connections across chunks."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from textwave import ConnectionPool, EdgeTTSBackend, RetryPolicy
+from textwave.synthesis import synthesize_in_order
+
+CHUNKS = [f"Chunk number {i}." for i in range(12)]
+
+
+async def synthesize_all(pool, chunks=CHUNKS, concurrency=4, retry_policy=None):
+    backend = EdgeTTSBackend(pool=pool)
+    try:
+        return [
+            audio
+            async for _, audio in synthesize_in_order(
+                chunks, concurrency, retry_policy=retry_policy, backend=backend
+            )
+        ]
+    finally:
+        await pool.close()
+
+
+@pytest.mark.unit
+def test_pool_reuses_connections_across_chunks(edge_tts_server):
+    """Test that chunks share the pool's connections and get the same audio
+    as one connection per chunk."""
+    pool = ConnectionPool()
+    audio = asyncio.run(synthesize_all(pool))
+
+    assert audio == [edge_tts_server.audio_for(chunk) for chunk in CHUNKS]
+    assert edge_tts_server.connects == 4
+    assert edge_tts_server.requests == 12
+    assert (pool.opened, pool.reused) == (4, 8)
+
+
+@pytest.mark.unit
+def test_pool_pays_the_handshake_once_per_connection(edge_tts_server):
+    """Test that handshake latency is paid per connection, not per chunk."""
+    edge_tts_server.handshake_latency = 0.2
+
+    start = time.perf_counter()
+    asyncio.run(synthesize_all(ConnectionPool(), CHUNKS[:8], concurrency=1))
+
+    assert edge_tts_server.connects == 1
+    assert time.perf_counter() - start < 0.2 * 4
+
+
+@pytest.mark.unit
+def test_connections_are_recycled_after_max_requests(edge_tts_server):
+    """Test that a connection is replaced once it has served max_requests."""
+    pool = ConnectionPool(max_requests=3)
+    asyncio.run(synthesize_all(pool, CHUNKS[:6], concurrency=1))
+
+    assert edge_tts_server.connects == 2
+
+
+@pytest.mark.unit
+def test_connection_dropped_while_idle_is_replaced(edge_tts_server):
+    """Test that a chunk whose pooled connection was dropped by the service
+    while idle moves on to a new connection without failing."""
+    edge_tts_server.idle_timeout = 0.1
+    pool = ConnectionPool()
+    backend = EdgeTTSBackend(pool=pool)
+
+    async def synthesize_with_pause():
+        try:
+            first = await backend.synthesize("Before the pause.")
+            await asyncio.sleep(0.3)
+            second = await backend.synthesize("After the pause.")
+            return first, second
+        finally:
+            await pool.close()
+
+    first, second = asyncio.run(synthesize_with_pause())
+
+    assert second == edge_tts_server.audio_for("After the pause.")
+    assert edge_tts_server.connects == 2
+    assert pool.reused == 1
+
+
+@pytest.mark.unit
+def test_dropped_stream_is_retried_in_full(edge_tts_server):
+    """Test that a stream cut off mid-chunk raises and is retried, rather
+    than returning the audio cut short."""
+    edge_tts_server.disconnect_rate = 0.3
+    policy = RetryPolicy(base_delay=0.01, max_attempts=10)
+    pool = ConnectionPool()
+
+    audio = asyncio.run(synthesize_all(pool, retry_policy=policy))
+
+    assert audio == [edge_tts_server.audio_for(chunk) for chunk in CHUNKS]
+    assert edge_tts_server.disconnects > 0
+    assert policy.retries == edge_tts_server.disconnects
+
+
+@pytest.mark.unit
+def test_abandoned_stream_closes_its_connection(edge_tts_server):
+    """Test that a connection whose stream the consumer stops reading
+    midway is closed instead of going back to the pool."""
+    pool = ConnectionPool()
+    backend = EdgeTTSBackend(pool=pool)
+
+    async def read_first_message():
+        stream = backend.stream("A sentence long enough for several messages. " * 4)
+        try:
+            await stream.__anext__()
+        finally:
+            await stream.aclose()
+        idle = len(pool.idle)
+        await pool.close()
+        return idle
+
+    assert asyncio.run(read_first_message()) == 0
+    assert edge_tts_server.connects == 1
+
+
+@pytest.mark.unit
+def test_backend_falls_back_without_pooling_support(edge_tts_server):
+    """Test that when the installed edge-tts lacks the internals the pool
+    needs, every chunk gets a connection of its own through edge-tts."""
+    pool = ConnectionPool()
+
+    with patch.object(ConnectionPool, "supported", False):
+        audio = asyncio.run(synthesize_all(pool, CHUNKS[:4]))
+
+    assert audio == [edge_tts_server.audio_for(chunk) for chunk in CHUNKS[:4]]
+    assert edge_tts_server.connects == 4
+    assert pool.opened == 0
@@ -0,0 +1,86 @@
+"""Tests for the GUI-independent conversion API."""
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from textwave import Converter, JobManifest, split_text_into_chunks
+
+
+def small_chunks(text):
+    return split_text_into_chunks(text, max_chars=50)
+
+
+@pytest.mark.unit
+def test_engine_does_not_import_qt():
+    """Test that the engine can be imported on headless machines."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, textwave; "
+            "sys.exit(any(m.startswith('PyQt6') for m in sys.modules))",
+        ],
+        cwd=str(Path(__file__).parent.parent),
+    )
+
+    assert result.returncode == 0
+
+
+@pytest.mark.unit
+def test_converter_extracts_text(sample_pdf):
+    """Test that the converter exposes text extraction."""
+    text, total_pages = Converter(workers=1).extract_text(sample_pdf)
+
+    assert total_pages == 2
+    assert "Test PDF Content" in text
+
+
+@pytest.mark.unit
+def test_converter_converts_pdf(multi_page_pdf, tmp_path, fake_communicate):
+    """Test a blocking conversion with progress and status callbacks."""
+    output = tmp_path / "out.mp3"
+    updates = []
+    statuses = []
+
+    with patch("textwave.pipeline.iter_text_chunks", small_chunks):
+        Converter(concurrency=2, workers=1).convert(
+            multi_page_pdf,
+            str(output),
+            lambda p, m: updates.append(p),
+            status_callback=statuses.append,
+        )
+
+    assert b"Chapter 12 heading" in output.read_bytes()
+    assert updates[-1] == 100
+    assert any("12 pages" in message for message in statuses)
+    assert fake_communicate.max_active <= 2
+
+
+@pytest.mark.unit
+def test_converter_callbacks_are_optional(sample_pdf, tmp_path, fake_communicate):
+    """Test that a conversion runs without any callbacks."""
+    output = tmp_path / "out.mp3"
+
+    Converter(workers=1).convert(sample_pdf, str(output))
+
+    assert b"Second Page" in output.read_bytes()
+
+
+@pytest.mark.unit
+def test_converter_resumes(sample_pdf, tmp_path, fake_communicate):
+    """Test that the converter resumes from a job manifest."""
+    output = tmp_path / "out.mp3"
+    manifest = JobManifest(str(output), sample_pdf)
+    manifest.save()
+    output.write_bytes(b"")
+
+    Converter(workers=1).resume(str(output))
+
+    assert b"Test PDF Content" in output.read_bytes()
+    assert JobManifest.load(str(output)) is None
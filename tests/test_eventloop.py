@@ -0,0 +1,85 @@
+"""Tests for the shared event loop thread."""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from textwave import EventLoopThread, shared_event_loop
+
+
+async def current_loop():
+    return asyncio.get_running_loop(), threading.current_thread().name
+
+
+@pytest.mark.unit
+def test_coroutines_share_one_long_lived_loop():
+    """Test that coroutines submitted from several threads run on the same
+    loop, on the loop's own thread."""
+    service = EventLoopThread(name="test-loop")
+    results = []
+
+    def submit():
+        results.append(service.run(current_loop()))
+
+    threads = [threading.Thread(target=submit) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    results.append(service.run(current_loop()))
+
+    assert len({id(loop) for loop, _ in results}) == 1
+    assert {name for _, name in results} == {"test-loop"}
+    service.stop()
+
+
+@pytest.mark.unit
+def test_submitted_coroutines_run_concurrently():
+    """Test that submitted coroutines overlap instead of running in turn."""
+    service = EventLoopThread()
+    both_started = asyncio.Event()
+    started = 0
+
+    async def job():
+        nonlocal started
+        started += 1
+        if started == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=5)
+        return started
+
+    futures = [service.submit(job()) for _ in range(2)]
+
+    assert [future.result(timeout=5) for future in futures] == [2, 2]
+    service.stop()
+
+
+@pytest.mark.unit
+def test_errors_propagate_and_loop_restarts():
+    """Test that exceptions reach the caller and a stopped loop restarts."""
+    service = EventLoopThread()
+
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        service.run(fail())
+
+    first_loop, _ = service.run(current_loop())
+    service.stop()
+    assert first_loop.is_closed()
+
+    second_loop, _ = service.run(current_loop())
+    assert second_loop is not first_loop
+    service.stop()
+
+
+@pytest.mark.unit
+def test_shared_event_loop_is_a_singleton():
+    """Test that every caller gets the same process-wide loop thread."""
+    assert shared_event_loop() is shared_event_loop()
@@ -0,0 +1,106 @@
+"""Tests for synthesis against the local fake edge-tts service."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.fake_edge_tts import MP3_FRAME
+from textwave import EdgeTTSBackend, RetryPolicy
+from textwave.synthesis import synthesize_chunk, synthesize_in_order
+
+
+async def synthesize_all(chunks, concurrency=4, retry_policy=None):
+    return [
+        audio
+        async for _, audio in synthesize_in_order(
+            chunks, concurrency, retry_policy=retry_policy
+        )
+    ]
+
+
+@pytest.mark.unit
+def test_edge_tts_synthesizes_against_fake_server(edge_tts_server):
+    """Test that the real edge-tts client gets MP3 audio sized to the text
+    from the fake service."""
+    text = "Hello & welcome to <chapter> one."
+    audio = asyncio.run(EdgeTTSBackend().synthesize(text))
+
+    assert edge_tts_server.texts == [text]
+    assert audio.startswith(MP3_FRAME)
+    assert len(audio) == len(edge_tts_server.audio_for(text))
+
+
+@pytest.mark.unit
+def test_latency_overlaps_across_concurrent_sessions(edge_tts_server):
+    """Test that concurrent sessions wait out the service latency side by
+    side, so throughput scales with concurrency."""
+    edge_tts_server.latency = 0.3
+    chunks = [f"Chunk number {i}." for i in range(8)]
+
+    start = time.perf_counter()
+    audio = asyncio.run(synthesize_all(chunks, concurrency=4))
+    elapsed = time.perf_counter() - start
+
+    assert len(audio) == 8
+    assert edge_tts_server.peak_connections == 4
+    assert 0.6 <= elapsed < 1.5
+
+
+@pytest.mark.unit
+def test_bandwidth_paces_the_audio_stream(edge_tts_server):
+    """Test that audio streams no faster than the configured bandwidth."""
+    edge_tts_server.bandwidth = 40_000
+    text = "x" * 100  # 40 kB of audio
+
+    start = time.perf_counter()
+    asyncio.run(EdgeTTSBackend().synthesize(text))
+
+    assert time.perf_counter() - start >= 0.9
+
+
+@pytest.mark.unit
+def test_throttled_requests_are_retried(edge_tts_server):
+    """Test that HTTP 429s from the service are retried until they succeed."""
+    edge_tts_server.throttle_rate = 0.5
+    policy = RetryPolicy(base_delay=0.01, max_attempts=10)
+    chunks = [f"Chunk number {i}." for i in range(6)]
+
+    audio = asyncio.run(synthesize_all(chunks, retry_policy=policy))
+
+    assert len(audio) == 6
+    assert edge_tts_server.throttled > 0
+    assert policy.retries == edge_tts_server.throttled
+
+
+@pytest.mark.unit
+def test_connection_limit_throttles_excess_sessions(edge_tts_server):
+    """Test that sessions beyond the service's connection limit get 429s."""
+    edge_tts_server.max_connections = 2
+    edge_tts_server.latency = 0.1
+    policy = RetryPolicy(base_delay=0.05, max_attempts=20, budget=200)
+
+    audio = asyncio.run(
+        synthesize_all([f"Chunk {i}." for i in range(6)], 4, retry_policy=policy)
+    )
+
+    assert len(audio) == 6
+    assert edge_tts_server.peak_connections == 2
+    assert edge_tts_server.throttled > 0
+
+
+@pytest.mark.unit
+def test_dropped_stream_cuts_audio_short(edge_tts_server):
+    """Test that a connection dropped mid-stream ends the audio early, which
+    edge-tts reports as a normal (short) result rather than an error."""
+    edge_tts_server.disconnect_rate = 1.0
+    text = "A sentence long enough for several audio messages. " * 4
+
+    audio = asyncio.run(synthesize_chunk(text))
+
+    assert edge_tts_server.disconnects == 1
+    assert 0 < len(audio) < len(edge_tts_server.audio_for(text))
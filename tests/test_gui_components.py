@@ -1,5 +1,6 @@
 """Tests for GUI components and interactions."""
 
+import os
 import pytest
 import sys
 from pathlib import Path
@@ -87,3 +88,41 @@ def test_app_update_banner_creation(qtbot, qapp):
     assert banner is not None
     from PyQt6.QtWidgets import QWidget
     assert isinstance(banner, QWidget)
+
+
+@pytest.mark.unit
+def test_gui_import_defers_engine_dependencies():
+    """Test that importing the GUI doesn't load edge-tts, pypdf or aiohttp."""
+    import subprocess
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, pdf2mp3_gui; "
+            "print([m for m in ('edge_tts', 'pypdf', 'aiohttp', 'urllib.request') "
+            "if m in sys.modules])",
+        ],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "QT_QPA_PLATFORM": "offscreen"},
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+@pytest.mark.gui
+def test_update_checks_wait_for_idle_ui(qtbot, qapp):
+    """Test that update checks start from a timer, not during window setup."""
+    with patch("pdf2mp3_gui.UpdateCheck") as update_check:
+        window = PDF2MP3App()
+        qtbot.addWidget(window)
+
+        assert window.update_check_timer.isActive()
+        update_check.assert_not_called()
+
+        window.update_check_timer.timeout.emit()
+
+        update_check.return_value.start.assert_called_once()
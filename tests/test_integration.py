@@ -23,9 +23,9 @@ def test_caffeinate_starts_and_stops(qtbot, tmp_path):
         mock_process = MagicMock()
         mock_popen.return_value = mock_process
 
-        # Mock PDF extraction and TTS to avoid actual processing
-        with patch("pdf2mp3_gui.extract_and_clean_text", return_value=("test text", 1)):
-            with patch("asyncio.run"):
+        # Mock the conversion pipeline to avoid actual processing
+        with patch("textwave.Converter"):
+            with patch("textwave.eventloop.EventLoopThread.run"):
                 thread.run()
 
         # Verify caffeinate was started with correct args
@@ -49,11 +49,10 @@ def test_caffeinate_cleanup_on_error(qtbot, tmp_path):
         mock_process = MagicMock()
         mock_popen.return_value = mock_process
 
-        # Mock extraction to raise an error
-        with patch(
-            "pdf2mp3_gui.extract_and_clean_text", side_effect=Exception("Test error")
-        ):
-            thread.run()
+        # Mock the conversion pipeline to raise an error
+        with patch("textwave.Converter"):
+            with patch("textwave.eventloop.EventLoopThread.run", side_effect=Exception("Test error")):
+                thread.run()
 
         # Verify caffeinate was still stopped despite error
         mock_process.terminate.assert_called_once()
@@ -65,21 +64,20 @@ def test_app_close_cleans_up_threads(qtbot, qapp):
     """Test that closeEvent is implemented and handles cleanup."""
     from PyQt6.QtGui import QCloseEvent
     
-    # Patch thread creation to avoid real network calls
-    with patch('pdf2mp3_gui.VersionCheckThread'):
-        with patch('pdf2mp3_gui.AppUpdateCheckThread'):
-            window = PDF2MP3App()
-            qtbot.addWidget(window)
-            
-            # Verify closeEvent method exists
-            assert hasattr(window, 'closeEvent')
-            
-            # Create and trigger close event
-            event = QCloseEvent()
-            window.closeEvent(event)
-            
-            # Event should be accepted
-            assert event.isAccepted()
+    # Patch update checks to avoid real network calls
+    with patch('pdf2mp3_gui.UpdateCheck'):
+        window = PDF2MP3App()
+        qtbot.addWidget(window)
+        
+        # Verify closeEvent method exists
+        assert hasattr(window, 'closeEvent')
+        
+        # Create and trigger close event
+        event = QCloseEvent()
+        window.closeEvent(event)
+        
+        # Event should be accepted
+        assert event.isAccepted()
 
 
 @pytest.mark.integration
@@ -99,10 +97,13 @@ def test_conversion_thread_emits_signals(qtbot, tmp_path):
     thread.status.connect(capture_status)
 
     with patch("subprocess.Popen", return_value=MagicMock()):
-        with patch("pdf2mp3_gui.extract_and_clean_text", return_value=("test text", 1)):
-            with patch("asyncio.run"):
+        with patch("textwave.Converter"):
+            with patch("textwave.eventloop.EventLoopThread.run"):
                 with qtbot.waitSignal(thread.finished, timeout=3000):
                     thread.start()
+                # finished is emitted from run(), so let run() return before
+                # the thread object goes away
+                thread.wait(3000)
 
     # Verify status messages were emitted
     assert len(status_messages) > 0
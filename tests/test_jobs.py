@@ -0,0 +1,312 @@
+"""Tests for the conversion job queue."""
+
+import json
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from textwave.jobs import Job, JobQueue, estimate_pages
+
+
+@pytest.mark.unit
+def test_estimate_pages(sample_pdf, multi_page_pdf, tmp_path):
+    """Test that page counts are read and unreadable files count as 0."""
+    broken = tmp_path / "broken.pdf"
+    broken.write_text("not a pdf")
+
+    assert estimate_pages(sample_pdf) == 2
+    assert estimate_pages(multi_page_pdf) == 12
+    assert estimate_pages(str(broken)) == 0
+
+
+@pytest.mark.unit
+def test_shortest_document_starts_first(tmp_path):
+    """Test that queued jobs are started in order of page count."""
+    queue = JobQueue(max_running=2)
+    for name, pages in [("long", 300), ("short", 5), ("medium", 40)]:
+        queue.jobs.append(Job(tmp_path / f"{name}.pdf", tmp_path / f"{name}.mp3", pages))
+
+    started = queue.next_jobs()
+
+    assert [Path(job.pdf_path).stem for job in started] == ["short", "medium"]
+    assert all(job.state == Job.RUNNING for job in started)
+    assert queue.next_jobs() == []
+
+
+@pytest.mark.unit
+def test_finished_job_frees_a_slot(tmp_path):
+    """Test that a new job starts only when a running one finishes."""
+    queue = JobQueue(max_running=1)
+    for pages in (3, 1, 2):
+        queue.jobs.append(Job(tmp_path / f"{pages}.pdf", tmp_path / f"{pages}.mp3", pages))
+
+    first = queue.next_jobs()
+    assert [job.pages for job in first] == [1]
+
+    first[0].state = Job.DONE
+    assert [job.pages for job in queue.next_jobs()] == [2]
+
+    queue.clear_finished()
+    assert [job.pages for job in queue.jobs] == [3, 2]
+
+
+@pytest.mark.unit
+def test_queue_roundtrip_requeues_running_jobs(tmp_path):
+    """Test that a saved queue restores unfinished jobs as queued."""
+    queue = JobQueue(max_running=1)
+    for pages in (1, 2, 3):
+        queue.jobs.append(Job(tmp_path / f"{pages}.pdf", tmp_path / f"{pages}.mp3", pages))
+    done, running = queue.jobs[0], queue.jobs[1]
+    done.state = Job.DONE
+    running.state = Job.RUNNING
+
+    restored = JobQueue.from_list(json.loads(json.dumps(queue.to_list())), 3)
+
+    assert [job.pages for job in restored.jobs] == [2, 3]
+    assert all(job.state == Job.QUEUED for job in restored.jobs)
+    assert restored.max_running == 3
+
+
+@pytest.mark.unit
+def test_uncounted_jobs_hold_back_scheduling(tmp_path):
+    """Test that no job starts until every queued job has been counted."""
+    queue = JobQueue(max_running=2)
+    queue.jobs.append(Job(tmp_path / "long.pdf", tmp_path / "long.mp3", 300))
+    uncounted = queue.add(tmp_path / "new.pdf", tmp_path / "new.mp3")
+
+    assert queue.uncounted() == [uncounted]
+    assert queue.next_jobs() == []
+
+    uncounted.pages = 4
+    assert [job.pages for job in queue.next_jobs()] == [4, 300]
+
+
+@pytest.mark.gui
+def test_gui_queues_several_pdfs(qtbot, qapp, tmp_path, sample_pdf, multi_page_pdf):
+    """Test that opening several PDFs queues and schedules them."""
+    from pdf2mp3_gui import PDF2MP3App
+
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+
+    with patch("pdf2mp3_gui.ConversionThread") as mock_thread_class:
+        mock_thread_class.return_value = MagicMock()
+        window = PDF2MP3App()
+        qtbot.addWidget(window)
+        window.set_max_running_jobs(1)
+
+        with patch(
+            "pdf2mp3_gui.QFileDialog.getExistingDirectory", return_value=str(out_dir)
+        ):
+            window.open_pdfs([multi_page_pdf, sample_pdf])
+
+        # Only one slot, taken by the shorter document once both are counted
+        qtbot.waitUntil(lambda: mock_thread_class.call_count == 1)
+        assert mock_thread_class.call_args[0][0] == sample_pdf
+        assert window.queue_table.rowCount() == 2
+        assert not window.queue_widget.isHidden()
+
+        short_job = window.job_queue.with_state(Job.RUNNING)[0]
+        window.job_finished(short_job, True, "done")
+
+        assert mock_thread_class.call_count == 2
+        assert mock_thread_class.call_args[0][0] == multi_page_pdf
+
+        # The unfinished job is saved and picked up by a new window
+        restored = PDF2MP3App()
+        qtbot.addWidget(restored)
+
+        assert [job.pdf_path for job in restored.job_queue.jobs] == [multi_page_pdf]
+        assert mock_thread_class.call_count == 3
+
+
+@pytest.mark.gui
+def test_gui_counts_pages_in_the_background(qtbot, qapp, tmp_path, sample_pdf):
+    """Test that queuing PDFs returns before their pages are counted, and the
+    table and scheduling catch up once the counts come in."""
+    from pdf2mp3_gui import PDF2MP3App
+
+    def slow_estimate(pdf_path):
+        time.sleep(0.5)
+        return 7
+
+    with patch("pdf2mp3_gui.ConversionThread") as mock_thread_class, patch(
+        "textwave.jobs.estimate_pages", slow_estimate
+    ):
+        window = PDF2MP3App()
+        qtbot.addWidget(window)
+
+        start = time.perf_counter()
+        with patch(
+            "pdf2mp3_gui.QFileDialog.getExistingDirectory", return_value=str(tmp_path)
+        ):
+            window.queue_pdfs([sample_pdf])
+
+        assert time.perf_counter() - start < 0.4
+        assert window.queue_table.item(0, 1).text() == "?"
+        assert mock_thread_class.call_count == 0
+
+        qtbot.waitUntil(lambda: mock_thread_class.call_count == 1)
+        assert window.queue_table.item(0, 1).text() == "7"
+        assert window.job_queue.jobs[0].pages == 7
+
+
+@pytest.mark.gui
+def test_gui_jobs_share_one_converter(
+    qtbot, qapp, tmp_path, sample_pdf, multi_page_pdf, fake_communicate
+):
+    """Test that parallel jobs share one extraction pool, session limit and
+    cache, so together they stay within one conversion's sessions."""
+    from pdf2mp3_gui import ConversionThread, PDF2MP3App
+    from textwave import SynthesisCache, split_text_into_chunks
+    from textwave.synthesis import MAX_CONCURRENT_SESSIONS
+
+    with patch("pdf2mp3_gui.ConversionThread") as mock_thread_class:
+        window = PDF2MP3App()
+        qtbot.addWidget(window)
+        window.set_max_running_jobs(2)
+        with patch(
+            "pdf2mp3_gui.QFileDialog.getExistingDirectory", return_value=str(tmp_path)
+        ):
+            window.queue_pdfs([multi_page_pdf, sample_pdf])
+        qtbot.waitUntil(lambda: mock_thread_class.call_count == 2)
+
+    converter = window.converter
+    assert [call.args[4] for call in mock_thread_class.call_args_list] == [
+        converter,
+        converter,
+    ]
+    assert converter.executor is not None and converter.limiter is not None
+
+    # Two conversions of the same document, with nothing cached yet
+    converter.cache = SynthesisCache(tmp_path / "cache")
+    threads = [
+        ConversionThread(
+            multi_page_pdf, str(tmp_path / f"{i}.mp3"), converter=converter
+        )
+        for i in range(2)
+    ]
+    with patch(
+        "textwave.pipeline.iter_text_chunks",
+        lambda text: split_text_into_chunks(text, max_chars=50),
+    ), patch("subprocess.Popen", return_value=MagicMock()):
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            assert thread.wait(10000)
+
+    assert (tmp_path / "0.mp3").exists() and (tmp_path / "1.mp3").exists()
+    assert fake_communicate.max_active <= MAX_CONCURRENT_SESSIONS
+
+
+@pytest.mark.gui
+def test_gui_job_thread_outlives_its_finished_signal(
+    qtbot, qapp, tmp_path, sample_pdf, fake_communicate
+):
+    """Test that a job's thread is kept until run() has returned, even when
+    stopping caffeinate takes a while after the job reports it finished."""
+    import gc
+
+    from pdf2mp3_gui import PDF2MP3App
+    from textwave import SynthesisCache
+
+    caffeinate = MagicMock()
+    caffeinate.wait.side_effect = lambda timeout=None: time.sleep(0.3)
+
+    with patch("subprocess.Popen", return_value=caffeinate):
+        window = PDF2MP3App()
+        qtbot.addWidget(window)
+        window.shared_converter().cache = SynthesisCache(tmp_path / "cache")
+        with patch(
+            "pdf2mp3_gui.QFileDialog.getExistingDirectory", return_value=str(tmp_path)
+        ):
+            window.queue_pdfs([sample_pdf])
+
+        job = window.job_queue.jobs[0]
+        qtbot.waitUntil(lambda: job.state == Job.DONE, timeout=10000)
+        gc.collect()
+        assert job in window.job_threads  # Still stopping caffeinate
+
+        qtbot.waitUntil(lambda: not window.job_threads, timeout=5000)
+
+    assert (tmp_path / (Path(sample_pdf).stem + ".mp3")).exists()
+
+
+@pytest.mark.gui
+def test_gui_jobs_reuse_edge_tts_connections(
+    qtbot, qapp, tmp_path, multi_page_pdf, edge_tts_server
+):
+    """Test that conversions from the window share one connection pool, so
+    chunks reuse open connections, and closing the window closes them."""
+    from pdf2mp3_gui import PDF2MP3App
+    from textwave import SynthesisCache, split_text_into_chunks
+
+    with patch("subprocess.Popen", return_value=MagicMock()), patch(
+        "textwave.pipeline.iter_text_chunks",
+        lambda text: split_text_into_chunks(text, max_chars=50),
+    ):
+        window = PDF2MP3App()
+        qtbot.addWidget(window)
+        window.shared_converter().cache = SynthesisCache(tmp_path / "cache")
+        pool = window.connection_pool
+        try:
+            with patch(
+                "pdf2mp3_gui.QFileDialog.getExistingDirectory",
+                return_value=str(tmp_path),
+            ):
+                window.queue_pdfs([multi_page_pdf])
+
+            job = window.job_queue.jobs[0]
+            qtbot.waitUntil(lambda: job.state == Job.DONE, timeout=10000)
+            qtbot.waitUntil(lambda: not window.job_threads, timeout=5000)
+        finally:
+            # Open connections would hold up stopping the server
+            window.close()
+
+    assert edge_tts_server.requests > edge_tts_server.connects
+    assert pool.reused == edge_tts_server.requests - edge_tts_server.connects
+    assert pool.idle == [] and pool.session is None
+
+
+@pytest.mark.gui
+def test_gui_cancels_selected_jobs(qtbot, qapp, tmp_path, sample_pdf, multi_page_pdf):
+    """Test that cancelling selected rows stops a running job and takes a
+    queued one off the queue, without starting anything in their place."""
+    from pdf2mp3_gui import PDF2MP3App
+
+    with patch("pdf2mp3_gui.ConversionThread") as mock_thread_class:
+        thread = mock_thread_class.return_value
+        thread.cancel_token.cancelled = False
+        window = PDF2MP3App()
+        qtbot.addWidget(window)
+        window.set_max_running_jobs(1)
+        with patch(
+            "pdf2mp3_gui.QFileDialog.getExistingDirectory", return_value=str(tmp_path)
+        ):
+            window.open_pdfs([multi_page_pdf, sample_pdf])
+        qtbot.waitUntil(lambda: mock_thread_class.call_count == 1)
+        running, queued = window.job_queue.jobs[1], window.job_queue.jobs[0]
+        assert (running.state, queued.state) == (Job.RUNNING, Job.QUEUED)
+
+        window.queue_table.selectAll()
+        window.cancel_selected_jobs()
+
+        thread.cancel.assert_called_once()
+        assert queued.state == Job.CANCELLED
+        assert window.queue_table.cellWidget(0, 2).format() == "Cancelled"
+        assert running.state == Job.RUNNING  # Until its conversion stops
+
+        thread.cancel_token.cancelled = True
+        window.job_finished(running, False, "Conversion cancelled")
+
+        assert running.state == Job.CANCELLED
+        assert mock_thread_class.call_count == 1
+        assert window.job_queue.to_list() == []
+
+        window.clear_finished_jobs()
+        assert window.job_queue.jobs == []
@@ -0,0 +1,111 @@
+"""Tests for the write-behind audio writer."""
+
+import asyncio
+import io
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from textwave import convert_pdf_async, split_text_into_chunks
+from textwave.output import AudioWriter
+
+
+class SlowFile(io.BytesIO):
+    """In-memory file whose writes take `delay` seconds, like a slow disk."""
+
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+        self.calls = 0
+
+    def writelines(self, buffers):
+        time.sleep(self.delay)
+        self.calls += 1
+        super().writelines(buffers)
+
+
+class BrokenFile(io.BytesIO):
+    def writelines(self, buffers):
+        raise OSError("No space left on device")
+
+
+@pytest.mark.unit
+def test_chunks_are_batched_into_buffers():
+    """Test that small writes are collected into buffer_size batches and
+    their tokens are passed on once written."""
+    f = SlowFile(0)
+    flushed = []
+
+    async def main():
+        writer = AudioWriter(f, buffer_size=100, on_flush=flushed.append)
+        for i in range(10):
+            await writer.write(bytes([i]) * 30, i)
+        await writer.close()
+        return writer
+
+    writer = asyncio.run(main())
+
+    assert f.getvalue() == b"".join(bytes([i]) * 30 for i in range(10))
+    assert f.calls == writer.flushes == 3
+    assert flushed == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+
+@pytest.mark.unit
+def test_slow_disk_does_not_block_event_loop():
+    """Test that writes return while the writer thread is still busy."""
+    f = SlowFile(0.2)
+
+    async def main():
+        writer = AudioWriter(f, buffer_size=1)
+        start = time.monotonic()
+        for _ in range(3):
+            await writer.write(b"audio")
+        queued = time.monotonic() - start
+        await writer.close()
+        return queued
+
+    assert asyncio.run(main()) < 0.1
+    assert f.getvalue() == b"audio" * 3
+
+
+@pytest.mark.unit
+def test_write_errors_are_raised():
+    """Test that a failed write surfaces on close."""
+
+    async def main():
+        writer = AudioWriter(BrokenFile(), buffer_size=1)
+        await writer.write(b"audio")
+        await writer.close()
+
+    with pytest.raises(OSError, match="No space left"):
+        asyncio.run(main())
+
+
+@pytest.mark.unit
+def test_buffer_size_does_not_change_output(multi_page_pdf, tmp_path, fake_communicate):
+    """Test that conversions write the same file whatever the buffer size."""
+
+    def small_chunks(text):
+        return split_text_into_chunks(text, max_chars=50)
+
+    outputs = []
+    for buffer_size in (1, 64 * 1024 * 1024):
+        output = tmp_path / f"{buffer_size}.mp3"
+        with patch("textwave.pipeline.iter_text_chunks", small_chunks):
+            asyncio.run(
+                convert_pdf_async(
+                    multi_page_pdf,
+                    str(output),
+                    lambda p, m: None,
+                    output_buffer_size=buffer_size,
+                )
+            )
+        outputs.append(output.read_bytes())
+
+    assert outputs[0] == outputs[1]
+    assert b"Chapter 12" in outputs[0]
@@ -1,14 +1,18 @@
 """Tests for PDF text extraction functionality."""
 
+import asyncio
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-# Add parent directory to path to import pdf2mp3_gui
+# Add parent directory to path to import textwave
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from pdf2mp3_gui import extract_and_clean_text
+from textwave import PageTexts, convert_pdf_async, extract_and_clean_text
+from textwave.extraction import PageCleaner, clean_page_text
+from textwave.segmentation import split_text_into_chunks
 
 
 @pytest.mark.unit
@@ -61,3 +65,255 @@ def test_extract_text_from_nonexistent_file():
     """Test error handling for non-existent files."""
     with pytest.raises(Exception):
         extract_and_clean_text("/nonexistent/file.pdf")
+
+
+@pytest.mark.unit
+def test_clean_page_text_removes_page_number_lines():
+    """Test that page number lines are dropped and the rest joined."""
+    assert clean_page_text("Heading\n12\nBody text\nPage 3") == "Heading Body text"
+    assert clean_page_text("") is None
+    assert clean_page_text(None) is None
+
+
+@pytest.mark.unit
+def test_clean_page_text_recognizes_page_number_styles():
+    """Test that roman numerals, "Page X of Y" and dashed numbers are
+    recognized as page numbers, but ordinary short lines are not."""
+    for line in ["xiv", "- IV -", "Page XII", "Page 3 of 10", "page 7/12", " 4 "]:
+        assert clean_page_text(f"Body\n{line}") == "Body", line
+    for line in ["I think so", "Chapter 4", "3 apples", "Living", "I", "CD", "Vi"]:
+        assert clean_page_text(f"Body\n{line}") == f"Body {line}", line
+
+
+@pytest.mark.unit
+def test_clean_page_text_keeps_paragraph_breaks():
+    """Test that blank lines are kept as a single paragraph break."""
+    text = "First line\ncontinues.\n\n\nNext paragraph\n2\n"
+
+    assert clean_page_text(text) == "First line continues.\n\nNext paragraph"
+
+
+def report_page(i):
+    return "\n".join(
+        [
+            "ACME Corp Annual Report 2024",
+            f"Section {i}: findings for region {i}",
+            f"Revenue in region {i} grew by {i * 3} percent over the year.",
+            "Confidential - do not distribute",
+            f"Page {i} of 10",
+        ]
+    )
+
+
+@pytest.mark.unit
+def test_repeated_headers_and_footers_are_removed():
+    """Test that running headers and footers are dropped from every page,
+    including the first ones, and the removed characters are counted."""
+    cleaner = PageCleaner()
+    pages = []
+    for i in range(10):
+        pages.extend(cleaner.add(i, report_page(i + 1)))
+        assert len(pages) == max(0, i + 1 - cleaner.lookahead)
+    pages.extend(cleaner.finish())
+
+    assert [page.index for page in pages] == list(range(10))
+    assert pages[0].text == (
+        "Section 1: findings for region 1 "
+        "Revenue in region 1 grew by 3 percent over the year."
+    )
+    assert all("ACME" not in page.text for page in pages)
+    assert all("Confidential" not in page.text for page in pages)
+    raw_chars = sum(len(report_page(i + 1)) for i in range(10))
+    assert cleaner.chars_removed == raw_chars - sum(page.chars for page in pages)
+
+
+@pytest.mark.unit
+def test_occasional_lines_are_kept():
+    """Test that a heading seen on only a couple of nearby pages and short
+    pages made of nothing but edge lines are left alone."""
+    cleaner = PageCleaner()
+    texts = [
+        "Chapter 1\nIt was a dark night.\nThe wind howled.",
+        "Chapter 2\nMorning came.\nThe sun rose.",
+        "A quiet day.\nNothing happened.\nThe end of it.",
+        "Short page one",
+        "Short page two",
+        "Short page three",
+    ]
+    pages = []
+    for i, text in enumerate(texts):
+        pages.extend(cleaner.add(i, text))
+    pages.extend(cleaner.finish())
+
+    assert [page.text for page in pages] == [text.replace("\n", " ") for text in texts]
+    assert cleaner.chars_removed == 0
+
+
+def clean_pages(texts):
+    cleaner = PageCleaner()
+    pages = []
+    for i, text in enumerate(texts):
+        pages.extend(cleaner.add(i, text))
+    pages.extend(cleaner.finish())
+    return cleaner, pages
+
+
+@pytest.mark.unit
+def test_numbered_lines_at_page_edges_are_kept():
+    """Test that numbered headings, numbered sentences and numeric table
+    rows at the top and bottom of pages are not taken for boilerplate."""
+    texts = [
+        "\n".join(
+            [
+                f"Question {2 * i + 1}",
+                f"Sentence 0 of part {3 * i} sets out the problem.",
+                "The answer is in the table below.",
+                f"{2010 + 2 * i} 12.{i} 13.{i}",
+                f"{2011 + 2 * i} 12.{i + 1} 13.{i + 1}",
+            ]
+        )
+        for i in range(10)
+    ]
+
+    cleaner, pages = clean_pages(texts)
+
+    assert [page.text for page in pages] == [text.replace("\n", " ") for text in texts]
+    assert cleaner.chars_removed == 0
+
+
+@pytest.mark.unit
+def test_running_headers_with_page_numbers_are_removed():
+    """Test that a header whose number goes up with the pages is dropped,
+    whatever the page numbering starts at."""
+    texts = [
+        f"Annual Report 2024 - {i + 7}\nPage {i} of the body.\nIt ends at {2 * i}."
+        for i in range(10)
+    ]
+
+    _, pages = clean_pages(texts)
+
+    assert [page.text for page in pages] == [
+        f"Page {i} of the body. It ends at {2 * i}." for i in range(10)
+    ]
+
+
+@pytest.mark.unit
+def test_parallel_extraction_matches_serial(multi_page_pdf):
+    """Test that the process pool returns the same text in page order."""
+    serial_text, serial_pages = extract_and_clean_text(multi_page_pdf)
+
+    with patch("textwave.extraction.PARALLEL_EXTRACTION_MIN_PAGES", 2):
+        parallel_text, parallel_pages = extract_and_clean_text(
+            multi_page_pdf, workers=3
+        )
+
+    assert parallel_pages == serial_pages == 12
+    assert parallel_text == serial_text
+    assert parallel_text.index("Chapter 2 ") < parallel_text.index("Chapter 11 ")
+
+
+@pytest.mark.unit
+def test_small_documents_are_extracted_serially(sample_pdf):
+    """Test that short PDFs don't pay for starting a process pool."""
+    with patch("textwave.extraction.extract_pages_in_parallel") as mock_parallel:
+        text, page_count = extract_and_clean_text(sample_pdf, workers=8)
+
+    mock_parallel.assert_not_called()
+    assert page_count == 2
+    assert "Test PDF Content" in text
+
+
+@pytest.mark.unit
+def test_pages_are_yielded_as_records(multi_page_pdf):
+    """Test that each page comes with its index, text and character count,
+    and that joining them gives the same text as extract_and_clean_text."""
+    pages = PageTexts(multi_page_pdf)
+    records = list(pages)
+
+    assert pages.total_pages == 12
+    assert [page.index for page in records] == list(range(12))
+    assert all(page.chars == len(page.text) for page in records)
+    assert "Chapter 3 " in records[2].text
+    assert pages.text() == extract_and_clean_text(multi_page_pdf)[0]
+
+
+@pytest.mark.unit
+def test_pages_without_text_are_skipped(tmp_path):
+    """Test that blank pages produce no record but keep later indices."""
+    from reportlab.pdfgen import canvas
+
+    pdf_path = tmp_path / "blank.pdf"
+    c = canvas.Canvas(str(pdf_path))
+    c.drawString(100, 750, "First")
+    c.showPage()
+    c.showPage()
+    c.drawString(100, 750, "Third")
+    c.showPage()
+    c.save()
+
+    records = list(PageTexts(str(pdf_path)))
+
+    assert [(page.index, page.text.strip()) for page in records] == [
+        (0, "First"),
+        (2, "Third"),
+    ]
+
+
+@pytest.mark.unit
+def test_vertical_gaps_become_paragraph_breaks(tmp_path):
+    """Test that a gap between lines of a PDF page starts a paragraph, so
+    segmentation can end chunks there."""
+    from reportlab.pdfgen import canvas
+
+    pdf_path = tmp_path / "paragraphs.pdf"
+    c = canvas.Canvas(str(pdf_path))
+    lines = [
+        (750, "The first paragraph starts here"),
+        (736, "and ends on this line."),
+        (700, "The second paragraph follows"),
+        (686, "after a gap."),
+    ]
+    for y, line in lines:
+        c.drawString(100, y, line)
+    c.save()
+
+    text = PageTexts(str(pdf_path)).text()
+
+    assert split_text_into_chunks(text, max_chars=1000, min_chars=10) == [
+        "The first paragraph starts here and ends on this line.",
+        "The second paragraph follows after a gap.",
+    ]
+
+
+@pytest.mark.unit
+def test_conversion_reports_removed_boilerplate(tmp_path, fake_communicate):
+    """Test that headers and footers are left out of the synthesized text
+    and the number of characters skipped is reported."""
+    from reportlab.pdfgen import canvas
+
+    pdf_path = tmp_path / "report.pdf"
+    c = canvas.Canvas(str(pdf_path))
+    for i in range(1, 11):
+        for line_number, line in enumerate(report_page(i).split("\n")):
+            c.drawString(100, 750 - 20 * line_number, line)
+        c.showPage()
+    c.save()
+
+    pages = PageTexts(str(pdf_path))
+    assert "ACME" not in pages.text()
+    assert pages.chars_removed > 0
+
+    statuses = []
+    output = tmp_path / "report.mp3"
+    asyncio.run(
+        convert_pdf_async(
+            str(pdf_path), str(output), lambda p, m: None, statuses.append
+        )
+    )
+
+    assert b"ACME" not in output.read_bytes()
+    assert b"Revenue in region 7" in output.read_bytes()
+    assert any(
+        message.startswith(f"Skipped {pages.chars_removed:,} characters")
+        for message in statuses
+    )
@@ -0,0 +1,153 @@
+"""Tests for progress estimates and throttled progress reporting."""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from textwave import ProgressThrottle, convert_pdf_async, split_text_into_chunks
+from textwave.progress import TextProgress, format_duration
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+def test_updates_are_coalesced_to_max_rate():
+    """Test that bursts of updates are limited to max_rate per second."""
+    clock = FakeClock()
+    delivered = []
+    throttle = ProgressThrottle(
+        lambda percent, message: delivered.append(percent), max_rate=10, clock=clock
+    )
+
+    # 1000 updates over one second
+    for i in range(1000):
+        clock.now = i / 1000
+        throttle(i // 10, f"update {i}")
+
+    assert throttle.received == 1000
+    assert len(delivered) == 10
+    assert delivered[0] == 0
+
+
+@pytest.mark.unit
+def test_final_state_is_always_delivered():
+    """Test that completion is delivered immediately and flush delivers the
+    latest coalesced update."""
+    clock = FakeClock()
+    delivered = []
+    throttle = ProgressThrottle(
+        lambda percent, message: delivered.append((percent, message)), clock=clock
+    )
+
+    throttle(10, "first")
+    throttle(20, "second")
+    throttle(30, "third")
+    assert delivered == [(10, "first")]
+
+    throttle.flush()
+    assert delivered[-1] == (30, "third")
+
+    throttle(100, "Complete!")
+    assert delivered[-1] == (100, "Complete!")
+
+    # Nothing left to deliver
+    throttle.flush()
+    assert len(delivered) == 3
+
+
+@pytest.mark.unit
+def test_zero_rate_delivers_everything():
+    """Test that max_rate=0 turns throttling off."""
+    delivered = []
+    throttle = ProgressThrottle(
+        lambda percent, message: delivered.append(percent), max_rate=0
+    )
+
+    for i in range(50):
+        throttle(i, "")
+
+    assert delivered == list(range(50))
+
+
+@pytest.mark.unit
+def test_format_duration():
+    """Test that durations are formatted as M:SS or H:MM:SS."""
+    assert format_duration(5) == "0:05"
+    assert format_duration(125.4) == "2:05"
+    assert format_duration(3723) == "1:02:03"
+
+
+@pytest.mark.unit
+def test_text_progress_throughput_and_eta():
+    """Test that progress, chars/s and ETA follow the synthesized text, not
+    counting text skipped on resume towards throughput."""
+    clock = FakeClock()
+    progress = TextProgress(total_chars=10_000, clock=clock)
+
+    assert progress.percent == 0
+    assert progress.eta() is None
+
+    progress.skip(2_000)
+    clock.now = 10.0
+    progress.advance(1_000)
+
+    assert progress.percent == pytest.approx(30.0)
+    assert progress.chars_per_second() == pytest.approx(100.0)
+    assert progress.eta() == pytest.approx(70.0)
+    assert "100 chars/s" in progress.message(0)
+    assert "ETA 1:10" in progress.message(0)
+
+    progress.advance(7_000)
+    assert progress.percent == 99.9
+
+
+@pytest.mark.unit
+def test_pipeline_progress_follows_synthesized_text(multi_page_pdf, tmp_path, fake_communicate):
+    """Test that pipeline progress is driven by text synthesized and ends
+    close to 100% before completion is reported."""
+    updates = []
+
+    def small_chunks(text):
+        return split_text_into_chunks(text, max_chars=50)
+
+    with patch("textwave.pipeline.iter_text_chunks", small_chunks):
+        asyncio.run(
+            convert_pdf_async(
+                multi_page_pdf,
+                str(tmp_path / "out.mp3"),
+                lambda percent, message: updates.append((percent, message)),
+                concurrency=2,
+            )
+        )
+
+    percents = [percent for percent, _ in updates]
+    assert percents[-1] == 100
+    assert max(percents[:-1]) <= 99
+    assert percents[-2] >= 90
+    assert all("chars/s" in message for _, message in updates)
+
+
+@pytest.mark.gui
+def test_status_log_is_bounded(qtbot, qapp):
+    """Test that the status log drops its oldest lines."""
+    from pdf2mp3_gui import STATUS_LOG_MAX_LINES, PDF2MP3App
+
+    window = PDF2MP3App()
+    qtbot.addWidget(window)
+
+    for i in range(STATUS_LOG_MAX_LINES * 2):
+        window.update_progress(0, f"line {i}")
+
+    assert window.status_text.document().blockCount() <= STATUS_LOG_MAX_LINES
+    assert f"line {STATUS_LOG_MAX_LINES * 2 - 1}" in window.status_text.toPlainText()
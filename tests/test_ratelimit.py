@@ -0,0 +1,95 @@
+"""Tests for the cross-process synthesis rate limiter."""
+
+import asyncio
+import concurrent.futures
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from textwave import RateLimiter
+from textwave.synthesis import synthesize_in_order
+
+
+async def acquire_all(limiter, count, chars=1):
+    """Acquire `count` times in turn, returning when each was granted."""
+    granted = []
+    for _ in range(count):
+        await limiter.acquire(chars)
+        granted.append(time.time())
+    return granted
+
+
+def acquire_in_process(path, count):
+    limiter = RateLimiter(requests_per_second=20, path=path, burst=0.25)
+    return asyncio.run(acquire_all(limiter, count))
+
+
+@pytest.mark.unit
+def test_requests_burst_then_follow_the_rate(tmp_path):
+    """Test that an idle limiter allows a burst, then paces requests."""
+    limiter = RateLimiter(requests_per_second=10, path=tmp_path / "rate.db", burst=0.5)
+
+    granted = asyncio.run(acquire_all(limiter, 15))
+
+    assert granted[4] - granted[0] < 0.1  # The burst of 5
+    assert 0.8 <= granted[-1] - granted[0] < 1.5  # Then 10 at 10 per second
+    assert limiter.waits == 10
+
+
+@pytest.mark.unit
+def test_characters_are_limited_per_second(tmp_path):
+    """Test that long requests wait for enough character budget."""
+    limiter = RateLimiter(chars_per_second=1000, path=tmp_path / "rate.db")
+
+    start = time.perf_counter()
+    asyncio.run(acquire_all(limiter, 2, chars=1000))
+
+    assert 0.8 <= time.perf_counter() - start < 1.5
+    assert limiter.waits == 1
+
+
+@pytest.mark.unit
+def test_invalid_rates_are_rejected(tmp_path):
+    """Test that a rate of zero or less is refused up front."""
+    with pytest.raises(ValueError, match="requests per second"):
+        RateLimiter(requests_per_second=0, path=tmp_path / "rate.db")
+
+
+@pytest.mark.unit
+def test_processes_share_one_budget(tmp_path):
+    """Test that two processes using the same database together stay
+    within the rate, instead of each getting the full rate."""
+    path = tmp_path / "rate.db"
+    RateLimiter(requests_per_second=20, path=path)  # Create the table up front
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        runs = list(executor.map(acquire_in_process, [path, path], [15, 15]))
+
+    granted = sorted(runs[0] + runs[1])
+    # 30 requests at 20 per second, after a burst of 5, take 1.25s; with a
+    # budget each, the processes would finish in about 0.5s
+    assert granted[-1] - granted[0] >= 1.0
+
+
+@pytest.mark.unit
+def test_synthesis_consults_the_limiter(tmp_path, fake_communicate):
+    """Test that every chunk sent for synthesis waits for the rate limit."""
+    limiter = RateLimiter(chars_per_second=500, path=tmp_path / "rate.db", burst=0.1)
+    chunks = ["x" * 50] * 6
+
+    async def synthesize():
+        return [
+            audio
+            async for _, audio in synthesize_in_order(chunks, rate_limiter=limiter)
+        ]
+
+    start = time.perf_counter()
+    audio = asyncio.run(synthesize())
+
+    assert audio == [chunk.encode() for chunk in chunks]
+    assert limiter.waits == 5
+    assert time.perf_counter() - start >= 0.45
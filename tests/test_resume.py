@@ -0,0 +1,143 @@
+"""Tests for resuming interrupted conversions."""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf2mp3_gui import PDF2MP3App
+from textwave import (
+    JobManifest,
+    RetryPolicy,
+    convert_pdf_async,
+    resume_conversion_async,
+    split_text_into_chunks,
+)
+from textwave.manifest import manifest_path
+
+
+def small_chunks(text):
+    return split_text_into_chunks(text, max_chars=50)
+
+
+def run_conversion(pdf_path, output_path, **kwargs):
+    with patch("textwave.pipeline.iter_text_chunks", small_chunks):
+        asyncio.run(
+            convert_pdf_async(pdf_path, str(output_path), lambda p, m: None, **kwargs)
+        )
+
+
+@pytest.fixture
+def interrupted_conversion(multi_page_pdf, tmp_path, fake_communicate):
+    """Run a conversion that fails partway through the document."""
+    output = tmp_path / "book.mp3"
+    original_stream = fake_communicate.stream
+
+    async def failing_stream(self):
+        if "Chapter 7" in self.text:
+            raise ConnectionResetError("Connection reset by peer")
+        async for message in original_stream(self):
+            yield message
+
+    with patch.object(fake_communicate, "stream", failing_stream):
+        with pytest.raises(ConnectionResetError):
+            run_conversion(
+                multi_page_pdf,
+                output,
+                concurrency=1,
+                retry_policy=RetryPolicy(max_attempts=1),
+            )
+
+    return output
+
+
+@pytest.mark.unit
+def test_failed_conversion_leaves_manifest(interrupted_conversion):
+    """Test that completed chunks are checkpointed when a job fails."""
+    manifest = JobManifest.load(interrupted_conversion)
+
+    assert manifest is not None
+    assert manifest.completed_chunks > 0
+    assert manifest.bytes_written == interrupted_conversion.stat().st_size
+    assert b"Chapter 6" in interrupted_conversion.read_bytes()
+
+
+@pytest.mark.unit
+def test_resume_skips_completed_chunks(
+    interrupted_conversion, multi_page_pdf, tmp_path, fake_communicate
+):
+    """Test that resuming only synthesizes the unfinished chunks."""
+    completed = JobManifest.load(interrupted_conversion).completed_chunks
+    synthesized = []
+    original_init = fake_communicate.__init__
+
+    def recording_init(self, text, voice, **params):
+        synthesized.append(text)
+        original_init(self, text, voice, **params)
+
+    with patch.object(fake_communicate, "__init__", recording_init):
+        with patch("textwave.pipeline.iter_text_chunks", small_chunks):
+            asyncio.run(
+                resume_conversion_async(str(interrupted_conversion), lambda p, m: None)
+            )
+        resumed = len(synthesized)
+
+        fresh_output = tmp_path / "fresh.mp3"
+        run_conversion(multi_page_pdf, fresh_output)
+        total = len(synthesized) - resumed
+
+    assert interrupted_conversion.read_bytes() == fresh_output.read_bytes()
+    assert resumed == total - completed
+    assert not any("Chapter 1 " in text for text in synthesized[:resumed])
+    assert not manifest_path(interrupted_conversion).exists()
+
+
+@pytest.mark.unit
+def test_resume_starts_over_when_source_changed(
+    interrupted_conversion, multi_page_pdf, tmp_path, fake_communicate
+):
+    """Test that a modified PDF is converted from scratch."""
+    stat = os.stat(multi_page_pdf)
+    os.utime(multi_page_pdf, (stat.st_atime, stat.st_mtime + 10))
+
+    run_conversion(multi_page_pdf, interrupted_conversion, resume=True)
+
+    fresh_output = tmp_path / "fresh.mp3"
+    run_conversion(multi_page_pdf, fresh_output)
+    assert interrupted_conversion.read_bytes() == fresh_output.read_bytes()
+
+
+@pytest.mark.unit
+def test_resume_without_manifest_fails(tmp_path):
+    """Test that resuming requires an interrupted conversion."""
+    with pytest.raises(Exception, match="No interrupted conversion"):
+        asyncio.run(
+            resume_conversion_async(str(tmp_path / "none.mp3"), lambda p, m: None)
+        )
+
+
+@pytest.mark.gui
+def test_resume_button_shown_after_failure(qtbot, qapp, interrupted_conversion):
+    """Test that a failed conversion with a checkpoint offers to resume."""
+    window = PDF2MP3App()
+    qtbot.addWidget(window)
+
+    manifest = JobManifest.load(interrupted_conversion)
+    window.set_pdf(manifest.source)
+    window.output_path = str(interrupted_conversion)
+    window.thread = MagicMock(engine=None)
+    window.conversion_finished(False, "Error: Connection reset by peer")
+
+    assert not window.resume_btn.isHidden()
+
+    with patch.object(window, "start_conversion") as mock_start:
+        window.resume_btn.click()
+
+    mock_start.assert_called_once_with(
+        str(interrupted_conversion), resume=True, engine=None
+    )
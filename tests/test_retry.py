@@ -0,0 +1,175 @@
+"""Tests for retrying transient synthesis failures."""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import aiohttp
+import edge_tts
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from textwave import RetryPolicy, convert_pdf_async
+from textwave.synthesis import synthesize_chunk
+
+
+def response_error(status):
+    return aiohttp.ClientResponseError(None, (), status=status)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "error",
+    [
+        asyncio.TimeoutError(),
+        ConnectionResetError("Connection reset by peer"),
+        aiohttp.ServerDisconnectedError(),
+        edge_tts.exceptions.WebSocketError("closed"),
+        response_error(429),
+        response_error(503),
+    ],
+)
+def test_transient_errors_are_retried(error):
+    """Test that timeouts, resets, throttling and 5xx are transient."""
+    assert RetryPolicy.is_transient(error)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "error",
+    [
+        response_error(401),
+        response_error(403),
+        ValueError("Invalid voice"),
+        edge_tts.exceptions.NoAudioReceived("No audio"),
+    ],
+)
+def test_permanent_errors_are_not_retried(error):
+    """Test that authorization and other errors fail fast."""
+    assert not RetryPolicy.is_transient(error)
+
+
+@pytest.mark.unit
+def test_backoff_is_capped_and_jittered():
+    """Test that delays grow exponentially up to the cap."""
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+
+    delays = [policy.backoff(attempt) for attempt in range(1, 10) for _ in range(20)]
+
+    assert all(0 <= delay <= 5.0 for delay in delays)
+    assert len(set(delays)) > 1
+    assert all(policy.backoff(1) <= 2.0 for _ in range(20))
+
+
+def flaky(failures, error):
+    """Build an operation that fails `failures` times before succeeding."""
+    calls = []
+
+    async def operation():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error
+        return b"audio"
+
+    return operation, calls
+
+
+@pytest.mark.unit
+def test_retry_recovers_from_transient_failures():
+    """Test that a chunk succeeds after transient failures are retried."""
+    policy = RetryPolicy(base_delay=0.001)
+    operation, calls = flaky(2, ConnectionResetError())
+
+    assert asyncio.run(policy.run(operation)) == b"audio"
+    assert len(calls) == 3
+    assert policy.retries == 2
+    assert policy.retry_delay > 0
+
+
+@pytest.mark.unit
+def test_permanent_failure_is_not_retried():
+    """Test that a permanent error is raised on the first attempt."""
+    policy = RetryPolicy(base_delay=0.001)
+    operation, calls = flaky(1, response_error(401))
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(policy.run(operation))
+    assert len(calls) == 1
+    assert policy.retries == 0
+
+
+@pytest.mark.unit
+def test_retries_stop_after_max_attempts():
+    """Test that a chunk gives up after its attempt limit."""
+    policy = RetryPolicy(max_attempts=3, base_delay=0.001)
+    operation, calls = flaky(10, asyncio.TimeoutError())
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(policy.run(operation))
+    assert len(calls) == 3
+
+
+@pytest.mark.unit
+def test_retry_budget_is_shared_by_the_job():
+    """Test that the per-job budget limits retries across chunks."""
+    policy = RetryPolicy(base_delay=0.001, budget=3)
+    first, _ = flaky(2, ConnectionResetError())
+    second, calls = flaky(2, ConnectionResetError())
+
+    asyncio.run(policy.run(first))
+    with pytest.raises(ConnectionResetError):
+        asyncio.run(policy.run(second))
+    assert len(calls) == 2
+    assert policy.retries == 3
+
+
+@pytest.mark.unit
+def test_synthesize_chunk_retries_stream(fake_communicate):
+    """Test that a dropped edge-tts stream is retried from the start."""
+    original_stream = fake_communicate.stream
+    attempts = []
+
+    async def dropping_stream(self):
+        attempts.append(1)
+        async for message in original_stream(self):
+            yield message
+            if len(attempts) == 1:
+                raise aiohttp.ServerDisconnectedError()
+
+    policy = RetryPolicy(base_delay=0.001)
+    with patch.object(fake_communicate, "stream", dropping_stream):
+        audio = asyncio.run(synthesize_chunk("Hello there.", retry_policy=policy))
+
+    assert audio == b"Hello there."
+    assert policy.retries == 1
+
+
+@pytest.mark.unit
+def test_pipeline_reports_retries(multi_page_pdf, tmp_path, fake_communicate):
+    """Test that retries are surfaced in the final progress message."""
+    original_stream = fake_communicate.stream
+    failed = set()
+
+    async def throttled_stream(self):
+        if self.text not in failed:
+            failed.add(self.text)
+            raise response_error(429)
+        async for message in original_stream(self):
+            yield message
+
+    updates = []
+    policy = RetryPolicy(base_delay=0.001)
+    with patch.object(fake_communicate, "stream", throttled_stream):
+        asyncio.run(
+            convert_pdf_async(
+                multi_page_pdf,
+                str(tmp_path / "out.mp3"),
+                lambda p, m: updates.append(m),
+                retry_policy=policy,
+            )
+        )
+
+    assert policy.retries == len(failed) > 0
+    assert f"{policy.retries} retries" in updates[-1]
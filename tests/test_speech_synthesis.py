@@ -0,0 +1,257 @@
+"""Tests for chunked, concurrent speech synthesis."""
+
+import asyncio
+import sys
+import types
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from textwave import (
+    ConversionPipeline,
+    convert_pdf_async,
+    iter_text_chunks,
+    split_text_into_chunks,
+    text_to_speech_async,
+)
+
+
+def small_chunks(text):
+    return split_text_into_chunks(text, max_chars=50)
+
+
+@pytest.mark.unit
+def test_split_text_respects_max_chars():
+    """Test that chunks never exceed the size limit."""
+    text = " ".join(f"Sentence number {i} is here." for i in range(500))
+    chunks = split_text_into_chunks(text, max_chars=200)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 200 for chunk in chunks)
+    assert " ".join(chunks) == text
+
+
+@pytest.mark.unit
+def test_split_text_breaks_at_sentence_boundaries():
+    """Test that chunks end at sentence boundaries when possible."""
+    text = "First sentence here. Second sentence here. Third sentence here."
+    chunks = split_text_into_chunks(text, max_chars=45)
+
+    assert chunks == [
+        "First sentence here. Second sentence here.",
+        "Third sentence here.",
+    ]
+
+
+@pytest.mark.unit
+def test_split_text_breaks_at_paragraphs():
+    """Test that paragraph breaks are treated as chunk boundaries."""
+    text = "A heading without a period\n\nThe paragraph body follows here"
+    chunks = split_text_into_chunks(text, max_chars=35)
+
+    assert chunks == ["A heading without a period", "The paragraph body follows here"]
+
+
+@pytest.mark.unit
+def test_split_text_splits_long_sentences_at_words():
+    """Test that a sentence longer than the limit is split between words."""
+    text = "word " * 100
+    chunks = split_text_into_chunks(text, max_chars=50)
+
+    assert all(len(chunk) <= 50 for chunk in chunks)
+    assert all(set(chunk.split()) == {"word"} for chunk in chunks)
+
+
+@pytest.mark.unit
+def test_split_text_empty():
+    """Test that empty or blank text produces no chunks."""
+    assert split_text_into_chunks("") == []
+    assert split_text_into_chunks("   \n\n  ") == []
+
+
+@pytest.mark.unit
+def test_split_text_keeps_abbreviations_decimals_and_initials():
+    """Test that periods in abbreviations, decimals and initials don't end
+    sentences."""
+    sentences = [
+        "Dr. Watson met J. R. R. Tolkien in the U.S. in May.",
+        "It cost $3.50, i.e. less than expected!",
+        "See Fig. 3 and compare with e.g. Paris.",
+        'He said "Stop."',
+        "They had walked 30.",
+    ]
+    text = " ".join(sentences)
+
+    for i in range(len(sentences)):
+        chunk = " ".join(sentences[: i + 1])
+        assert split_text_into_chunks(text, max_chars=len(chunk))[0] == chunk
+
+
+@pytest.mark.unit
+def test_split_text_ends_chunks_at_paragraphs_once_large_enough():
+    """Test that a paragraph break ends a chunk holding at least min_chars."""
+    text = "Short one.\n\nA longer paragraph here.\n\nThird paragraph."
+    chunks = split_text_into_chunks(text, max_chars=200, min_chars=20)
+
+    assert chunks == [
+        "Short one. A longer paragraph here.",
+        "Third paragraph.",
+    ]
+
+
+@pytest.mark.unit
+def test_iter_text_chunks_is_lazy():
+    """Test that chunks are yielded before the rest of the text is read."""
+    text = "A sentence that repeats. " * 400_000
+    chunks = iter_text_chunks(text, max_chars=100)
+
+    assert isinstance(chunks, types.GeneratorType)
+    assert next(chunks) == "A sentence that repeats. " * 3 + "A sentence that repeats."
+
+
+@pytest.mark.unit
+def test_text_to_speech_writes_chunks_in_order(tmp_path, fake_communicate):
+    """Test that concurrently synthesized chunks are reassembled in order."""
+    text = " ".join(f"Sentence {i:04d}." for i in range(2000))
+    output = tmp_path / "out.mp3"
+    updates = []
+
+    chunks = split_text_into_chunks(text, max_chars=100)
+    with patch(
+        "textwave.synthesis.split_text_into_chunks",
+        lambda t: split_text_into_chunks(t, max_chars=100),
+    ):
+        asyncio.run(
+            text_to_speech_async(
+                text, str(output), lambda p, m: updates.append((p, m)), 3
+            )
+        )
+
+    assert output.read_bytes() == "".join(chunks).encode()
+    assert 1 < fake_communicate.max_active <= 3
+    assert updates[-1][0] == 100
+    assert "Complete!" in updates[-1][1]
+    assert all(isinstance(p, int) and isinstance(m, str) for p, m in updates)
+
+
+@pytest.mark.unit
+def test_text_to_speech_cancels_sessions_on_failure(tmp_path, fake_communicate):
+    """Test that a failing chunk aborts the job and cancels other sessions."""
+    original_stream = fake_communicate.stream
+
+    async def failing_stream(self):
+        if "0003" in self.text:
+            raise Exception("401 Unauthorized")
+        async for message in original_stream(self):
+            yield message
+
+    text = " ".join(f"Sentence {i:04d}." for i in range(20))
+
+    with patch.object(fake_communicate, "stream", failing_stream):
+        with patch(
+            "textwave.synthesis.split_text_into_chunks",
+            lambda t: split_text_into_chunks(t, max_chars=20),
+        ):
+            with pytest.raises(Exception, match="Edge TTS service connection failed"):
+                asyncio.run(
+                    text_to_speech_async(
+                        text, str(tmp_path / "out.mp3"), lambda p, m: None, 4
+                    )
+                )
+
+    assert fake_communicate.active == 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("workers", [1, 3])
+def test_pipeline_writes_pages_in_order(
+    multi_page_pdf, tmp_path, fake_communicate, workers
+):
+    """Test that the streaming pipeline writes every page's text in order."""
+    output = tmp_path / "out.mp3"
+    updates = []
+    statuses = []
+
+    with patch("textwave.pipeline.iter_text_chunks", small_chunks):
+        with patch("textwave.pipeline.PARALLEL_EXTRACTION_MIN_PAGES", 2):
+            asyncio.run(
+                convert_pdf_async(
+                    multi_page_pdf,
+                    str(output),
+                    lambda p, m: updates.append((p, m)),
+                    statuses.append,
+                    concurrency=3,
+                    workers=workers,
+                )
+            )
+
+    audio_text = output.read_bytes().decode()
+    positions = [audio_text.index(f"Chapter {i} heading") for i in range(1, 13)]
+    assert positions == sorted(positions)
+    assert updates[-1][0] == 100
+    assert "Complete!" in updates[-1][1]
+    assert any("from 12 pages" in message for message in statuses)
+
+
+@pytest.mark.unit
+def test_pipeline_synthesizes_before_extraction_finishes(
+    multi_page_pdf, tmp_path, fake_communicate
+):
+    """Test that synthesis starts while later pages are still being parsed."""
+    pipeline = ConversionPipeline(
+        multi_page_pdf, str(tmp_path / "out.mp3"), lambda p, m: None, queue_size=1
+    )
+    pages_at_first_synthesis = []
+    original_stream = fake_communicate.stream
+
+    async def recording_stream(self):
+        pages_at_first_synthesis.append(pipeline.pages_extracted)
+        async for message in original_stream(self):
+            yield message
+
+    with patch.object(fake_communicate, "stream", recording_stream):
+        with patch("textwave.pipeline.iter_text_chunks", small_chunks):
+            asyncio.run(pipeline.run())
+
+    assert pages_at_first_synthesis[0] < 12
+    assert pipeline.pages_extracted == 12
+
+
+@pytest.mark.unit
+def test_pipeline_reports_queue_depths(multi_page_pdf, tmp_path):
+    """Test the per-stage queue depth report format."""
+    pipeline = ConversionPipeline(
+        multi_page_pdf, str(tmp_path / "out.mp3"), lambda p, m: None, concurrency=2
+    )
+
+    report = pipeline.queue_depths()
+
+    assert report == (
+        "Queues: pages 0/8, cleaned 0/8, chunks 0/8, synthesizing 0/2"
+    )
+
+
+@pytest.mark.unit
+def test_pipeline_stops_all_stages_on_failure(
+    multi_page_pdf, tmp_path, fake_communicate
+):
+    """Test that a synthesis failure stops the pipeline instead of hanging."""
+
+    async def failing_stream(self):
+        raise Exception("403 Forbidden")
+        yield
+
+    with patch.object(fake_communicate, "stream", failing_stream):
+        with patch("textwave.pipeline.iter_text_chunks", small_chunks):
+            with pytest.raises(Exception, match="Edge TTS service connection failed"):
+                asyncio.run(
+                    asyncio.wait_for(
+                        convert_pdf_async(
+                            multi_page_pdf, str(tmp_path / "out.mp3"), lambda p, m: None
+                        ),
+                        timeout=10,
+                    )
+                )
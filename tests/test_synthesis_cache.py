@@ -0,0 +1,109 @@
+"""Tests for the on-disk synthesized audio cache."""
+
+import asyncio
+import os
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from textwave import SynthesisCache
+from textwave.synthesis import synthesize_chunk
+
+
+@pytest.mark.unit
+def test_cache_key_depends_on_text_voice_and_params():
+    """Test that every synthesis input changes the cache key."""
+    key = SynthesisCache.key("Hello.", "voice-a", rate="+0%")
+
+    assert key == SynthesisCache.key("Hello.", "voice-a", rate="+0%")
+    assert key != SynthesisCache.key("Hello!", "voice-a", rate="+0%")
+    assert key != SynthesisCache.key("Hello.", "voice-b", rate="+0%")
+    assert key != SynthesisCache.key("Hello.", "voice-a", rate="+10%")
+
+
+@pytest.mark.unit
+def test_cache_roundtrip(tmp_path):
+    """Test that stored audio is returned and misses return None."""
+    cache = SynthesisCache(tmp_path / "cache")
+
+    assert cache.get("missing") is None
+    cache.put("abc", b"audio bytes")
+
+    assert cache.get("abc") == b"audio bytes"
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert not list((tmp_path / "cache").glob("*.tmp"))
+
+
+@pytest.mark.unit
+def test_cache_evicts_least_recently_used(tmp_path):
+    """Test that the oldest entries are evicted once over budget."""
+    cache = SynthesisCache(tmp_path, max_bytes=250)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.put(key, b"x" * 100 if key != "c" else b"")
+        os.utime(tmp_path / f"{key}.mp3", (1000 + i, 1000 + i))
+
+    # Reading "a" makes it the most recently used entry
+    cache.get("a")
+    cache.put("d", b"x" * 100)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"x" * 100
+    assert cache.get("d") == b"x" * 100
+
+
+@pytest.mark.unit
+def test_cache_accounts_for_existing_entries(tmp_path):
+    """Test that a new cache instance sees entries from earlier jobs."""
+    SynthesisCache(tmp_path).put("a", b"x" * 100)
+
+    cache = SynthesisCache(tmp_path, max_bytes=150)
+    cache.put("b", b"x" * 100)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == b"x" * 100
+
+
+@pytest.mark.unit
+def test_cache_concurrent_writers(tmp_path):
+    """Test that jobs writing the same directory at once don't corrupt it."""
+    caches = [SynthesisCache(tmp_path, max_bytes=10_000) for _ in range(4)]
+
+    def write(cache):
+        for i in range(50):
+            cache.put(f"key{i % 10}", f"{i % 10}".encode() * 100)
+
+    threads = [threading.Thread(target=write, args=(cache,)) for cache in caches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for i in range(10):
+        data = caches[0].get(f"key{i}")
+        assert data is None or data == f"{i}".encode() * 100
+    assert sum(f.stat().st_size for f in tmp_path.glob("*.mp3")) <= 10_000
+
+
+@pytest.mark.unit
+def test_synthesize_chunk_uses_cache(tmp_path):
+    """Test that cached chunks skip the edge-tts session."""
+    cache = SynthesisCache(tmp_path)
+
+    async def stream():
+        yield {"type": "audio", "data": b"mp3 data"}
+
+    communicate = MagicMock()
+    communicate.return_value.stream = stream
+
+    with patch("edge_tts.Communicate", communicate):
+        first = asyncio.run(synthesize_chunk("Some text.", cache))
+        second = asyncio.run(synthesize_chunk("Some text.", cache))
+
+    assert first == second == b"mp3 data"
+    assert communicate.call_count == 1
+    assert cache.hits == 1
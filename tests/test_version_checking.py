@@ -1,111 +1,156 @@
 """Tests for edge-tts version checking functionality."""
 
-import json
+import asyncio
+import importlib.metadata
 import sys
+import time
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from pdf2mp3_gui import VersionCheckThread
+from pdf2mp3_gui import PDF2MP3App
+from textwave import UpdateChecker
+
+
+class DictCache(dict):
+    def set(self, key, value):
+        self[key] = value
 
 
 @pytest.mark.unit
-def test_version_check_finds_update(qtbot, qapp):
+def test_version_check_finds_update(update_server):
     """Test version check detects when an update is available."""
-    thread = VersionCheckThread()
+    with patch("importlib.metadata.version", return_value="6.0.0"):
+        (has_update, installed, latest), _ = asyncio.run(
+            update_server.checker().check()
+        )
 
-    with patch("urllib.request.urlopen") as mock_urlopen:
-        with patch("subprocess.run") as mock_run:
-            # Mock pip show output
-            mock_run.return_value = MagicMock(
-                returncode=0, stdout="Name: edge-tts\nVersion: 6.0.0\n"
-            )
+    assert has_update == True
+    assert installed == "6.0.0"
+    assert latest == "99.0.0"
 
-            # Mock PyPI response with newer version
-            mock_response = MagicMock()
-            mock_response.read.return_value = json.dumps(
-                {"info": {"version": "99.0.0"}}
-            ).encode()
-            mock_urlopen.return_value.__enter__.return_value = mock_response
 
-            with qtbot.waitSignal(thread.finished, timeout=3000) as blocker:
-                thread.start()
+@pytest.mark.unit
+def test_version_check_no_update(update_server):
+    """Test version check when no update is available."""
+    update_server.pypi = {"info": {"version": "6.1.0"}}
+
+    with patch("importlib.metadata.version", return_value="6.1.0"):
+        (has_update, installed, latest), _ = asyncio.run(
+            update_server.checker().check()
+        )
 
-            has_update, installed, latest = blocker.args
-            assert has_update == True
-            assert installed == "6.0.0"
-            assert latest == "99.0.0"
+    assert has_update == False
+    assert installed == "6.1.0"
+    assert latest == "6.1.0"
 
 
 @pytest.mark.unit
-def test_version_check_no_update(qtbot, qapp):
-    """Test version check when no update is available."""
-    thread = VersionCheckThread()
+def test_version_check_handles_network_error(update_server):
+    """Test version check handles network errors gracefully."""
+    update_server.status = 503
+
+    with patch("importlib.metadata.version", return_value="6.1.0"):
+        (has_update, installed, latest), _ = asyncio.run(
+            update_server.checker().check()
+        )
 
-    with patch("urllib.request.urlopen") as mock_urlopen:
-        with patch("subprocess.run") as mock_run:
-            # Mock pip show output
-            mock_run.return_value = MagicMock(
-                returncode=0, stdout="Name: edge-tts\nVersion: 6.1.0\n"
-            )
+    # Should return False on error
+    assert has_update == False
+    assert installed == ""
+    assert latest == ""
 
-            # Mock PyPI response with same version
-            mock_response = MagicMock()
-            mock_response.read.return_value = json.dumps(
-                {"info": {"version": "6.1.0"}}
-            ).encode()
-            mock_urlopen.return_value.__enter__.return_value = mock_response
 
-            with qtbot.waitSignal(thread.finished, timeout=3000) as blocker:
-                thread.start()
+@pytest.mark.unit
+def test_version_check_handles_missing_package(update_server):
+    """Test version check handles edge-tts metadata not being found."""
+    with patch(
+        "importlib.metadata.version",
+        side_effect=importlib.metadata.PackageNotFoundError("edge-tts"),
+    ):
+        (has_update, installed, latest), _ = asyncio.run(
+            update_server.checker().check()
+        )
 
-            has_update, installed, latest = blocker.args
-            assert has_update == False
-            assert installed == "6.1.0"
-            assert latest == "6.1.0"
+    assert (has_update, installed, latest) == (False, "", "")
+    assert [path for path, _ in update_server.requests] == ["/release"]
 
 
 @pytest.mark.unit
-def test_version_check_handles_network_error(qtbot, qapp):
-    """Test version check handles network errors gracefully."""
-    thread = VersionCheckThread()
+def test_lookups_are_cached_and_revalidated(update_server):
+    """Test that a fresh cached response skips the network and a stale one
+    is revalidated with its ETag."""
+    update_server.etag = '"v1"'
+    cache = DictCache()
+
+    def check(ttl):
+        checker = update_server.checker(cache=cache, ttl=ttl)
+        return asyncio.run(checker.check())
+
+    with patch("importlib.metadata.version", return_value="6.0.0"):
+        first = check(ttl=3600)
+        assert check(ttl=3600) == first
+        assert len(update_server.requests) == 2
+
+        # Expired: conditional requests get 304s and the cached bodies are used
+        assert check(ttl=0) == first
+        assert len(update_server.requests) == 4
+        assert all(
+            headers["If-None-Match"] == '"v1"'
+            for _, headers in update_server.requests[2:]
+        )
 
-    with patch("urllib.request.urlopen") as mock_urlopen:
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0, stdout="Name: edge-tts\nVersion: 6.1.0\n"
-            )
 
-            # Simulate network error
-            mock_urlopen.side_effect = Exception("Network error")
+@pytest.mark.unit
+def test_lookups_run_concurrently(update_server):
+    """Test that both lookups overlap rather than running one after the
+    other."""
+    update_server.delay = 0.5
 
-            with qtbot.waitSignal(thread.finished, timeout=3000) as blocker:
-                thread.start()
+    with patch("importlib.metadata.version", return_value="6.0.0"):
+        start = time.monotonic()
+        edge_tts, app = asyncio.run(update_server.checker().check())
+        elapsed = time.monotonic() - start
 
-            has_update, installed, latest = blocker.args
-            # Should return False on error
-            assert has_update == False
-            assert installed == ""
-            assert latest == ""
+    assert edge_tts[0] and app[0]
+    assert elapsed < 0.9
 
 
 @pytest.mark.unit
-def test_version_check_handles_pip_error(qtbot, qapp):
-    """Test version check handles pip errors gracefully."""
-    thread = VersionCheckThread()
+def test_lookups_share_one_timeout(update_server):
+    """Test that lookups still running when the timeout expires are
+    abandoned and reported as no update."""
+    update_server.delay = 10
+
+    with patch("importlib.metadata.version", return_value="6.0.0"):
+        start = time.monotonic()
+        edge_tts, app = asyncio.run(update_server.checker(timeout=0.3).check())
+        elapsed = time.monotonic() - start
+
+    assert edge_tts == (False, "", "")
+    assert app == (False, "", "", "")
+    assert elapsed < 2
+
+
+@pytest.mark.gui
+def test_update_check_shows_banners(qtbot, qapp):
+    """Test that the window shows both update banners from one check."""
+
+    async def check(self):
+        return (True, "6.0.0", "7.0.0"), (True, "1.0.0", "9.0.0", "https://x")
 
-    with patch("subprocess.run") as mock_run:
-        # Mock pip failing
-        mock_run.return_value = MagicMock(returncode=1)
+    with patch.object(UpdateChecker, "check", check):
+        window = PDF2MP3App()
+        qtbot.addWidget(window)
+        window.update_check_timer.stop()
 
-        with qtbot.waitSignal(thread.finished, timeout=3000) as blocker:
-            thread.start()
+        window.start_update_checks()
+        qtbot.waitUntil(lambda: window.app_update_banner is not None, timeout=3000)
 
-        has_update, installed, latest = blocker.args
-        assert has_update == False
-        assert installed == ""
-        assert latest == ""
+    assert window.latest_version == "7.0.0"
+    assert window.app_latest_version == "9.0.0"
+    assert window.app_download_url == "https://x"
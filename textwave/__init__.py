@@ -0,0 +1,58 @@
+"""TextWave conversion engine.
+
+Converts PDF files to MP3 audio with edge-tts. This package has no GUI
+dependencies; pdf2mp3_gui.py is a PyQt6 front end built on top of it.
+"""
+
+import importlib
+
+# Public names and the submodules defining them. Submodules are imported on
+# first access, so importing textwave (e.g. to build the GUI window) doesn't
+# pull in edge-tts, pypdf and aiohttp until a conversion needs them.
+_EXPORTS = {
+    "AdaptiveConcurrency": "concurrency",
+    "CancellationToken": "cancellation",
+    "ConnectionPool": "connections",
+    "ConversionCancelled": "cancellation",
+    "ConversionPipeline": "pipeline",
+    "Converter": "converter",
+    "EdgeTTSBackend": "backends",
+    "EspeakBackend": "backends",
+    "DEFAULT_MAX_RUNNING": "jobs",
+    "EXTRACTION_WORKERS": "extraction",
+    "EventLoopThread": "eventloop",
+    "Job": "jobs",
+    "JobManifest": "manifest",
+    "JobQueue": "jobs",
+    "PageText": "extraction",
+    "PageTexts": "extraction",
+    "ProgressThrottle": "progress",
+    "RateLimiter": "ratelimit",
+    "RetryPolicy": "retry",
+    "SynthesisCache": "cache",
+    "UpdateChecker": "updates",
+    "VOICE": "backends",
+    "convert_pdf_async": "pipeline",
+    "create_backend": "backends",
+    "expand_inputs": "jobs",
+    "extract_and_clean_text": "extraction",
+    "iter_text_chunks": "segmentation",
+    "resume_conversion_async": "pipeline",
+    "shared_event_loop": "eventloop",
+    "split_text_into_chunks": "segmentation",
+    "text_to_speech_async": "synthesis",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
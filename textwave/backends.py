@@ -0,0 +1,214 @@
+"""Speech engines that turn a chunk of text into MP3 audio."""
+
+import asyncio
+import os
+
+import edge_tts
+
+# Microsoft Azure Neural Voice (Free via edge-tts)
+VOICE = "en-US-AvaMultilingualNeural"
+SYNTHESIS_PARAMS = {"rate": "+0%", "volume": "+0%", "pitch": "+0Hz"}
+
+ESPEAK_COMMAND = "espeak-ng"
+ESPEAK_VOICE = "en-us"
+ESPEAK_SPEED = 175  # words per minute
+LAME_COMMAND = "lame"
+# Encode to the format edge-tts produces (24 kHz mono at 48 kbit/s), so audio
+# from either engine plays back the same way
+LAME_ARGS = ["--quiet", "-m", "m", "--resample", "24", "-b", "48", "-", "-"]
+READ_SIZE = 64 * 1024
+# The end of a failed process's stderr that goes into the error message
+ERROR_OUTPUT_SIZE = 4 * 1024
+
+DEFAULT_BACKEND = "edge-tts"
+
+
+class SpeechBackend:
+    """A speech engine.
+
+    Subclasses implement `stream(text)`, an async generator of MP3 data for
+    one chunk of text, and set `voice` and `params`, which together with the
+    text determine the audio (for the synthesis cache and resume manifests).
+    """
+
+    name = None
+    voice = None
+    params = {}
+
+    def voice_id(self):
+        """The voice, distinguished from other engines' voices."""
+        return self.voice
+
+    def cache_key(self, cache, text):
+        return cache.key(text, self.voice_id(), **self.params)
+
+    async def stream(self, text):
+        raise NotImplementedError
+        yield
+
+    async def synthesize(self, text):
+        """Return the MP3 audio for one chunk of text."""
+        audio = bytearray()
+        async for data in self.stream(text):
+            audio.extend(data)
+        return bytes(audio)
+
+
+class EdgeTTSBackend(SpeechBackend):
+    """Microsoft's neural voices through edge-tts; needs internet access.
+
+    Each chunk opens its own connection to the service unless `pool` (a
+    textwave.connections.ConnectionPool) is given, in which case chunks
+    reuse the pool's open connections, as long as the installed edge-tts
+    supports pooling.
+    """
+
+    name = "edge-tts"
+
+    def __init__(self, voice=VOICE, pool=None, **params):
+        self.voice = voice
+        self.pool = pool
+        self.params = {**SYNTHESIS_PARAMS, **params}
+
+    async def stream(self, text):
+        if self.pool is not None and self.pool.supported:
+            async for data in self.pool.stream(text, self.voice, **self.params):
+                yield data
+            return
+
+        communicate = edge_tts.Communicate(text, self.voice, **self.params)
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                yield chunk["data"]
+
+
+class EspeakBackend(SpeechBackend):
+    """Offline synthesis with espeak-ng, encoded to MP3 by LAME.
+
+    Every chunk runs its own `espeak-ng | lame` pair of processes, so chunks
+    synthesized concurrently spread over the CPU cores and nothing goes over
+    the network.
+    """
+
+    name = "espeak"
+
+    def __init__(
+        self,
+        voice=ESPEAK_VOICE,
+        speed=ESPEAK_SPEED,
+        espeak=ESPEAK_COMMAND,
+        lame=LAME_COMMAND,
+    ):
+        self.voice = voice
+        self.params = {"speed": speed}
+        self.espeak = espeak
+        self.lame = lame
+
+    def voice_id(self):
+        return f"{self.name}:{self.voice}"
+
+    async def start(self, command, *args, **kwargs):
+        try:
+            return await asyncio.create_subprocess_exec(command, *args, **kwargs)
+        except FileNotFoundError:
+            raise RuntimeError(
+                f"Offline speech needs {os.path.basename(command)}, which is "
+                "not installed (e.g. 'brew install espeak-ng lame')"
+            ) from None
+
+    async def stream(self, text):
+        processes = []
+        read_fd, write_fd = os.pipe()
+        try:
+            try:
+                processes.append(
+                    await self.start(
+                        self.espeak,
+                        "--stdout",
+                        "--stdin",
+                        "-v",
+                        self.voice,
+                        "-s",
+                        str(self.params["speed"]),
+                        stdin=asyncio.subprocess.PIPE,
+                        stdout=write_fd,
+                        stderr=asyncio.subprocess.PIPE,
+                    )
+                )
+                processes.append(
+                    await self.start(
+                        self.lame,
+                        *LAME_ARGS,
+                        stdin=read_fd,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                    )
+                )
+            finally:
+                # The processes hold their own copies of the pipe
+                os.close(read_fd)
+                os.close(write_fd)
+
+            espeak, lame = processes
+            feeder = asyncio.ensure_future(self.feed(espeak, text))
+            # stderr is read while the audio streams, or a process that
+            # fills the pipe would block and never finish the chunk
+            readers = [
+                asyncio.ensure_future(self.read_errors(process))
+                for process in processes
+            ]
+            try:
+                while data := await lame.stdout.read(READ_SIZE):
+                    yield data
+                errors = await asyncio.gather(*readers)
+            finally:
+                feeder.cancel()
+                for reader in readers:
+                    reader.cancel()
+                # A failed write just means the process exited early, which
+                # is reported below
+                await asyncio.gather(feeder, *readers, return_exceptions=True)
+
+            for command, process, output in zip(
+                (self.espeak, self.lame), processes, errors
+            ):
+                if await process.wait():
+                    raise RuntimeError(
+                        f"{os.path.basename(command)} failed "
+                        f"(exit status {process.returncode}): "
+                        f"{output.decode(errors='replace').strip()}"
+                    )
+        finally:
+            for process in processes:
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+
+    async def read_errors(self, process):
+        """Read a process's stderr to the end, keeping the last
+        ERROR_OUTPUT_SIZE bytes."""
+        output = b""
+        while data := await process.stderr.read(READ_SIZE):
+            output = (output + data)[-ERROR_OUTPUT_SIZE:]
+        return output
+
+    async def feed(self, process, text):
+        process.stdin.write(text.encode("utf-8"))
+        await process.stdin.drain()
+        process.stdin.close()
+
+
+BACKENDS = {backend.name: backend for backend in (EdgeTTSBackend, EspeakBackend)}
+
+
+def create_backend(name=None, voice=None, **options):
+    """Create the speech engine called `name` (DEFAULT_BACKEND if None),
+    with its default voice unless `voice` is given. Any `options` (e.g.
+    `pool` for edge-tts) go to the engine."""
+    try:
+        backend = BACKENDS[name or DEFAULT_BACKEND]
+    except KeyError:
+        raise ValueError(
+            f"Unknown speech engine {name!r} (choose from {', '.join(BACKENDS)})"
+        ) from None
+    return backend(voice, **options) if voice else backend(**options)
@@ -0,0 +1,108 @@
+"""On-disk cache of synthesized audio."""
+
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Synthesized audio is cached on disk, evicting least recently used chunks
+# once the cache grows past CACHE_MAX_BYTES.
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+def default_cache_dir():
+    """Get the per-user cache directory for synthesized audio."""
+    if sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return base / "TextWave" / "audio"
+
+
+class SynthesisCache:
+    """Content-addressed on-disk cache of synthesized MP3 audio.
+
+    Entries are keyed by a hash of the chunk text, voice and synthesis
+    parameters. Files are written atomically and modification times track
+    recent use, so several jobs (and processes) can share one directory.
+    """
+
+    def __init__(self, directory=None, max_bytes=CACHE_MAX_BYTES):
+        self.directory = Path(directory) if directory else default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._size = sum(size for _, _, size in self._entries())
+
+    @staticmethod
+    def key(text, voice, **params):
+        payload = json.dumps([text, voice, params], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return self.directory / f"{key}.mp3"
+
+    def _entries(self):
+        """List (mtime, path, size) for every cached file."""
+        entries = []
+        if not self.directory.is_dir():
+            return entries
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".mp3"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue  # Evicted by another job
+                entries.append((stat.st_mtime, entry.path, stat.st_size))
+        return entries
+
+    def get(self, key):
+        """Return the cached audio for key, or None on a miss."""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, key, data):
+        """Store audio for key, evicting old entries if over budget."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
+            raise
+
+        with self._lock:
+            self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        # Rescan so entries written or evicted by other jobs are accounted for,
+        # then trim to 90% of the budget to avoid evicting on every put
+        entries = sorted(self._entries())
+        self._size = sum(size for _, _, size in entries)
+        target = self.max_bytes * 0.9
+        for _, path, size in entries:
+            if self._size <= target:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)
+            self._size -= size
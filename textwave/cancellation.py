@@ -0,0 +1,71 @@
+"""Cooperative cancellation of running conversions."""
+
+import asyncio
+import contextlib
+import threading
+
+
+class ConversionCancelled(Exception):
+    """Raised when a conversion is stopped through its CancellationToken."""
+
+    def __init__(self, message="Conversion cancelled"):
+        super().__init__(message)
+
+
+class CancellationToken:
+    """Stop a running conversion from any thread, e.g. a GUI cancel button.
+
+    Synchronous code polls `raise_if_cancelled()` between units of work.
+    Async code runs inside `cancel_current_task()`, which cancels the task
+    as soon as the token is cancelled so in-flight synthesis streams are
+    closed instead of running to completion.
+    """
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        with self._lock:
+            self._cancelled.set()
+            callbacks = list(self._callbacks)
+        for loop, callback in callbacks:
+            # The loop may have finished in the meantime
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(callback)
+
+    def raise_if_cancelled(self):
+        if self.cancelled:
+            raise ConversionCancelled()
+
+    @contextlib.contextmanager
+    def cancel_current_task(self):
+        """Cancel the running task if the token is cancelled inside the block,
+        raising ConversionCancelled instead of CancelledError."""
+        task = asyncio.current_task()
+        entry = None
+
+        def cancel_task():
+            # Runs on the task's loop, so it can't race the block's exit
+            if entry in self._callbacks:
+                task.cancel()
+
+        entry = (asyncio.get_running_loop(), cancel_task)
+        with self._lock:
+            self._callbacks.append(entry)
+        try:
+            self.raise_if_cancelled()
+            yield
+        except asyncio.CancelledError:
+            if not self.cancelled:
+                raise
+            task.uncancel()
+            raise ConversionCancelled() from None
+        finally:
+            with self._lock:
+                self._callbacks.remove(entry)
@@ -0,0 +1,277 @@
+"""Command-line batch converter.
+
+Usage:
+    textwave convert a.pdf b.pdf "reports/*.pdf" -o outdir
+
+Progress is printed to stdout as one JSON object per line, for example:
+
+    {"event": "progress", "file": "a.pdf", "percent": 42, "message": "..."}
+
+Events are "start", "progress", "status", "done", "error" and a final
+"summary", plus "concurrency" whenever --adaptive changes the number of
+sessions. The exit status is 1 if any document failed.
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import sys
+import time
+from pathlib import Path
+
+from .backends import BACKENDS, DEFAULT_BACKEND, EdgeTTSBackend, create_backend
+from .cache import SynthesisCache
+from .concurrency import AdaptiveConcurrency
+from .connections import ConnectionPool
+from .converter import Converter
+from .extraction import EXTRACTION_WORKERS
+from .jobs import expand_inputs
+from .output import OUTPUT_BUFFER_SIZE
+from .progress import PROGRESS_MAX_RATE, ProgressThrottle
+from .ratelimit import RateLimiter
+from .synthesis import MAX_CONCURRENT_SESSIONS
+
+DEFAULT_JOBS = 2
+
+
+def emit(event, **fields):
+    """Print one machine-readable progress line."""
+    print(json.dumps({"event": event, "time": round(time.time(), 3), **fields}))
+    sys.stdout.flush()
+
+
+async def convert_document(
+    converter, jobs, pdf_path, output_path, resume, progress_rate=PROGRESS_MAX_RATE
+):
+    async with jobs:
+        emit("start", file=pdf_path, output=output_path)
+        progress = ProgressThrottle(
+            lambda percent, message: emit(
+                "progress", file=pdf_path, percent=percent, message=message
+            ),
+            progress_rate,
+        )
+        try:
+            await converter.convert_async(
+                pdf_path,
+                output_path,
+                progress,
+                lambda message: emit("status", file=pdf_path, message=message),
+                resume=resume,
+            )
+        except Exception as e:
+            progress.flush()
+            emit("error", file=pdf_path, error=str(e))
+            return False
+
+        emit("done", file=pdf_path, output=output_path)
+        return True
+
+
+async def convert_all(args, pdf_paths):
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # All documents share one extraction process pool, one limit on
+    # concurrent synthesis sessions and, for edge-tts, one pool of open
+    # connections, and every process using the same rate limit database
+    # shares its request budget
+    cache = None if args.no_cache else SynthesisCache(args.cache_dir)
+    rate_limiter = None
+    if args.max_requests_per_second or args.max_chars_per_second:
+        rate_limiter = RateLimiter(
+            args.max_requests_per_second,
+            args.max_chars_per_second,
+            path=args.rate_limit_db,
+        )
+    if args.adaptive:
+        limiter = AdaptiveConcurrency(
+            maximum=args.concurrency,
+            on_change=lambda limit, reason: emit(
+                "concurrency", sessions=limit, reason=reason
+            ),
+        )
+    else:
+        limiter = asyncio.Semaphore(args.concurrency)
+    pool = None
+    backend_options = {}
+    if args.engine == EdgeTTSBackend.name and not args.no_pool:
+        pool = backend_options["pool"] = ConnectionPool(size=args.concurrency)
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=args.workers
+        ) as executor:
+            converter = Converter(
+                concurrency=args.concurrency,
+                workers=args.workers,
+                cache=cache,
+                limiter=limiter,
+                executor=executor,
+                output_buffer_size=args.buffer_kb * 1024,
+                backend=create_backend(args.engine, args.voice, **backend_options),
+                rate_limiter=rate_limiter,
+            )
+            jobs = asyncio.Semaphore(args.jobs)
+
+            conversions = []
+            outputs = set()
+            duplicates = 0
+            for pdf_path in pdf_paths:
+                output_path = str(output_dir / (Path(pdf_path).stem + ".mp3"))
+                if output_path in outputs:
+                    emit(
+                        "error", file=pdf_path, error=f"Duplicate output {output_path}"
+                    )
+                    duplicates += 1
+                    continue
+                outputs.add(output_path)
+                conversions.append(
+                    convert_document(
+                        converter,
+                        jobs,
+                        pdf_path,
+                        output_path,
+                        args.resume,
+                        args.progress_rate,
+                    )
+                )
+
+            results = await asyncio.gather(*conversions)
+            return results + [False] * duplicates
+    finally:
+        if pool is not None:
+            await pool.close()
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def positive_float(value):
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError("must be positive")
+    return number
+
+
+def non_negative_float(value):
+    number = float(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError("must not be negative")
+    return number
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="textwave", description="Convert PDF files to MP3 audio."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="Convert PDF files to MP3")
+    convert.add_argument(
+        "inputs", nargs="+", help="PDF files, directories or glob patterns"
+    )
+    convert.add_argument(
+        "-o", "--output-dir", default=".", help="Directory for the MP3 files"
+    )
+    convert.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=DEFAULT_JOBS,
+        help=f"Documents converted at the same time (default {DEFAULT_JOBS})",
+    )
+    convert.add_argument(
+        "-c",
+        "--concurrency",
+        type=positive_int,
+        default=MAX_CONCURRENT_SESSIONS,
+        help="Synthesis sessions shared by all documents "
+        f"(default {MAX_CONCURRENT_SESSIONS})",
+    )
+    convert.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Start with fewer sessions and adjust them to the service's "
+        "throttling and latency, up to --concurrency",
+    )
+    convert.add_argument(
+        "--max-requests-per-second",
+        type=positive_float,
+        help="Limit synthesis requests per second across every process "
+        "sharing --rate-limit-db",
+    )
+    convert.add_argument(
+        "--max-chars-per-second",
+        type=positive_float,
+        help="Limit characters sent for synthesis per second across every "
+        "process sharing --rate-limit-db",
+    )
+    convert.add_argument(
+        "--rate-limit-db",
+        help="Database holding the shared rate limit (default: in the user "
+        "cache directory)",
+    )
+    convert.add_argument(
+        "-w",
+        "--workers",
+        type=positive_int,
+        default=EXTRACTION_WORKERS,
+        help=f"Extraction worker processes (default {EXTRACTION_WORKERS})",
+    )
+    convert.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume interrupted conversions instead of starting over",
+    )
+    convert.add_argument(
+        "--buffer-kb",
+        type=positive_int,
+        default=OUTPUT_BUFFER_SIZE // 1024,
+        help="Audio buffered before each write to the output file "
+        f"(default {OUTPUT_BUFFER_SIZE // 1024})",
+    )
+    convert.add_argument(
+        "--progress-rate",
+        type=non_negative_float,
+        default=PROGRESS_MAX_RATE,
+        help="Maximum progress lines per second and document, 0 for every "
+        f"chunk (default {PROGRESS_MAX_RATE:g})",
+    )
+    convert.add_argument(
+        "--engine",
+        choices=sorted(BACKENDS),
+        default=DEFAULT_BACKEND,
+        help="Speech engine; espeak works offline using espeak-ng and lame "
+        f"(default {DEFAULT_BACKEND})",
+    )
+    convert.add_argument("--voice", help="Voice name for the speech engine")
+    convert.add_argument(
+        "--no-pool",
+        action="store_true",
+        help="Open a new edge-tts connection for every chunk instead of "
+        "reusing open ones",
+    )
+    convert.add_argument("--cache-dir", help="Directory for the audio cache")
+    convert.add_argument(
+        "--no-cache", action="store_true", help="Don't cache synthesized audio"
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    pdf_paths, unmatched = expand_inputs(args.inputs)
+    for pattern in unmatched:
+        emit("error", file=pattern, error="No PDF files found")
+
+    results = asyncio.run(convert_all(args, pdf_paths)) if pdf_paths else []
+    succeeded = sum(results)
+    failed = len(results) - succeeded + len(unmatched)
+    emit("summary", succeeded=succeeded, failed=failed)
+    return 1 if failed else 0
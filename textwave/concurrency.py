@@ -0,0 +1,141 @@
+"""Adapting the number of concurrent synthesis sessions to the service."""
+
+import asyncio
+import collections
+import logging
+import math
+import time
+
+logger = logging.getLogger(__name__)
+
+# The session limit starts at ADAPTIVE_INITIAL_SESSIONS and stays between
+# ADAPTIVE_MIN_SESSIONS and ADAPTIVE_MAX_SESSIONS. It grows by one after each
+# round of `limit` successful requests and is multiplied by BACKOFF_FACTOR
+# when a request is throttled or times out, or when the p95 latency of the
+# last LATENCY_WINDOW requests exceeds LATENCY_TOLERANCE times the best p95
+# seen so far.
+ADAPTIVE_MIN_SESSIONS = 1
+ADAPTIVE_MAX_SESSIONS = 8
+ADAPTIVE_INITIAL_SESSIONS = 2
+BACKOFF_FACTOR = 0.5
+LATENCY_WINDOW = 20
+LATENCY_TOLERANCE = 2.0
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def overload_reason(error):
+    """Why an error means the service is overloaded, or None if it doesn't."""
+    status = getattr(error, "status", None)
+    if status == 429:
+        return "throttled (HTTP 429)"
+    if isinstance(status, int) and status >= 500:
+        return f"server error (HTTP {status})"
+    if isinstance(error, asyncio.TimeoutError):
+        return "timed out"
+    return None
+
+
+class AdaptiveConcurrency:
+    """Limit concurrent synthesis requests, adjusting the limit AIMD-style.
+
+    Use it wherever a semaphore limiter goes, with `async with` around each
+    request. While requests succeed at healthy latency the limit climbs one
+    session at a time, but only while it is actually reached, so an idle
+    limit doesn't creep up. Throttling, timeouts, server errors and rising
+    p95 latency cut it back multiplicatively, once per burst: failures of
+    requests that started before the last cut don't cut it again.
+
+    Every change is logged to the "textwave.concurrency" logger and passed
+    to `on_change(limit, reason)` if given.
+    """
+
+    def __init__(
+        self,
+        initial=ADAPTIVE_INITIAL_SESSIONS,
+        minimum=ADAPTIVE_MIN_SESSIONS,
+        maximum=ADAPTIVE_MAX_SESSIONS,
+        backoff=BACKOFF_FACTOR,
+        window=LATENCY_WINDOW,
+        tolerance=LATENCY_TOLERANCE,
+        on_change=None,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = max(minimum, min(maximum, initial))
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.on_change = on_change
+
+        self.active = 0
+        self.peak = 0
+        self.saturated = False
+        self.successes = 0
+        self.latencies = collections.deque(maxlen=window)
+        self.best_p95 = None
+        self.last_decrease = float("-inf")
+        self.started = {}
+        self.condition = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            if self.active >= self.limit:
+                self.saturated = True
+        self.started[asyncio.current_task()] = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        started = self.started.pop(asyncio.current_task())
+        async with self.condition:
+            self.active -= 1
+            if exc is None:
+                self.record_success(started, time.monotonic() - started)
+            elif isinstance(exc, Exception):
+                reason = overload_reason(exc)
+                if reason and started >= self.last_decrease:
+                    self.decrease(reason)
+            self.condition.notify_all()
+        return False
+
+    def record_success(self, started, latency):
+        self.latencies.append(latency)
+        if len(self.latencies) == self.latencies.maxlen:
+            p95 = percentile(self.latencies, 0.95)
+            self.latencies.clear()
+            if self.best_p95 is None or p95 < self.best_p95:
+                self.best_p95 = p95
+            elif p95 > self.best_p95 * self.tolerance and started >= self.last_decrease:
+                self.decrease(
+                    f"p95 latency {p95:.2f}s is over {self.tolerance:g}x "
+                    f"the best {self.best_p95:.2f}s"
+                )
+                return
+
+        self.successes += 1
+        if self.successes >= self.limit:
+            self.successes = 0
+            if self.saturated and self.limit < self.maximum:
+                self.change(self.limit + 1, f"{self.limit} requests succeeded")
+
+    def decrease(self, reason):
+        self.last_decrease = time.monotonic()
+        self.successes = 0
+        self.change(max(self.minimum, int(self.limit * self.backoff)), reason)
+
+    def change(self, limit, reason):
+        self.saturated = False
+        if limit == self.limit:
+            logger.info("Keeping %d concurrent sessions: %s", limit, reason)
+            return
+        logger.info(
+            "Changing concurrent sessions from %d to %d: %s", self.limit, limit, reason
+        )
+        self.limit = limit
+        if self.on_change:
+            self.on_change(limit, reason)
@@ -0,0 +1,280 @@
+"""Reusing edge-tts websocket connections across chunks."""
+
+import asyncio
+import time
+from xml.sax.saxutils import escape
+
+import aiohttp
+from edge_tts.exceptions import NoAudioReceived, UnknownResponse, WebSocketError
+
+# The pool speaks the edge-tts protocol with edge-tts's own helpers, which
+# aren't part of its public API. If an edge-tts release moves them, pooling
+# is turned off and EdgeTTSBackend opens a connection per chunk through
+# edge_tts.Communicate instead.
+try:
+    from edge_tts import communicate
+    from edge_tts.communicate import (
+        _SSL_CTX,
+        connect_id,
+        date_to_string,
+        get_headers_and_data,
+        mkssml,
+        remove_incompatible_characters,
+        split_text_by_byte_length,
+        ssml_headers_plus_data,
+    )
+    from edge_tts.constants import SEC_MS_GEC_VERSION, WSS_HEADERS
+    from edge_tts.data_classes import TTSConfig
+    from edge_tts.drm import DRM
+except ImportError:
+    POOLING_SUPPORTED = False
+else:
+    POOLING_SUPPORTED = True
+
+# Up to MAX_POOLED_CONNECTIONS idle connections are kept open between chunks.
+# A connection is retired once it is CONNECTION_MAX_AGE seconds old or has
+# synthesized CONNECTION_MAX_REQUESTS chunks, and isn't reused after sitting
+# idle for CONNECTION_IDLE_TIMEOUT seconds, since the service drops idle
+# connections on its own.
+MAX_POOLED_CONNECTIONS = 4
+CONNECTION_MAX_AGE = 300.0
+CONNECTION_MAX_REQUESTS = 100
+CONNECTION_IDLE_TIMEOUT = 30.0
+
+# edge-tts limits each ssml request to this many bytes of escaped text
+SSML_MAX_BYTES = 4096
+
+SPEECH_CONFIG = (
+    "Content-Type:application/json; charset=utf-8\r\n"
+    "Path:speech.config\r\n\r\n"
+    '{"context":{"synthesis":{"audio":{"metadataoptions":{'
+    '"sentenceBoundaryEnabled":"true","wordBoundaryEnabled":"false"},'
+    '"outputFormat":"audio-24khz-48kbitrate-mono-mp3"}}}}\r\n'
+)
+
+
+class EdgeTTSConnection:
+    """One open websocket to the edge-tts service, which synthesizes any
+    number of ssml requests one after another."""
+
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.created = time.monotonic()
+        self.last_used = self.created
+        self.requests = 0
+
+    @classmethod
+    async def open(cls, session):
+        """Connect and send the speech configuration, which holds for every
+        request made over the connection."""
+        # Read the URL here rather than importing it, so it can be redirected
+        url = (
+            f"{communicate.WSS_URL}&ConnectionId={connect_id()}"
+            f"&Sec-MS-GEC={DRM.generate_sec_ms_gec()}"
+            f"&Sec-MS-GEC-Version={SEC_MS_GEC_VERSION}"
+        )
+        websocket = await session.ws_connect(
+            url,
+            compress=15,
+            headers=DRM.headers_with_muid(WSS_HEADERS),
+            ssl=_SSL_CTX,
+        )
+        try:
+            await websocket.send_str(
+                f"X-Timestamp:{date_to_string()}\r\n{SPEECH_CONFIG}"
+            )
+        except BaseException:
+            await websocket.close()
+            raise
+        return cls(websocket)
+
+    @property
+    def closed(self):
+        return self.websocket.closed
+
+    def expired(self, max_age, max_requests, idle_timeout):
+        now = time.monotonic()
+        return (
+            self.closed
+            or now - self.created > max_age
+            or now - self.last_used > idle_timeout
+            or self.requests >= max_requests
+        )
+
+    async def speak(self, config, escaped_text):
+        """Synthesize one ssml request, yielding its MP3 data.
+
+        Unlike edge_tts.Communicate, a connection that closes before the
+        service ends the turn raises ConnectionResetError (so the chunk is
+        retried) instead of passing on the audio cut short.
+        """
+        self.requests += 1
+        await self.websocket.send_str(
+            ssml_headers_plus_data(
+                connect_id(), date_to_string(), mkssml(config, escaped_text)
+            )
+        )
+
+        audio_received = False
+        async for message in self.websocket:
+            if message.type == aiohttp.WSMsgType.TEXT:
+                data = message.data.encode("utf-8")
+                headers, _ = get_headers_and_data(data, data.find(b"\r\n\r\n"))
+                path = headers.get(b"Path")
+                if path == b"turn.end":
+                    break
+                if path not in (b"turn.start", b"response", b"audio.metadata"):
+                    raise UnknownResponse(f"Unknown path received: {path!r}")
+            elif message.type == aiohttp.WSMsgType.BINARY:
+                header_length = int.from_bytes(message.data[:2], "big")
+                headers, data = get_headers_and_data(message.data, header_length)
+                if headers.get(b"Path") == b"audio" and data:
+                    audio_received = True
+                    yield data
+            elif message.type == aiohttp.WSMsgType.ERROR:
+                raise WebSocketError(message.data or "Unknown error")
+        else:
+            raise ConnectionResetError(
+                "The speech service closed the connection before the audio "
+                "was complete"
+            )
+
+        self.last_used = time.monotonic()
+        if not audio_received:
+            raise NoAudioReceived(
+                "No audio was received. Please verify that your parameters "
+                "are correct."
+            )
+
+    async def close(self):
+        await self.websocket.close()
+
+
+class ConnectionPool:
+    """Keep edge-tts connections open and reuse them for later chunks.
+
+    Each chunk borrows an idle connection, or opens a new one, and hands it
+    back once its audio is complete, so a document pays for the TLS
+    handshake and configuration exchange once per connection instead of
+    once per chunk. Connections past their age, request or idle limits are
+    replaced, and one that fails or is abandoned mid-turn is closed rather
+    than reused. If a reused connection turns out to have been dropped
+    while idle, the chunk moves on to another connection.
+
+    The pool works on whichever event loop uses it; call `close()` on that
+    loop when done. `supported` is False when the installed edge-tts lacks
+    the internals the pool relies on, and backends then don't use it.
+    """
+
+    supported = POOLING_SUPPORTED
+
+    def __init__(
+        self,
+        size=MAX_POOLED_CONNECTIONS,
+        max_age=CONNECTION_MAX_AGE,
+        max_requests=CONNECTION_MAX_REQUESTS,
+        idle_timeout=CONNECTION_IDLE_TIMEOUT,
+        connect_timeout=10,
+        receive_timeout=60,
+    ):
+        self.size = size
+        self.max_age = max_age
+        self.max_requests = max_requests
+        self.idle_timeout = idle_timeout
+        self.timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=connect_timeout, sock_read=receive_timeout
+        )
+        self.loop = None
+        self.session = None
+        self.idle = []
+        self.opened = 0
+        self.reused = 0
+
+    def check_loop(self):
+        loop = asyncio.get_running_loop()
+        if loop is not self.loop:
+            # Sessions can't move between loops; start afresh on this one
+            self.loop = loop
+            self.session = None
+            self.idle = []
+
+    async def connect(self):
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(trust_env=True, timeout=self.timeout)
+        try:
+            connection = await EdgeTTSConnection.open(self.session)
+        except aiohttp.ClientResponseError as e:
+            if e.status != 403:
+                raise
+            # Correct the clock skew the service complained about, then retry
+            DRM.handle_client_response_error(e)
+            connection = await EdgeTTSConnection.open(self.session)
+        self.opened += 1
+        return connection
+
+    async def acquire(self):
+        """An open connection: the most recently used idle one that is
+        still fresh, or a new one."""
+        self.check_loop()
+        while self.idle:
+            connection = self.idle.pop()
+            if not connection.expired(
+                self.max_age, self.max_requests, self.idle_timeout
+            ):
+                self.reused += 1
+                return connection
+            await connection.close()
+        return await self.connect()
+
+    async def release(self, connection):
+        if len(self.idle) < self.size and not connection.expired(
+            self.max_age, self.max_requests, self.idle_timeout
+        ):
+            self.idle.append(connection)
+        else:
+            await connection.close()
+
+    async def stream(self, text, voice, rate="+0%", volume="+0%", pitch="+0Hz"):
+        """Synthesize text over pooled connections, yielding MP3 data."""
+        config = TTSConfig(
+            voice=voice,
+            rate=rate,
+            volume=volume,
+            pitch=pitch,
+            boundary="SentenceBoundary",
+        )
+        escaped = escape(remove_incompatible_characters(text))
+        for part in split_text_by_byte_length(escaped, SSML_MAX_BYTES):
+            async for data in self.stream_part(config, part):
+                yield data
+
+    async def stream_part(self, config, escaped_text):
+        while True:
+            connection = await self.acquire()
+            reused = connection.requests > 0
+            audio_sent = False
+            try:
+                async for data in connection.speak(config, escaped_text):
+                    audio_sent = True
+                    yield data
+            except (ConnectionError, aiohttp.ClientError, WebSocketError):
+                await connection.close()
+                # Only a connection dropped while idle is retried here; other
+                # failures are left to the caller's retry policy
+                if audio_sent or not reused:
+                    raise
+                continue
+            except BaseException:
+                await connection.close()
+                raise
+            await self.release(connection)
+            return
+
+    async def close(self):
+        """Close every idle connection and the session."""
+        idle, self.idle = self.idle, []
+        for connection in idle:
+            await connection.close()
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
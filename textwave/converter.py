@@ -0,0 +1,113 @@
+"""High-level, GUI-independent conversion API."""
+
+from .eventloop import shared_event_loop
+from .extraction import EXTRACTION_WORKERS, PageTexts, extract_and_clean_text
+from .output import OUTPUT_BUFFER_SIZE
+from .pipeline import convert_pdf_async, resume_conversion_async
+from .synthesis import MAX_CONCURRENT_SESSIONS
+
+
+class Converter:
+    """Convert PDF files to MP3 audio.
+
+    Holds the settings shared by every conversion (synthesis concurrency,
+    extraction workers, the audio cache, the output buffer size, the speech
+    engine and optionally a session limiter, request rate limiter and
+    extraction process pool shared by concurrent conversions). Each
+    conversion gets its own retry budget, can use a different speech engine
+    and can be stopped from another thread with a CancellationToken.
+    Callbacks are optional:
+
+        progress_callback(percent, message)
+        status_callback(message)
+    """
+
+    def __init__(
+        self,
+        concurrency=MAX_CONCURRENT_SESSIONS,
+        workers=EXTRACTION_WORKERS,
+        cache=None,
+        limiter=None,
+        executor=None,
+        output_buffer_size=OUTPUT_BUFFER_SIZE,
+        backend=None,
+        rate_limiter=None,
+    ):
+        self.concurrency = concurrency
+        self.workers = workers
+        self.cache = cache
+        self.limiter = limiter
+        self.executor = executor
+        self.output_buffer_size = output_buffer_size
+        self.backend = backend
+        self.rate_limiter = rate_limiter
+
+    def options(self, backend=None):
+        return {
+            "concurrency": self.concurrency,
+            "workers": self.workers,
+            "cache": self.cache,
+            "limiter": self.limiter,
+            "executor": self.executor,
+            "output_buffer_size": self.output_buffer_size,
+            "backend": backend or self.backend,
+            "rate_limiter": self.rate_limiter,
+        }
+
+    def extract_text(self, pdf_path, cancel_token=None):
+        """Extract the cleaned text of a PDF, returning (text, total_pages)."""
+        return extract_and_clean_text(
+            pdf_path, workers=self.workers, cancel_token=cancel_token
+        )
+
+    def extract_pages(self, pdf_path, cancel_token=None):
+        """Extract the cleaned text of a PDF page by page; see PageTexts."""
+        return PageTexts(pdf_path, workers=self.workers, cancel_token=cancel_token)
+
+    async def convert_async(
+        self,
+        pdf_path,
+        output_path,
+        progress_callback=None,
+        status_callback=None,
+        resume=False,
+        cancel_token=None,
+        backend=None,
+    ):
+        await convert_pdf_async(
+            pdf_path,
+            output_path,
+            progress_callback or (lambda percent, message: None),
+            status_callback,
+            resume=resume,
+            cancel_token=cancel_token,
+            **self.options(backend),
+        )
+
+    async def resume_async(
+        self,
+        output_path,
+        progress_callback=None,
+        status_callback=None,
+        cancel_token=None,
+        backend=None,
+    ):
+        await resume_conversion_async(
+            output_path,
+            progress_callback or (lambda percent, message: None),
+            status_callback=status_callback,
+            cancel_token=cancel_token,
+            **self.options(backend),
+        )
+
+    def convert(self, pdf_path, output_path, progress_callback=None, **kwargs):
+        """Convert a PDF to MP3, blocking until the file is written."""
+        shared_event_loop().run(
+            self.convert_async(pdf_path, output_path, progress_callback, **kwargs)
+        )
+
+    def resume(self, output_path, progress_callback=None, **kwargs):
+        """Resume an interrupted conversion, blocking until it finishes."""
+        shared_event_loop().run(
+            self.resume_async(output_path, progress_callback, **kwargs)
+        )
@@ -0,0 +1,66 @@
+"""A long-lived asyncio event loop shared by every conversion."""
+
+import asyncio
+import threading
+
+
+class EventLoopThread:
+    """Run an asyncio event loop on a daemon thread for the life of the app.
+
+    Any thread can hand it coroutines with `submit()` (returning a
+    concurrent.futures.Future) or `run()` (blocking until the result is
+    ready). Conversions submitted this way run side by side on one loop, so
+    they can share sessions and don't pay for building and tearing down a
+    loop each time.
+    """
+
+    def __init__(self, name="textwave-event-loop"):
+        self.name = name
+        self.loop = None
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def start(self):
+        with self.lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            self.thread = threading.Thread(
+                target=self.run_forever, args=(ready,), name=self.name, daemon=True
+            )
+            self.thread.start()
+            ready.wait()
+
+    def run_forever(self, ready):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(ready.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.close()
+
+    def submit(self, coroutine):
+        """Schedule a coroutine on the loop, starting the loop if needed."""
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def run(self, coroutine):
+        """Run a coroutine on the loop and wait for its result."""
+        return self.submit(coroutine).result()
+
+    def stop(self):
+        with self.lock:
+            if not (self.thread and self.thread.is_alive()):
+                return
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+
+
+_shared_loop = EventLoopThread()
+
+
+def shared_event_loop():
+    """The process-wide event loop thread, started on first use."""
+    return _shared_loop
@@ -0,0 +1,292 @@
+"""PDF text extraction and cleanup."""
+
+import collections
+import concurrent.futures
+import math
+import os
+import re
+
+from pypdf import PdfReader
+
+from .cancellation import CancellationToken
+
+# Documents with at least PARALLEL_EXTRACTION_MIN_PAGES pages are extracted by
+# a pool of worker processes, each handling a contiguous range of pages.
+PARALLEL_EXTRACTION_MIN_PAGES = 32
+EXTRACTION_WORKERS = os.cpu_count() or 1
+
+ROMAN_NUMERAL = (
+    r"(?=[ivxlcdm])m{0,4}(?:cm|cd|d?c{0,3})(?:xc|xl|l?x{0,3})(?:ix|iv|v?i{0,3})"
+)
+# Front matter numbering rarely reaches cd, and leaving out d and m spares
+# words like "mix" and "di"
+SMALL_ROMAN_NUMERAL = r"(?=[ivxlc])c{0,3}(?:xc|xl|l?x{0,3})(?:ix|iv|v?i{0,3})"
+
+# Lines holding nothing but a page number: "12", "- 12 -", "Page 12",
+# "12 of 30", "Page 12 / 30" and roman numerals that look like page labels
+# ("xiv", "Page XIV", "- XIV -"). A bare capitalized or large roman numeral
+# is more likely a word ("I", "CD", "Vi", "mix") and is kept.
+PAGE_NUMBER_PATTERN = re.compile(
+    rf"""^\s*(?:
+        [-–—]?\s*(?:page\s*)?\d+(?:\s*(?:of|/)\s*\d+)?\s*[-–—]?
+        | page\s*{ROMAN_NUMERAL}(?:\s*(?:of|/)\s*(?:\d+|{ROMAN_NUMERAL}))?
+        | [-–—]\s*{ROMAN_NUMERAL}\s*[-–—]
+        | (?-i:{SMALL_ROMAN_NUMERAL})
+    )\s*$""",
+    re.IGNORECASE | re.VERBOSE,
+)
+DIGITS_PATTERN = re.compile(r"\d+")
+
+# Running headers and footers are found among the first and last
+# BOILERPLATE_EDGE_LINES lines of each page: a line that recurs on at least
+# BOILERPLATE_MIN_REPEATS pages within BOILERPLATE_LOOKAHEAD pages either
+# side is dropped. Lines must match exactly, except for a page number that
+# goes up with the pages. Pages are held back BOILERPLATE_LOOKAHEAD pages so
+# the first ones can be checked too.
+BOILERPLATE_EDGE_LINES = 2
+BOILERPLATE_LOOKAHEAD = 4
+BOILERPLATE_MIN_REPEATS = 3
+
+# A line starting more than PARAGRAPH_GAP_LINES line heights below the one
+# before it starts a new paragraph. Leading within a paragraph is usually
+# around 1.2.
+PARAGRAPH_GAP_LINES = 1.5
+
+
+def extract_page_text(page):
+    """Extract the text of a pypdf page, with a blank line between
+    paragraphs.
+
+    pypdf leaves out the vertical gaps between lines, so their positions are
+    taken from its text visitor. If the visited text doesn't add up to the
+    extracted text, that is returned as it is.
+    """
+    fragments = []
+    parts = []
+    previous = None
+    line_start = True
+
+    def visit(text, cm, tm, font_dict, font_size):
+        nonlocal previous, line_start
+        fragments.append(text)
+        if line_start and text.strip():
+            y = tm[4] * cm[1] + tm[5] * cm[3] + cm[5]
+            height = font_size * abs(tm[3] * cm[3])
+            if previous is not None and 0 < previous[1] < previous[0] - y:
+                parts.append("\n")
+            previous = (y, height * PARAGRAPH_GAP_LINES)
+        if text:
+            parts.append(text)
+            line_start = text.endswith("\n")
+
+    text = page.extract_text(visitor_text=visit)
+    if "".join(fragments) != text:
+        return text
+    return "".join(parts)
+
+
+def page_lines(text):
+    """Split a page's text into lines, dropping page number lines."""
+    return [line for line in text.split("\n") if not PAGE_NUMBER_PATTERN.match(line)]
+
+
+def join_lines(lines):
+    """Join lines into one line per paragraph, with a blank line between
+    paragraphs."""
+    paragraphs = [[]]
+    for line in lines:
+        if line.strip():
+            paragraphs[-1].append(line)
+        elif paragraphs[-1]:
+            paragraphs.append([])
+    return "\n\n".join(" ".join(paragraph) for paragraph in paragraphs if paragraph)
+
+
+def clean_page_text(text):
+    """Remove page number lines from a page's text and join it into one line
+    per paragraph."""
+    if not text:
+        return None
+    return join_lines(page_lines(text))
+
+
+class PageText:
+    """The cleaned text of one page, with its 0-based page index."""
+
+    __slots__ = ("index", "text", "chars")
+
+    def __init__(self, index, text):
+        self.index = index
+        self.text = text
+        self.chars = len(text)
+
+    def __repr__(self):
+        return f"PageText(index={self.index}, chars={self.chars})"
+
+
+def boilerplate_keys(line, index):
+    """The keys under which a line on page `index` matches lines on other
+    pages: the line itself, ignoring case and spacing, and, for its first
+    and last number, the line with that number replaced by its offset from
+    the page index. So "Annual Report 2024 - 7" on one page matches
+    "Annual Report 2024 - 8" on the next, but numbered lines and table
+    rows ("2010 12.0 13.0", "2011 12.1 13.1") don't match each other."""
+    normalized = " ".join(line.lower().split())
+    keys = {(normalized, None)}
+    numbers = list(DIGITS_PATTERN.finditer(normalized))
+    for match in {numbers[0], numbers[-1]} if numbers else ():
+        template = normalized[: match.start()] + "#" + normalized[match.end() :]
+        keys.add((template, int(match.group()) - index))
+    return keys
+
+
+class PageCleaner:
+    """Clean the pages of a document in order, dropping page numbers and
+    repeated headers and footers.
+
+    `add()` takes each page's raw text and returns the PageTexts now ready,
+    which trail the pages added by BOILERPLATE_LOOKAHEAD pages; `finish()`
+    returns the rest. Pages without any text produce no PageText.
+    `chars_removed` counts the characters dropped from the cleaned text.
+    """
+
+    def __init__(
+        self,
+        lookahead=BOILERPLATE_LOOKAHEAD,
+        min_repeats=BOILERPLATE_MIN_REPEATS,
+        edge_lines=BOILERPLATE_EDGE_LINES,
+    ):
+        self.lookahead = lookahead
+        self.min_repeats = min_repeats
+        self.edge_lines = edge_lines
+        self.pending = collections.deque()
+        # Header and footer candidates of the pages around the next one out
+        self.window = collections.deque()
+        self.counts = collections.Counter()
+        self.chars_removed = 0
+
+    def add(self, index, text):
+        lines = page_lines(text) if text else []
+        filled = [i for i, line in enumerate(lines) if line.strip()]
+        # Leave at least one line between the header and footer candidates,
+        # so a short page is never taken for boilerplate as a whole
+        count = max(0, min(self.edge_lines, (len(filled) - 1) // 2))
+        edges = {
+            i: boilerplate_keys(lines[i], index)
+            for i in filled[:count] + filled[len(filled) - count :]
+        }
+        self.pending.append((index, text, lines, edges))
+        self.window.append(set().union(*edges.values()))
+        self.counts.update(self.window[-1])
+        if len(self.window) > 2 * self.lookahead + 1:
+            self.counts.subtract(self.window.popleft())
+
+        ready = []
+        while len(self.pending) > self.lookahead:
+            ready.extend(self.next_page())
+        return ready
+
+    def finish(self):
+        ready = []
+        while self.pending:
+            ready.extend(self.next_page())
+        return ready
+
+    def next_page(self):
+        index, text, lines, edges = self.pending.popleft()
+        if not text:
+            return []
+
+        repeated = {
+            i
+            for i, keys in edges.items()
+            if any(self.counts[key] >= self.min_repeats for key in keys)
+        }
+        page_text = join_lines(
+            line for i, line in enumerate(lines) if i not in repeated
+        )
+        self.chars_removed += len(text) - len(page_text)
+        return [PageText(index, page_text)]
+
+
+def extract_page_range(pdf_path, start, stop):
+    """Extract the raw text of pages [start, stop) of a PDF.
+
+    Runs in a worker process, so it opens its own PdfReader.
+    """
+    reader = PdfReader(pdf_path)
+    return [extract_page_text(reader.pages[i]) for i in range(start, stop)]
+
+
+def page_ranges(total_pages, workers):
+    """Split pages into a few contiguous (start, stop) ranges per worker so
+    that slow pages don't leave the other workers idle."""
+    range_size = max(1, math.ceil(total_pages / (workers * 4)))
+    return [
+        (start, min(start + range_size, total_pages))
+        for start in range(0, total_pages, range_size)
+    ]
+
+
+def extract_pages_in_parallel(pdf_path, total_pages, workers, cancel_token=None):
+    """Extract all pages of a PDF using a pool of worker processes and
+    return the raw page texts in page order."""
+    cancel_token = cancel_token or CancellationToken()
+    starts, stops = zip(*page_ranges(total_pages, workers))
+
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    try:
+        page_texts = []
+        for texts in executor.map(
+            extract_page_range, [pdf_path] * len(starts), starts, stops
+        ):
+            cancel_token.raise_if_cancelled()
+            page_texts.extend(texts)
+    finally:
+        # After a cancellation, drop the ranges that haven't started yet
+        executor.shutdown(wait=False, cancel_futures=True)
+    return page_texts
+
+
+class PageTexts:
+    """The cleaned pages of a PDF, extracted as they are iterated.
+
+    Iterating yields a PageText for every page with any text, in page order,
+    so callers can work page by page without holding the whole document in
+    one string. `text()` joins the pages when a single string is needed.
+    Once iterated, `chars_removed` is the number of characters of page
+    numbers, headers and footers that were dropped.
+    """
+
+    def __init__(self, pdf_path, workers=1, cancel_token=None):
+        self.pdf_path = pdf_path
+        self.workers = workers
+        self.cancel_token = cancel_token or CancellationToken()
+        self.reader = PdfReader(pdf_path)
+        self.total_pages = len(self.reader.pages)
+        self.chars_removed = 0
+
+    def __iter__(self):
+        if self.workers > 1 and self.total_pages >= PARALLEL_EXTRACTION_MIN_PAGES:
+            page_texts = extract_pages_in_parallel(
+                self.pdf_path, self.total_pages, self.workers, self.cancel_token
+            )
+        else:
+            page_texts = (extract_page_text(page) for page in self.reader.pages)
+
+        cleaner = PageCleaner()
+        for index, text in enumerate(page_texts):
+            self.cancel_token.raise_if_cancelled()
+            yield from cleaner.add(index, text)
+        yield from cleaner.finish()
+        self.chars_removed = cleaner.chars_removed
+
+    def text(self):
+        """Join the pages into one string, each followed by a space."""
+        return "".join(f"{page.text} " for page in self)
+
+
+def extract_and_clean_text(pdf_path, workers=1, cancel_token=None):
+    """Extract the cleaned text of a PDF, returning (text, total_pages)."""
+    pages = PageTexts(pdf_path, workers, cancel_token)
+    return pages.text(), pages.total_pages
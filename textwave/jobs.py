@@ -0,0 +1,163 @@
+"""Queue of conversion jobs, scheduled shortest document first."""
+
+import asyncio
+import glob
+import os
+from pathlib import Path
+
+DEFAULT_MAX_RUNNING = 2
+
+
+def expand_inputs(patterns):
+    """Expand files, directories and glob patterns into a list of PDF paths,
+    returning (paths, patterns that matched nothing)."""
+    paths = []
+    unmatched = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = sorted(str(p) for p in Path(pattern).glob("*.pdf"))
+        elif glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+        else:
+            matches = [pattern] if os.path.isfile(pattern) else []
+
+        if not matches:
+            unmatched.append(pattern)
+        for match in matches:
+            if match not in paths:
+                paths.append(match)
+    return paths, unmatched
+
+
+def estimate_pages(pdf_path):
+    """Get a PDF's page count without extracting any text, or 0 if the file
+    can't be read (so it is scheduled early and fails fast)."""
+    from pypdf import PdfReader
+
+    try:
+        return len(PdfReader(pdf_path).pages)
+    except Exception:
+        return 0
+
+
+async def count_pages(jobs, on_counted):
+    """Estimate the page counts of jobs in worker threads, calling
+    `on_counted(job, pages)` as each one comes in."""
+
+    async def count(job):
+        on_counted(job, await asyncio.to_thread(estimate_pages, job.pdf_path))
+
+    await asyncio.gather(*(count(job) for job in jobs))
+
+
+class Job:
+    """One PDF to convert, the speech engine to convert it with (None for
+    the default) and its current state. `pages` is None until the pages
+    have been counted (see count_pages)."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    FINISHED = (DONE, FAILED, CANCELLED)
+
+    def __init__(self, pdf_path, output_path, pages=None, state=QUEUED, engine=None):
+        self.pdf_path = str(pdf_path)
+        self.output_path = str(output_path)
+        self.engine = engine
+        self.pages = pages
+        self.state = state
+        self.progress = 0
+        self.message = ""
+
+    @property
+    def sort_key(self):
+        # Fewest pages first; file size breaks ties between equal page counts
+        try:
+            size = os.path.getsize(self.pdf_path)
+        except OSError:
+            size = 0
+        return (self.pages, size)
+
+    def to_dict(self):
+        return {
+            "pdf_path": self.pdf_path,
+            "output_path": self.output_path,
+            "pages": self.pages,
+            "state": self.state,
+            "engine": self.engine,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data["pdf_path"],
+            data["output_path"],
+            data["pages"],
+            data["state"],
+            data.get("engine"),
+        )
+
+
+class JobQueue:
+    """Conversion jobs waiting, running and finished.
+
+    Up to `max_running` jobs run at a time, and queued jobs are started
+    shortest document first to minimize the mean time to completion of a
+    mixed batch. Added jobs start out uncounted, so adding a folder of large
+    PDFs doesn't wait on reading them; nothing is started while any queued
+    job's pages are still being counted.
+    """
+
+    def __init__(self, max_running=DEFAULT_MAX_RUNNING):
+        self.max_running = max_running
+        self.jobs = []
+
+    def add(self, pdf_path, output_path, engine=None):
+        job = Job(pdf_path, output_path, engine=engine)
+        self.jobs.append(job)
+        return job
+
+    def with_state(self, state):
+        return [job for job in self.jobs if job.state == state]
+
+    def uncounted(self):
+        return [job for job in self.jobs if job.pages is None]
+
+    def next_jobs(self):
+        """Mark and return the jobs that should start now."""
+        free = self.max_running - len(self.with_state(Job.RUNNING))
+        if free <= 0:
+            return []
+
+        queued = self.with_state(Job.QUEUED)
+        if any(job.pages is None for job in queued):
+            return []  # Shortest first needs every page count
+
+        jobs = sorted(queued, key=lambda job: job.sort_key)
+        for job in jobs[:free]:
+            job.state = Job.RUNNING
+        return jobs[:free]
+
+    def clear_finished(self):
+        self.jobs = [job for job in self.jobs if job.state not in Job.FINISHED]
+
+    def to_list(self):
+        """Serialize the unfinished jobs so the queue survives a restart."""
+        return [
+            job.to_dict()
+            for job in self.jobs
+            if job.state in (Job.QUEUED, Job.RUNNING)
+        ]
+
+    @classmethod
+    def from_list(cls, items, max_running=DEFAULT_MAX_RUNNING):
+        """Restore a saved queue; jobs that were running when the app quit
+        are queued again (and can resume from their checkpoints)."""
+        queue = cls(max_running)
+        for item in items:
+            job = Job.from_dict(item)
+            job.state = Job.QUEUED
+            queue.jobs.append(job)
+        return queue
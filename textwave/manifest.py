@@ -0,0 +1,118 @@
+"""Job manifests used to resume interrupted conversions."""
+
+import contextlib
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from .backends import SYNTHESIS_PARAMS, VOICE
+
+
+def manifest_path(output_file):
+    """Get the path of the job manifest kept next to an output file."""
+    return Path(f"{output_file}.resume.json")
+
+
+class JobManifest:
+    """Checkpoint of an in-progress conversion, stored next to the output.
+
+    Chunks are written to the output strictly in order, so the manifest only
+    needs to record how many chunks (and bytes of audio) are complete plus a
+    rolling digest of their text to confirm a resumed job produces the same
+    chunks.
+    """
+
+    VERSION = 1
+
+    def __init__(self, output_file, source, voice=VOICE, params=None):
+        self.output_file = str(output_file)
+        self.source = str(Path(source).resolve())
+        self.voice = voice
+        self.params = dict(SYNTHESIS_PARAMS if params is None else params)
+        stat = os.stat(self.source)
+        self.source_size = stat.st_size
+        self.source_mtime = stat.st_mtime
+        self.completed_chunks = 0
+        self.bytes_written = 0
+        self.digest = ""
+
+    @property
+    def path(self):
+        return manifest_path(self.output_file)
+
+    @staticmethod
+    def chain_digest(digest, chunk):
+        return hashlib.sha256(f"{digest}\0{chunk}".encode("utf-8")).hexdigest()
+
+    @classmethod
+    def load(cls, output_file):
+        """Load the manifest for output_file, or None if there isn't one."""
+        try:
+            data = json.loads(manifest_path(output_file).read_text())
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != cls.VERSION:
+            return None
+
+        manifest = cls.__new__(cls)
+        manifest.output_file = str(output_file)
+        for field in (
+            "source",
+            "voice",
+            "params",
+            "source_size",
+            "source_mtime",
+            "completed_chunks",
+            "bytes_written",
+            "digest",
+        ):
+            setattr(manifest, field, data[field])
+        return manifest
+
+    def matches(self, source, voice=VOICE, params=None):
+        """Check whether this manifest can be resumed for the given job."""
+        try:
+            stat = os.stat(source)
+            output_size = os.path.getsize(self.output_file)
+        except OSError:
+            return False
+        return (
+            str(Path(source).resolve()) == self.source
+            and stat.st_size == self.source_size
+            and stat.st_mtime == self.source_mtime
+            and voice == self.voice
+            and dict(SYNTHESIS_PARAMS if params is None else params) == self.params
+            and output_size >= self.bytes_written
+        )
+
+    def record_chunk(self, chunk, audio_bytes):
+        self.record_chunks([(chunk, audio_bytes)])
+
+    def record_chunks(self, chunks):
+        """Checkpoint several (chunk, audio_bytes) pairs with one save."""
+        for chunk, audio_bytes in chunks:
+            self.completed_chunks += 1
+            self.bytes_written += audio_bytes
+            self.digest = self.chain_digest(self.digest, chunk)
+        self.save()
+
+    def save(self):
+        data = {
+            "version": self.VERSION,
+            "source": self.source,
+            "voice": self.voice,
+            "params": self.params,
+            "source_size": self.source_size,
+            "source_mtime": self.source_mtime,
+            "completed_chunks": self.completed_chunks,
+            "bytes_written": self.bytes_written,
+            "digest": self.digest,
+        }
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        temp_path.write_text(json.dumps(data))
+        os.replace(temp_path, self.path)
+
+    def remove(self):
+        with contextlib.suppress(FileNotFoundError):
+            self.path.unlink()
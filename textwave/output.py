@@ -0,0 +1,85 @@
+"""Write-behind output of synthesized audio."""
+
+import asyncio
+import queue
+import threading
+
+# Audio is collected into buffers of about OUTPUT_BUFFER_SIZE bytes (around
+# 45 seconds of speech) which a writer thread writes and flushes, so slow or
+# network-mounted disks never stall synthesis. At most OUTPUT_QUEUE_DEPTH
+# full buffers wait for the writer before producers have to wait too.
+OUTPUT_BUFFER_SIZE = 256 * 1024
+OUTPUT_QUEUE_DEPTH = 4
+
+
+class AudioWriter:
+    """Write audio to an open binary file from a dedicated thread.
+
+    `write()` only appends to an in-memory buffer; full buffers are handed
+    to the writer thread, which writes them in a single call and then
+    passes the tokens given with the buffered data to `on_flush` (e.g. to
+    checkpoint the chunks that are now on disk). `close()` writes whatever
+    is left and re-raises any error the writer thread hit.
+    """
+
+    def __init__(self, file, buffer_size=OUTPUT_BUFFER_SIZE, on_flush=None):
+        self.file = file
+        self.buffer_size = buffer_size
+        self.on_flush = on_flush
+        self.buffers = []
+        self.tokens = []
+        self.buffered = 0
+        self.flushes = 0
+        self.error = None
+        self.queue = queue.Queue(OUTPUT_QUEUE_DEPTH)
+        self.thread = threading.Thread(
+            target=self.run, name="textwave-audio-writer", daemon=True
+        )
+        self.thread.start()
+
+    async def write(self, data, token=None):
+        if self.error:
+            raise self.error
+        self.buffers.append(data)
+        self.buffered += len(data)
+        if token is not None:
+            self.tokens.append(token)
+        if self.buffered >= self.buffer_size:
+            await self.flush()
+
+    async def flush(self):
+        """Hand the current buffer to the writer thread."""
+        if not self.buffers:
+            return
+        item = (self.buffers, self.tokens)
+        self.buffers, self.tokens, self.buffered = [], [], 0
+        await self.put(item)
+
+    async def put(self, item):
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            # The disk is behind; wait for it without blocking the event loop
+            await asyncio.to_thread(self.queue.put, item)
+
+    async def close(self):
+        await self.flush()
+        await self.put(None)
+        await asyncio.to_thread(self.thread.join)
+        if self.error:
+            raise self.error
+
+    def run(self):
+        while (item := self.queue.get()) is not None:
+            if self.error:
+                # Keep draining so producers never wait on a dead writer
+                continue
+            buffers, tokens = item
+            try:
+                self.file.writelines(buffers)
+                self.file.flush()
+                self.flushes += 1
+                if self.on_flush:
+                    self.on_flush(tokens)
+            except Exception as e:
+                self.error = e
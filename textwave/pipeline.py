@@ -0,0 +1,404 @@
+"""Streaming PDF to MP3 conversion pipeline."""
+
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import os
+
+from pypdf import PdfReader
+
+from .backends import EdgeTTSBackend
+from .cancellation import CancellationToken, ConversionCancelled
+from .extraction import (
+    PARALLEL_EXTRACTION_MIN_PAGES,
+    PageCleaner,
+    extract_page_range,
+    extract_page_text,
+    page_ranges,
+)
+from .manifest import JobManifest
+from .output import OUTPUT_BUFFER_SIZE, AudioWriter
+from .progress import TextProgress, format_duration
+from .retry import RetryPolicy
+from .segmentation import iter_text_chunks
+from .synthesis import (
+    MAX_CONCURRENT_SESSIONS,
+    synthesize_in_order,
+    tts_connection_error,
+)
+
+# Stage queues of the streaming pipeline hold at most PIPELINE_QUEUE_SIZE
+# items, so a fast stage waits for a slow one instead of buffering the book.
+PIPELINE_QUEUE_SIZE = 8
+QUEUE_REPORT_INTERVAL = 5.0
+
+
+class ConversionPipeline:
+    """Stream a PDF to MP3 through extraction → cleaning → segmentation →
+    synthesis → file writing stages connected by bounded queues.
+
+    Synthesis of the first pages starts while later pages are still being
+    parsed, and only a few pages of text are held in memory at a time.
+    """
+
+    def __init__(
+        self,
+        pdf_path,
+        output_file,
+        progress_callback,
+        status_callback=None,
+        concurrency=MAX_CONCURRENT_SESSIONS,
+        workers=1,
+        cache=None,
+        resume=False,
+        retry_policy=None,
+        limiter=None,
+        executor=None,
+        queue_size=PIPELINE_QUEUE_SIZE,
+        cancel_token=None,
+        output_buffer_size=OUTPUT_BUFFER_SIZE,
+        backend=None,
+        rate_limiter=None,
+    ):
+        self.pdf_path = pdf_path
+        self.output_file = output_file
+        self.progress_callback = progress_callback
+        self.status_callback = status_callback or (lambda message: None)
+        self.concurrency = concurrency
+        self.workers = workers
+        self.cache = cache
+        self.resume = resume
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.limiter = limiter
+        self.executor = executor
+        self.queue_size = queue_size
+        self.cancel_token = cancel_token or CancellationToken()
+        self.output_buffer_size = output_buffer_size
+        self.backend = backend or EdgeTTSBackend()
+        self.rate_limiter = rate_limiter
+        self.manifest = None
+        self.resumed_chunks = 0
+
+        self.raw_pages = asyncio.Queue(queue_size)
+        self.cleaned_pages = asyncio.Queue(queue_size)
+        self.chunks = asyncio.Queue(queue_size)
+        self.cleaner = PageCleaner()
+
+        self.total_pages = 0
+        self.pages_extracted = 0
+        self.chars_extracted = 0
+        self.chars_segmented = 0
+        self.segmentation_done = False
+        self.progress = TextProgress()
+        self.chunks_started = 0
+        self.chunks_written = 0
+        self.bytes_written = 0
+        # Counted here, as the cache may be shared with other documents
+        self.cache_hits = 0
+
+    async def extract_pages(self):
+        """Stage 1: extract raw page text, in a process pool for large PDFs."""
+        reader = await asyncio.to_thread(PdfReader, self.pdf_path)
+        self.total_pages = len(reader.pages)
+
+        if self.workers > 1 and self.total_pages >= PARALLEL_EXTRACTION_MIN_PAGES:
+            await self.extract_pages_in_parallel()
+        else:
+            for page in reader.pages:
+                text = await asyncio.to_thread(extract_page_text, page)
+                await self.raw_pages.put(text)
+
+        await self.raw_pages.put(None)
+
+    async def extract_pages_in_parallel(self):
+        loop = asyncio.get_running_loop()
+        executor = self.executor or concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers
+        )
+        pending = collections.deque()
+        try:
+            for start, stop in page_ranges(self.total_pages, self.workers):
+                pending.append(
+                    loop.run_in_executor(
+                        executor, extract_page_range, self.pdf_path, start, stop
+                    )
+                )
+                # Keep a couple of ranges per worker queued, not the whole book
+                if len(pending) >= self.workers * 2:
+                    for text in await pending.popleft():
+                        await self.raw_pages.put(text)
+
+            while pending:
+                for text in await pending.popleft():
+                    await self.raw_pages.put(text)
+        finally:
+            if executor is not self.executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                for future in pending:
+                    future.cancel()
+
+    async def clean_pages(self):
+        """Stage 2: strip page numbers and running headers and footers from
+        each page's text."""
+        while (text := await self.raw_pages.get()) is not None:
+            for page in self.cleaner.add(self.pages_extracted, text):
+                await self.put_cleaned_page(page)
+            self.pages_extracted += 1
+
+        for page in self.cleaner.finish():
+            await self.put_cleaned_page(page)
+        await self.cleaned_pages.put(None)
+
+    async def put_cleaned_page(self, page):
+        self.chars_extracted += page.chars + 1
+        await self.cleaned_pages.put(page)
+
+    async def segment_text(self):
+        """Stage 3: split page text into synthesis chunks.
+
+        Sentences often continue onto the next page, so the last chunk of
+        each page is carried over and joined with the following page.
+        """
+        carry = ""
+        while (page := await self.cleaned_pages.get()) is not None:
+            pending = ""
+            for chunk in iter_text_chunks(f"{carry} {page.text}"):
+                if pending:
+                    self.chars_segmented += len(pending)
+                    await self.chunks.put(pending)
+                pending = chunk
+            carry = pending
+
+        if carry:
+            self.chars_segmented += len(carry)
+            await self.chunks.put(carry)
+        self.segmentation_done = True
+        await self.chunks.put(None)
+
+    async def iter_chunks(self):
+        # Chunks already in the output of a resumed job are skipped, after
+        # checking they are the same chunks the interrupted job wrote
+        digest = ""
+        skipped = 0
+        while skipped < self.resumed_chunks:
+            chunk = await self.chunks.get()
+            if chunk is None:
+                break
+            digest = JobManifest.chain_digest(digest, chunk)
+            self.progress.skip(len(chunk))
+            skipped += 1
+        if skipped != self.resumed_chunks or digest != self.manifest.digest:
+            raise Exception(
+                "Cannot resume: the document text no longer matches the "
+                "interrupted conversion. Please start a new conversion."
+            )
+        self.chunks_started = skipped
+
+        while (chunk := await self.chunks.get()) is not None:
+            self.chunks_started += 1
+            yield chunk
+
+    def open_output(self):
+        """Open the output file, picking up after the last completed chunk
+        when resuming, and set up the job manifest."""
+        manifest = JobManifest.load(self.output_file) if self.resume else None
+        voice = (self.backend.voice_id(), self.backend.params)
+        if manifest and manifest.matches(self.pdf_path, *voice):
+            f = open(self.output_file, "r+b")
+            f.truncate(manifest.bytes_written)
+            f.seek(manifest.bytes_written)
+            self.resumed_chunks = self.chunks_written = manifest.completed_chunks
+            self.bytes_written = manifest.bytes_written
+            self.status_callback(
+                f"Resuming after {manifest.completed_chunks} completed chunks"
+            )
+        else:
+            f = open(self.output_file, "wb")
+            manifest = JobManifest(self.output_file, self.pdf_path, *voice)
+            manifest.save()
+
+        self.manifest = manifest
+        return f
+
+    async def write_audio(self):
+        """Stages 4 and 5: synthesize chunks concurrently and write the
+        audio to the output file in order, checkpointing chunks once their
+        audio is on disk."""
+        async with contextlib.aclosing(
+            synthesize_in_order(
+                self.iter_chunks(),
+                self.concurrency,
+                self.cache,
+                self.retry_policy,
+                self.limiter,
+                self.backend,
+                self.rate_limiter,
+                self.count_cache_hit,
+            )
+        ) as results:
+            with self.open_output() as f:
+                writer = AudioWriter(
+                    f, self.output_buffer_size, self.manifest.record_chunks
+                )
+                try:
+                    await self.write_results(results, writer)
+                finally:
+                    # Also on errors and cancellation, so the checkpoint
+                    # covers every chunk handed to the writer
+                    await writer.close()
+
+        # The output is complete, so there is nothing left to resume
+        self.manifest.remove()
+
+    def count_cache_hit(self):
+        self.cache_hits += 1
+
+    async def write_results(self, results, writer):
+        async for chunk, audio in results:
+            await writer.write(audio, (chunk, len(audio)))
+            self.chunks_written += 1
+            self.bytes_written += len(audio)
+            self.progress.advance(len(chunk))
+            self.report_progress()
+
+    def report_progress(self):
+        """Report the share of the document's text synthesized so far."""
+        if self.segmentation_done:
+            total_chars = self.chars_segmented
+        else:
+            # Total length is unknown until extraction finishes, so
+            # extrapolate from the pages extracted so far
+            total_chars = max(self.chars_extracted, self.chars_segmented)
+            if 0 < self.pages_extracted < self.total_pages:
+                total_chars *= self.total_pages / self.pages_extracted
+        self.progress.total_chars = max(int(total_chars), self.progress.done_chars)
+
+        self.progress_callback(
+            int(self.progress.percent), self.progress.message(self.bytes_written)
+        )
+
+    def queue_depths(self):
+        return (
+            f"Queues: pages {self.raw_pages.qsize()}/{self.queue_size}, "
+            f"cleaned {self.cleaned_pages.qsize()}/{self.queue_size}, "
+            f"chunks {self.chunks.qsize()}/{self.queue_size}, "
+            f"synthesizing {self.chunks_started - self.chunks_written}"
+            f"/{self.concurrency}"
+        )
+
+    async def report_queue_depths(self):
+        while True:
+            await asyncio.sleep(QUEUE_REPORT_INTERVAL)
+            self.status_callback(self.queue_depths())
+
+    def boilerplate_summary(self):
+        removed = self.cleaner.chars_removed
+        message = (
+            f"Skipped {removed:,} characters of page numbers, headers and footers"
+        )
+        rate = self.progress.chars_per_second()
+        if rate:
+            message += f" (about {format_duration(removed / rate)} of synthesis)"
+        return message
+
+    def discard_partial_output(self):
+        """After a cancellation, keep the checkpointed output for resuming,
+        or remove it if no audio was written yet."""
+        if self.manifest is None:
+            return
+        if self.chunks_written:
+            self.status_callback(
+                f"Cancelled after {self.chunks_written} chunks; "
+                "the conversion can be resumed later"
+            )
+        else:
+            self.manifest.remove()
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.output_file)
+
+    async def run(self):
+        try:
+            with self.cancel_token.cancel_current_task():
+                await self.run_stages()
+        except ConversionCancelled:
+            self.discard_partial_output()
+            raise
+
+    async def run_stages(self):
+        stages = [
+            asyncio.ensure_future(stage())
+            for stage in (
+                self.extract_pages,
+                self.clean_pages,
+                self.segment_text,
+                self.write_audio,
+            )
+        ]
+        reporter = asyncio.ensure_future(self.report_queue_depths())
+        try:
+            done, _ = await asyncio.wait(
+                stages, return_when=asyncio.FIRST_EXCEPTION
+            )
+            for stage in done:
+                stage.result()
+        except Exception as e:
+            if self.retry_policy.retries:
+                self.status_callback(
+                    f"Gave up after {self.retry_policy.summary()}"
+                )
+            friendly_error = tts_connection_error(e)
+            if friendly_error:
+                raise friendly_error
+            raise
+        finally:
+            for task in stages + [reporter]:
+                task.cancel()
+            await asyncio.gather(*stages, reporter, return_exceptions=True)
+
+        self.status_callback(
+            f"Extracted {self.chars_extracted:,} characters "
+            f"from {self.total_pages} pages"
+        )
+        if self.cleaner.chars_removed:
+            self.status_callback(self.boilerplate_summary())
+        if self.cache_hits:
+            self.status_callback(
+                f"Reused cached audio for {self.cache_hits} "
+                f"of {self.chunks_written} chunks"
+            )
+        self.progress_callback(
+            100,
+            f"Complete! {self.progress.summary(self.bytes_written)}, "
+            f"{self.retry_policy.summary()}",
+        )
+
+
+async def convert_pdf_async(
+    pdf_path,
+    output_file,
+    progress_callback,
+    status_callback=None,
+    **options,
+):
+    """Convert a PDF to an MP3 file using the streaming pipeline.
+
+    `options` are passed to ConversionPipeline. With resume=True, a previous
+    interrupted conversion to the same output file continues from its first
+    unfinished chunk.
+    """
+    pipeline = ConversionPipeline(
+        pdf_path, output_file, progress_callback, status_callback, **options
+    )
+    await pipeline.run()
+
+
+async def resume_conversion_async(output_file, progress_callback, **kwargs):
+    """Resume an interrupted conversion from the manifest next to output_file."""
+    manifest = JobManifest.load(output_file)
+    if manifest is None:
+        raise Exception(f"No interrupted conversion found for {output_file}")
+    await convert_pdf_async(
+        manifest.source, output_file, progress_callback, resume=True, **kwargs
+    )
@@ -0,0 +1,128 @@
+"""Progress estimates and throttled progress reporting."""
+
+import threading
+import time
+
+# Progress callbacks fire once per synthesized chunk, which for a long book
+# is far more often than anyone can read; deliver at most PROGRESS_MAX_RATE
+# updates per second.
+PROGRESS_MAX_RATE = 10.0
+
+
+class ProgressThrottle:
+    """Coalesce progress updates to at most `max_rate` per second.
+
+    Wraps a progress_callback(percent, message). Updates arriving faster than
+    that replace each other, and the latest one is delivered when the next
+    interval starts or by `flush()`. Completion (100%) is always delivered
+    right away. Safe to call from several threads.
+    """
+
+    def __init__(self, callback, max_rate=PROGRESS_MAX_RATE, clock=time.monotonic):
+        self.callback = callback
+        self.interval = 1.0 / max_rate if max_rate else 0.0
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.last_delivered = None
+        self.pending = None
+        self.received = 0
+        self.delivered = 0
+
+    def __call__(self, percent, message):
+        with self.lock:
+            self.received += 1
+            now = self.clock()
+            due = (
+                self.last_delivered is None
+                or now - self.last_delivered >= self.interval
+            )
+            if not (due or percent >= 100):
+                self.pending = (percent, message)
+                return
+            self.pending = None
+            self.last_delivered = now
+            self.delivered += 1
+        self.callback(percent, message)
+
+    def flush(self):
+        """Deliver the latest coalesced update, if any."""
+        with self.lock:
+            update, self.pending = self.pending, None
+            if update is None:
+                return
+            self.last_delivered = self.clock()
+            self.delivered += 1
+        self.callback(*update)
+
+
+def format_duration(seconds):
+    """Format seconds as M:SS or H:MM:SS."""
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+class TextProgress:
+    """Progress, throughput and ETA of a conversion, measured in characters
+    of source text synthesized.
+
+    Unlike the size of the audio written, this doesn't depend on the voice or
+    speaking rate. Text skipped when resuming counts towards progress but not
+    towards throughput.
+    """
+
+    def __init__(self, total_chars=0, clock=time.monotonic):
+        self.total_chars = total_chars
+        self.clock = clock
+        self.started = clock()
+        self.done_chars = 0
+        self.skipped_chars = 0
+
+    def skip(self, chars):
+        self.done_chars += chars
+        self.skipped_chars += chars
+
+    def advance(self, chars):
+        self.done_chars += chars
+
+    @property
+    def percent(self):
+        if not self.total_chars:
+            return 0.0
+        # 100% is only reported once the output is complete
+        return min(self.done_chars / self.total_chars * 100, 99.9)
+
+    def chars_per_second(self):
+        elapsed = self.elapsed()
+        if elapsed <= 0:
+            return 0.0
+        return (self.done_chars - self.skipped_chars) / elapsed
+
+    def eta(self):
+        """Seconds until the remaining text is synthesized, or None before
+        there is a throughput to go by."""
+        rate = self.chars_per_second()
+        if not rate:
+            return None
+        return max(self.total_chars - self.done_chars, 0) / rate
+
+    def elapsed(self):
+        return self.clock() - self.started
+
+    def message(self, bytes_written):
+        eta = self.eta()
+        return (
+            f"{self.done_chars:,} / ~{self.total_chars:,} characters, "
+            f"{self.chars_per_second():,.0f} chars/s, "
+            f"ETA {format_duration(eta) if eta is not None else '--:--'}, "
+            f"{bytes_written / (1024 * 1024):.2f} MB"
+        )
+
+    def summary(self, bytes_written):
+        return (
+            f"{bytes_written / (1024 * 1024):.2f} MB in "
+            f"{format_duration(self.elapsed())} "
+            f"({self.chars_per_second():,.0f} chars/s)"
+        )
@@ -0,0 +1,119 @@
+"""Rate limiting synthesis requests across processes."""
+
+import asyncio
+import contextlib
+import sqlite3
+import time
+from pathlib import Path
+
+from .cache import default_cache_dir
+
+# Each bucket holds up to RATE_LIMIT_BURST seconds' worth of its rate, so a
+# limiter that has been idle can start that many requests at once
+RATE_LIMIT_BURST = 1.0
+# How long to wait for another process's transaction before giving up
+RATE_LIMIT_LOCK_TIMEOUT = 30.0
+
+
+def default_rate_limit_path():
+    """Get the per-user database shared by every TextWave process."""
+    return default_cache_dir().parent / "ratelimit.sqlite3"
+
+
+class RateLimiter:
+    """Token buckets for synthesis requests and characters per second.
+
+    The buckets live in a SQLite database, and every process using the same
+    `path` draws from them, so several TextWave processes (or hosts, with
+    the database on a shared filesystem that supports locking and clocks in
+    sync) together stay within `requests_per_second` and `chars_per_second`.
+    Either rate may be None for no limit.
+
+    `acquire(chars)` takes one request and `chars` characters in a single
+    BEGIN IMMEDIATE transaction and then sleeps until they are covered.
+    Tokens are reserved up front and may go negative, so waiting requests go
+    out in turn at the sustained rate instead of polling the database.
+    """
+
+    def __init__(
+        self,
+        requests_per_second=None,
+        chars_per_second=None,
+        path=None,
+        burst=RATE_LIMIT_BURST,
+    ):
+        self.rates = {
+            name: rate
+            for name, rate in (
+                ("requests", requests_per_second),
+                ("chars", chars_per_second),
+            )
+            if rate is not None
+        }
+        for name, rate in self.rates.items():
+            if rate <= 0:
+                raise ValueError(f"The {name} per second limit must be positive")
+        self.path = Path(path) if path else default_rate_limit_path()
+        self.burst = burst
+        self.waits = 0
+        self.wait_time = 0.0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS buckets "
+                "(name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+
+    @contextlib.contextmanager
+    def connect(self):
+        db = sqlite3.connect(
+            self.path, timeout=RATE_LIMIT_LOCK_TIMEOUT, isolation_level=None
+        )
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def reserve(self, chars):
+        """Take one request and `chars` characters from the buckets and
+        return how many seconds to wait before sending the request."""
+        amounts = {"requests": 1, "chars": chars}
+        delay = 0.0
+        with self.connect() as db:
+            # Take the write lock before reading, so no other process can
+            # spend the same tokens
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                for name, rate in self.rates.items():
+                    capacity = rate * self.burst
+                    row = db.execute(
+                        "SELECT tokens, updated FROM buckets WHERE name = ?", (name,)
+                    ).fetchone()
+                    if row is None:
+                        tokens = capacity
+                    else:
+                        tokens, updated = row
+                        refill = max(0.0, now - updated) * rate
+                        tokens = min(capacity, tokens + refill)
+                    tokens -= amounts[name]
+                    if tokens < 0:
+                        delay = max(delay, -tokens / rate)
+                    db.execute(
+                        "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?)",
+                        (name, tokens, now),
+                    )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        return delay
+
+    async def acquire(self, chars):
+        """Wait until a request of `chars` characters may be sent."""
+        delay = await asyncio.to_thread(self.reserve, chars)
+        if delay > 0:
+            self.waits += 1
+            self.wait_time += delay
+            await asyncio.sleep(delay)
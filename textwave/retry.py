@@ -0,0 +1,77 @@
+"""Retrying transient synthesis failures."""
+
+import asyncio
+import random
+
+import aiohttp
+import edge_tts
+
+# Transient synthesis failures are retried per chunk with capped exponential
+# backoff and full jitter, up to RETRY_BUDGET retries per job.
+MAX_CHUNK_ATTEMPTS = 5
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+RETRY_BUDGET = 50
+
+
+class RetryPolicy:
+    """Retry transient chunk failures, counting retries for one job."""
+
+    def __init__(
+        self,
+        max_attempts=MAX_CHUNK_ATTEMPTS,
+        base_delay=RETRY_BASE_DELAY,
+        max_delay=RETRY_MAX_DELAY,
+        budget=RETRY_BUDGET,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.retries = 0
+        self.retry_delay = 0.0
+
+    @staticmethod
+    def is_transient(error):
+        """Timeouts, dropped connections, throttling and server errors are
+        worth retrying; anything else (e.g. 401/403) fails immediately."""
+        status = getattr(error, "status", None)
+        if isinstance(status, int):
+            return status == 429 or status >= 500
+        return isinstance(
+            error,
+            (
+                asyncio.TimeoutError,
+                ConnectionError,
+                aiohttp.ClientConnectionError,
+                aiohttp.ClientPayloadError,
+                edge_tts.exceptions.WebSocketError,
+            ),
+        )
+
+    def backoff(self, attempt):
+        """Delay before retry number `attempt` (1-based), with full jitter."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    async def run(self, operation):
+        """Await operation(), retrying it on transient failures."""
+        attempt = 0
+        while True:
+            try:
+                return await operation()
+            except Exception as e:
+                attempt += 1
+                if (
+                    not self.is_transient(e)
+                    or attempt >= self.max_attempts
+                    or self.retries >= self.budget
+                ):
+                    raise
+
+                delay = self.backoff(attempt)
+                self.retries += 1
+                self.retry_delay += delay
+                await asyncio.sleep(delay)
+
+    def summary(self):
+        return f"{self.retries} retries ({self.retry_delay:.1f}s backoff)"
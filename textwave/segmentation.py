@@ -0,0 +1,130 @@
+"""Splitting text into chunks for synthesis."""
+
+import re
+
+# Text is synthesized in chunks of at most CHUNK_MAX_CHARS characters. A
+# paragraph break ends the current chunk once it holds CHUNK_MIN_CHARS, so
+# chunks follow the document's paragraphs instead of just filling up.
+CHUNK_MAX_CHARS = 3000
+CHUNK_MIN_CHARS = 2000
+
+PARAGRAPH_BREAK_PATTERN = re.compile(r"\n\s*\n")
+
+# Sentence-ending punctuation (and any closing quotes or brackets) followed
+# by whitespace. Each match is only a candidate; see is_sentence_end().
+SENTENCE_END_PATTERN = re.compile(r"[.!?]+[\"'”’)\]]*(\s+)")
+INITIALS_PATTERN = re.compile(r"(?:[A-Za-z]\.)*[A-Z]")
+
+# Abbreviations that introduce the next word ("Dr. Watson", "e.g. Paris")
+# and so never end a sentence
+PREFIX_ABBREVIATIONS = frozenset(
+    "mr mrs ms dr prof rev hon fr st gen col capt cmdr lt sgt mt "
+    "e.g i.e cf vs".split()
+)
+# Abbreviations commonly followed by a number ("Fig. 3", "approx. 20")
+ABBREVIATIONS = PREFIX_ABBREVIATIONS | frozenset(
+    "no nos vol vols fig figs p pp ch chap sec eq ed approx ca ref".split()
+)
+
+
+def last_word(text, start, end):
+    """The run of non-space characters just before text[end], without any
+    opening quotes or brackets."""
+    i = end
+    while i > start and not text[i - 1].isspace():
+        i -= 1
+    return text[i:end].lstrip("\"'“‘([")
+
+
+def is_sentence_end(text, start, match):
+    """Whether a candidate sentence end really ends a sentence.
+
+    Periods after titles ("Dr. Watson"), initials ("J. R. R. Tolkien",
+    "U.S.") and abbreviations followed by numbers ("No. 5") don't, and
+    nothing does when the next word starts in lowercase. Decimals never
+    match in the first place since there is no space after their point.
+    """
+    punctuation = text[match.start() : match.start(1)]
+    if "!" in punctuation or "?" in punctuation:
+        return True
+
+    next_char = text[match.end() : match.end() + 1]
+    if next_char.islower():
+        return False
+
+    word = last_word(text, start, match.start())
+    if next_char.isdigit():
+        return word.lower() not in ABBREVIATIONS
+    if word.lower() in PREFIX_ABBREVIATIONS:
+        return False
+    return word == "I" or not INITIALS_PATTERN.fullmatch(word)
+
+
+def iter_paragraphs(text):
+    start = 0
+    for match in PARAGRAPH_BREAK_PATTERN.finditer(text):
+        yield text[start : match.start()]
+        start = match.end()
+    yield text[start:]
+
+
+def iter_sentences(paragraph):
+    """Yield the sentences of a paragraph in one pass."""
+    start = 0
+    for match in SENTENCE_END_PATTERN.finditer(paragraph):
+        if is_sentence_end(paragraph, start, match):
+            yield paragraph[start : match.start(1)]
+            start = match.end()
+    yield paragraph[start:]
+
+
+def split_long_sentence(sentence, max_chars):
+    """Split a sentence longer than max_chars at word boundaries."""
+    start = 0
+    while len(sentence) - start > max_chars:
+        split_at = sentence.rfind(" ", start, start + max_chars + 1)
+        if split_at <= start:
+            split_at = start + max_chars
+        yield sentence[start:split_at]
+        start = split_at
+        while start < len(sentence) and sentence[start].isspace():
+            start += 1
+    if start < len(sentence):
+        yield sentence[start:]
+
+
+def iter_text_chunks(text, max_chars=CHUNK_MAX_CHARS, min_chars=CHUNK_MIN_CHARS):
+    """Yield chunks of at most max_chars, breaking between paragraphs and
+    sentences wherever possible.
+
+    Chunks are yielded as soon as they are complete, and the whole text is
+    scanned once, so multi-megabyte documents segment in linear time.
+    """
+    min_chars = min(min_chars, max_chars)
+    parts = []
+    length = 0
+
+    for paragraph in iter_paragraphs(text):
+        for sentence in iter_sentences(paragraph.strip()):
+            for piece in split_long_sentence(sentence.strip(), max_chars):
+                if parts and length + 1 + len(piece) > max_chars:
+                    yield " ".join(parts)
+                    parts = []
+                    length = 0
+                length += len(piece) + (1 if parts else 0)
+                parts.append(piece)
+
+        if parts and length >= min_chars:
+            yield " ".join(parts)
+            parts = []
+            length = 0
+
+    if parts:
+        yield " ".join(parts)
+
+
+def split_text_into_chunks(
+    text, max_chars=CHUNK_MAX_CHARS, min_chars=CHUNK_MIN_CHARS
+):
+    """Split text into a list of chunks; see iter_text_chunks()."""
+    return list(iter_text_chunks(text, max_chars, min_chars))
@@ -0,0 +1,209 @@
+"""Concurrent speech synthesis of text chunks."""
+
+import asyncio
+import contextlib
+
+from .backends import EdgeTTSBackend
+from .cancellation import CancellationToken
+from .output import OUTPUT_BUFFER_SIZE, AudioWriter
+from .progress import TextProgress
+from .retry import RetryPolicy
+from .segmentation import split_text_into_chunks
+
+# Up to MAX_CONCURRENT_SESSIONS synthesis sessions run at the same time
+MAX_CONCURRENT_SESSIONS = 4
+
+
+async def synthesize_chunk(
+    text,
+    cache=None,
+    retry_policy=None,
+    backend=None,
+    limiter=None,
+    rate_limiter=None,
+    on_cache_hit=None,
+):
+    """Synthesize one chunk of text with `backend` (edge-tts by default) and
+    return its MP3 audio, using the cache (if given) to skip synthesis of
+    text synthesized before. `on_cache_hit` (if given) is called when the
+    audio came from the cache.
+
+    Each attempt first waits for the `rate_limiter` (if given), then holds
+    the `limiter` (if given) only while it talks to the speech engine, so
+    cache hits and retry backoff don't take up a session.
+    """
+    backend = backend or EdgeTTSBackend()
+    if cache:
+        key = backend.cache_key(cache, text)
+        audio = await asyncio.to_thread(cache.get, key)
+        if audio is not None:
+            if on_cache_hit:
+                on_cache_hit()
+            return audio
+
+    async def attempt():
+        if rate_limiter is not None:
+            await rate_limiter.acquire(len(text))
+        if limiter is None:
+            return await backend.synthesize(text)
+        async with limiter:
+            return await backend.synthesize(text)
+
+    if retry_policy:
+        audio = await retry_policy.run(attempt)
+    else:
+        audio = await attempt()
+
+    if cache:
+        await asyncio.to_thread(cache.put, key, audio)
+    return audio
+
+
+async def synthesize_in_order(
+    chunks,
+    concurrency=MAX_CONCURRENT_SESSIONS,
+    cache=None,
+    retry_policy=None,
+    limiter=None,
+    backend=None,
+    rate_limiter=None,
+    on_cache_hit=None,
+):
+    """Synthesize chunks with up to `concurrency` sessions in flight and
+    yield (chunk, audio) pairs strictly in the order of `chunks`.
+
+    `chunks` may be a regular or an async iterable; each result is yielded
+    as soon as it and every chunk before it have been synthesized. A
+    `limiter` (e.g. an asyncio.Semaphore, or an AdaptiveConcurrency that
+    tunes itself to the service) shared between documents caps the total
+    number of sessions across all of them. `backend` is the speech engine,
+    edge-tts by default, and a `rate_limiter` (a RateLimiter) is consulted
+    before every request. `on_cache_hit` is called for each chunk whose
+    audio came from the cache.
+    """
+    slots = asyncio.Semaphore(concurrency)
+    in_flight = asyncio.Queue()
+
+    async def launch(chunk):
+        await slots.acquire()
+        task = asyncio.ensure_future(
+            synthesize_chunk(
+                chunk,
+                cache,
+                retry_policy,
+                backend,
+                limiter,
+                rate_limiter,
+                on_cache_hit,
+            )
+        )
+        await in_flight.put((chunk, task))
+
+    async def launch_all():
+        try:
+            if hasattr(chunks, "__aiter__"):
+                async for chunk in chunks:
+                    await launch(chunk)
+            else:
+                for chunk in chunks:
+                    await launch(chunk)
+        finally:
+            in_flight.put_nowait(None)
+
+    launcher = asyncio.ensure_future(launch_all())
+    try:
+        while (item := await in_flight.get()) is not None:
+            chunk, task = item
+            try:
+                audio = await task
+            finally:
+                slots.release()
+            yield chunk, audio
+
+        # Surface errors raised while reading the chunk source
+        await launcher
+    finally:
+        # Don't leave sessions running if the consumer stops early or a chunk fails
+        tasks = [launcher]
+        while not in_flight.empty():
+            item = in_flight.get_nowait()
+            if item is not None:
+                tasks.append(item[1])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def tts_connection_error(error):
+    """Return a friendlier exception for edge-tts authorization failures,
+    or None if the error is something else."""
+    error_msg = str(error)
+    if "401" in error_msg or "Unauthorized" in error_msg or "403" in error_msg:
+        return Exception(
+            "Edge TTS service connection failed.\n\n"
+            "Possible solutions:\n"
+            "1. Update edge-tts: Run 'pip3 install --upgrade edge-tts' in Terminal\n"
+            "2. Check your internet connection\n"
+            "3. Try again in a few minutes (temporary API issue)\n"
+            "4. Restart the app\n\n"
+            f"Technical details: {error_msg}"
+        )
+    return None
+
+
+async def text_to_speech_async(
+    text,
+    output_file,
+    progress_callback,
+    concurrency=MAX_CONCURRENT_SESSIONS,
+    cache=None,
+    retry_policy=None,
+    cancel_token=None,
+    output_buffer_size=OUTPUT_BUFFER_SIZE,
+    backend=None,
+    limiter=None,
+    rate_limiter=None,
+):
+    chunks = split_text_into_chunks(text)
+    progress = TextProgress(sum(len(chunk) for chunk in chunks))
+    retry_policy = retry_policy or RetryPolicy()
+    cancel_token = cancel_token or CancellationToken()
+
+    try:
+        total_bytes = 0
+
+        with cancel_token.cancel_current_task():
+            async with contextlib.aclosing(
+                synthesize_in_order(
+                    chunks,
+                    concurrency,
+                    cache,
+                    retry_policy,
+                    limiter,
+                    backend,
+                    rate_limiter,
+                )
+            ) as results:
+                with open(output_file, "wb") as f:
+                    writer = AudioWriter(f, output_buffer_size)
+                    try:
+                        async for chunk, audio in results:
+                            await writer.write(audio)
+                            total_bytes += len(audio)
+                            progress.advance(len(chunk))
+                            progress_callback(
+                                int(progress.percent), progress.message(total_bytes)
+                            )
+                    finally:
+                        await writer.close()
+
+        progress_callback(
+            100,
+            f"Complete! {progress.summary(total_bytes)}, {retry_policy.summary()}",
+        )
+    except Exception as e:
+        friendly_error = tts_connection_error(e)
+        if friendly_error:
+            raise friendly_error
+        else:
+            raise
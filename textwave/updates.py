@@ -0,0 +1,147 @@
+"""Checking for edge-tts and TextWave updates."""
+
+import asyncio
+import hashlib
+import importlib.metadata
+import json
+import time
+
+PYPI_URL = "https://pypi.org/pypi/edge-tts/json"
+GITHUB_RELEASE_URL = "https://api.github.com/repos/kc9wwh/TextWave/releases/latest"
+
+# Both lookups share one UPDATE_CHECK_TIMEOUT budget. Responses are reused
+# for UPDATE_CHECK_TTL seconds and then revalidated with a conditional request.
+UPDATE_CHECK_TIMEOUT = 5.0
+UPDATE_CHECK_TTL = 6 * 60 * 60
+
+NO_EDGE_TTS_UPDATE = (False, "", "")
+NO_APP_UPDATE = (False, "", "", "")
+
+
+class UpdateChecker:
+    """Look up the latest edge-tts and TextWave releases.
+
+    Both lookups run concurrently over one pooled HTTP session, and whatever
+    hasn't finished within `timeout` seconds counts as no update. `cache`,
+    if given, is an object with get(key) and set(key, value) for strings in
+    which responses are kept between launches.
+    """
+
+    def __init__(
+        self,
+        app_version,
+        cache=None,
+        pypi_url=PYPI_URL,
+        release_url=GITHUB_RELEASE_URL,
+        timeout=UPDATE_CHECK_TIMEOUT,
+        ttl=UPDATE_CHECK_TTL,
+    ):
+        self.app_version = app_version
+        self.cache = cache
+        self.pypi_url = pypi_url
+        self.release_url = release_url
+        self.timeout = timeout
+        self.ttl = ttl
+
+    async def check(self):
+        """Return (has_update, installed_version, latest_version) for
+        edge-tts and (has_update, current_version, latest_version,
+        download_url) for the app."""
+        import aiohttp
+
+        async with aiohttp.ClientSession() as session:
+            lookups = [
+                asyncio.ensure_future(self.check_edge_tts(session)),
+                asyncio.ensure_future(self.check_app(session)),
+            ]
+            try:
+                await asyncio.wait(lookups, timeout=self.timeout)
+            finally:
+                for lookup in lookups:
+                    lookup.cancel()
+                edge_tts_result, app_result = await asyncio.gather(
+                    *lookups, return_exceptions=True
+                )
+
+        # A failed lookup just means no update banner
+        if isinstance(edge_tts_result, BaseException):
+            edge_tts_result = NO_EDGE_TTS_UPDATE
+        if isinstance(app_result, BaseException):
+            app_result = NO_APP_UPDATE
+        return edge_tts_result, app_result
+
+    async def check_edge_tts(self, session):
+        try:
+            installed_version = importlib.metadata.version("edge-tts")
+        except importlib.metadata.PackageNotFoundError:
+            return NO_EDGE_TTS_UPDATE
+
+        data = await self.fetch_json(session, self.pypi_url)
+        latest_version = data["info"]["version"]
+        has_update = installed_version != latest_version
+        return (has_update, installed_version, latest_version)
+
+    async def check_app(self, session):
+        data = await self.fetch_json(session, self.release_url)
+        latest_version = data["tag_name"].lstrip("v")
+
+        # Find .dmg or .app.zip asset, or fall back to the release page
+        download_url = data["html_url"]
+        for asset in data.get("assets", []):
+            name = asset["name"].lower()
+            if name.endswith(".dmg") or name.endswith(".app.zip"):
+                download_url = asset["browser_download_url"]
+                break
+
+        # Compare versions (simple string comparison)
+        has_update = (
+            self.app_version != latest_version and latest_version > self.app_version
+        )
+        return (has_update, self.app_version, latest_version, download_url)
+
+    async def fetch_json(self, session, url):
+        """Fetch a JSON document, from the cache while it is fresh and with
+        If-None-Match/If-Modified-Since once it is stale."""
+        key = "http_cache/" + hashlib.sha256(url.encode()).hexdigest()[:16]
+        cached = None
+        if self.cache is not None:
+            try:
+                cached = json.loads(self.cache.get(key) or "null")
+            except ValueError:
+                pass
+
+        if cached and time.time() - cached["fetched"] < self.ttl:
+            return json.loads(cached["body"])
+
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and cached:
+                # Not modified: keep the cached body and validators
+                body = cached["body"]
+                etag = cached.get("etag")
+                last_modified = cached.get("last_modified")
+            else:
+                response.raise_for_status()
+                body = await response.text()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+
+        data = json.loads(body)
+        if self.cache is not None:
+            self.cache.set(
+                key,
+                json.dumps(
+                    {
+                        "fetched": time.time(),
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "body": body,
+                    }
+                ),
+            )
+        return data